@@ -16,6 +16,7 @@ from app.models import (  # noqa: F401
     CrawledProduct,
     CrawlPreset,
     CrawlSchedule,
+    ImageUploadCacheEntry,
     Job,
     NaverCredential,
     PriceAlert,
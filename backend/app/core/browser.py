@@ -0,0 +1,79 @@
+"""Celery 워커 프로세스 공용 이벤트 루프, 브라우저 풀, 크롤러 타입 캐시."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.core.config import get_app_settings
+from richlychee.crawler.auto import CrawlerTypeCache
+from richlychee.crawler.browser_pool import BrowserPool
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("app.browser")
+
+# 브라우저는 이벤트 루프에 묶이므로 루프도 작업마다 새로 만들지 않고 프로세스에서 공유한다
+_worker_loop: asyncio.AbstractEventLoop | None = None
+_browser_pool: BrowserPool | None = None
+_crawler_type_cache: CrawlerTypeCache | None = None
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """워커 프로세스 공용 이벤트 루프 (동기 태스크에서 run_until_complete로 사용)."""
+    global _worker_loop
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    return _worker_loop
+
+
+def get_browser_pool() -> BrowserPool:
+    """워커 프로세스 공용 브라우저 풀 (브라우저는 처음 빌릴 때 실행)."""
+    global _browser_pool
+    if _browser_pool is None:
+        settings = get_app_settings()
+        _browser_pool = BrowserPool(
+            max_pages=settings.crawl_browser_max_pages,
+            max_uses=settings.crawl_browser_max_uses,
+        )
+    return _browser_pool
+
+
+def get_crawler_type_cache() -> CrawlerTypeCache:
+    """도메인별 크롤러 타입 캐시 (Redis로 워커 간 공유, 연결 실패 시 프로세스 내 캐시)."""
+    global _crawler_type_cache
+    if _crawler_type_cache is None:
+        from richlychee.utils.redis_client import get_redis_client
+
+        settings = get_app_settings()
+        try:
+            redis_client = get_redis_client(settings.redis_url)
+            redis_client.ping()
+        except Exception as e:
+            logger.warning("Redis 연결 실패 — 프로세스 내 크롤러 타입 캐시 사용: %s", e)
+            redis_client = None
+        _crawler_type_cache = CrawlerTypeCache(
+            redis_client, ttl_seconds=settings.crawl_type_memory_days * 86400
+        )
+    return _crawler_type_cache
+
+
+def init_browser_pool() -> None:
+    """fork된 워커 프로세스에서 호출. 부모에게서 물려받은 루프/풀은 닫지 않고 버린다.
+
+    Playwright 드라이버는 부모의 자식 프로세스이므로 자식이 정리하면 안 된다.
+    """
+    global _worker_loop, _browser_pool, _crawler_type_cache
+    _worker_loop = None
+    _browser_pool = None
+    _crawler_type_cache = None
+
+
+def dispose_browser_pool() -> None:
+    """워커 종료 시 브라우저와 이벤트 루프 정리."""
+    global _worker_loop, _browser_pool
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        if _browser_pool is not None:
+            _worker_loop.run_until_complete(_browser_pool.close())
+        _worker_loop.close()
+    _worker_loop = None
+    _browser_pool = None
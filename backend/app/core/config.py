@@ -26,14 +26,39 @@ class AppSettings(BaseSettings):
     # AES-256 encryption for Naver API secrets
     encryption_key: str = "change-me-32-byte-key-for-aes256"
 
+    # Celery 워커 프로세스당 동기 DB 커넥션 풀 (prefork 자식은 한 번에 태스크 1개)
+    worker_db_pool_size: int = 2
+    worker_db_max_overflow: int = 3
+
     # Redis / Celery
     redis_url: str = "redis://localhost:6379/0"
     celery_broker_url: str = "redis://localhost:6379/1"
     celery_result_backend: str = "redis://localhost:6379/2"
 
+    # 자격증명별 네이버 클라이언트 캐시
+    naver_client_cache_size: int = 128
+    naver_client_idle_seconds: int = 600
+
+    # 이미지 업로드 캐시 보관 기간 (일)
+    image_cache_ttl_days: int = 30
+
+    # 등록 작업 결과 기록 주기 (초, registration.batch_size행마다도 기록)와 취소 확인 주기 (초)
+    job_commit_interval: float = 2.0
+    job_cancel_check_interval: float = 2.0
+    # 크롤링 결과를 crawled_products에 한 번에 INSERT하는 행 수
+    crawl_insert_batch_size: int = 500
+    # 동적 크롤링용 Chromium (워커 프로세스당 1개): 동시 컨텍스트 수, 재실행 전까지 사용 횟수
+    crawl_browser_max_pages: int = 4
+    crawl_browser_max_uses: int = 50
+    # auto 크롤러가 도메인별로 정적/동적 판단을 기억하는 기간 (일)
+    crawl_type_memory_days: int = 7
+
     # File upload
     upload_dir: str = "uploads"
     max_upload_size_mb: int = 50
+    # 업로드 파일 파싱 캐시 (원본 해시별 Parquet, 작업 재실행/재검증 시 재사용)
+    parsed_cache_dir: str = "uploads/.parsed"
+    parsed_cache_ttl_days: int = 7
 
     # CORS
     cors_origins: list[str] = ["http://localhost:3000"]
@@ -1,11 +1,12 @@
-"""SQLAlchemy 비동기 세션 설정."""
+"""SQLAlchemy 세션 설정 (FastAPI용 비동기 + Celery 워커용 동기)."""
 
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import get_app_settings
 
@@ -48,3 +49,53 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
     finally:
         await session.close()
+
+
+# Celery 워커 프로세스 공용 동기 엔진 (태스크마다 커넥션 풀을 새로 만들지 않도록)
+_sync_engine: Engine | None = None
+_sync_session_factory: sessionmaker[Session] | None = None
+
+
+def get_sync_engine() -> Engine:
+    """워커 프로세스 공용 동기 엔진 (asyncpg URL을 psycopg2로 바꿔 사용)."""
+    global _sync_engine
+    if _sync_engine is None:
+        settings = get_app_settings()
+        _sync_engine = create_engine(
+            settings.database_url.replace("+asyncpg", "+psycopg2"),
+            pool_size=settings.worker_db_pool_size,
+            max_overflow=settings.worker_db_max_overflow,
+            pool_pre_ping=True,
+        )
+    return _sync_engine
+
+
+def sync_session() -> Session:
+    """워커 프로세스 공용 커넥션 풀에서 동기 세션 생성."""
+    global _sync_session_factory
+    if _sync_session_factory is None:
+        _sync_session_factory = sessionmaker(get_sync_engine())
+    return _sync_session_factory()
+
+
+def init_sync_engine() -> None:
+    """fork된 워커 프로세스에서 호출. 부모에게서 물려받은 풀은 닫지 않고 버린다.
+
+    부모와 공유하는 소켓을 자식이 닫거나 재사용하면 부모의 커넥션이 깨지므로
+    dispose(close=False)로 참조만 끊고 자식 전용 풀을 새로 만든다.
+    """
+    global _sync_engine, _sync_session_factory
+    if _sync_engine is not None:
+        _sync_engine.dispose(close=False)
+    _sync_engine = None
+    _sync_session_factory = None
+    get_sync_engine()
+
+
+def dispose_sync_engine() -> None:
+    """워커 종료 시 공용 풀의 커넥션 정리."""
+    global _sync_engine, _sync_session_factory
+    if _sync_engine is not None:
+        _sync_engine.dispose()
+    _sync_engine = None
+    _sync_session_factory = None
@@ -30,6 +30,10 @@ async def lifespan(app: FastAPI):
     # startup
     yield
     # shutdown
+    from app.services.naver_service import close_http_client, get_service_registry
+    get_service_registry().clear()
+    await close_http_client()
+
     from app.core.database import get_engine
     engine = get_engine()
     if engine:
@@ -10,6 +10,7 @@ from app.models.price_history import PriceHistory, PriceAlert
 from app.models.subscription_plan import SubscriptionPlan
 from app.models.user_subscription import UserSubscription
 from app.models.payment import Payment
+from app.models.image_upload_cache import ImageUploadCacheEntry
 
 __all__ = [
     "User",
@@ -25,4 +26,5 @@ __all__ = [
     "SubscriptionPlan",
     "UserSubscription",
     "Payment",
+    "ImageUploadCacheEntry",
 ]
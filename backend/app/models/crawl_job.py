@@ -34,7 +34,8 @@ class CrawlJob(Base):
         Enum(CrawlJobStatus), default=CrawlJobStatus.PENDING
     )
     target_url: Mapped[str] = mapped_column(String(1000))
-    target_type: Mapped[str] = mapped_column(String(20), default="static")  # 'static' | 'dynamic'
+    # 'static' | 'dynamic' | 'auto'
+    target_type: Mapped[str] = mapped_column(String(20), default="static")
     crawl_config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     # 진행 상황
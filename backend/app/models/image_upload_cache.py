@@ -0,0 +1,33 @@
+"""이미지 업로드 캐시 모델."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ImageUploadCacheEntry(Base):
+    """자격증명별로 업로드한 이미지 (내용 SHA-256 → 네이버 CDN URL)."""
+
+    __tablename__ = "image_upload_cache"
+    __table_args__ = (
+        UniqueConstraint("credential_id", "sha256", name="uq_image_upload_cache_credential_sha256"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    credential_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("naver_credentials.id", ondelete="CASCADE"), index=True
+    )
+    sha256: Mapped[str] = mapped_column(String(64))
+    url: Mapped[str] = mapped_column(String(1000))
+    uploaded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
@@ -7,11 +7,10 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decrypt_secret
 from app.dependencies import get_current_user
 from app.models.naver_credential import NaverCredential
 from app.models.user import User
-from app.services.naver_service import NaverService
+from app.services.naver_service import get_naver_service
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -36,7 +35,6 @@ async def search_categories(
     if not cred:
         raise HTTPException(status_code=404, detail="자격증명을 찾을 수 없습니다.")
 
-    secret = decrypt_secret(cred.naver_client_secret)
-    service = NaverService(cred.naver_client_id, secret)
+    service = get_naver_service(cred)
     results = await service.search_categories(keyword)
     return results
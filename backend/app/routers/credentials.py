@@ -10,7 +10,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import decrypt_secret, encrypt_secret
+from app.core.security import encrypt_secret
 from app.dependencies import get_current_user
 from app.models.naver_credential import NaverCredential
 from app.models.user import User
@@ -20,7 +20,7 @@ from app.schemas.credential import (
     CredentialUpdate,
     CredentialVerifyResponse,
 )
-from app.services.naver_service import NaverService
+from app.services.naver_service import get_naver_service, invalidate_naver_service
 
 router = APIRouter(prefix="/credentials", tags=["credentials"])
 
@@ -73,6 +73,7 @@ async def update_credential(
         cred.naver_client_secret = encrypt_secret(body.naver_client_secret)
         cred.is_verified = False
     await db.commit()
+    invalidate_naver_service(credential_id)
     await db.refresh(cred)
     return cred
 
@@ -87,6 +88,7 @@ async def delete_credential(
     cred = await _get_user_credential(credential_id, user.id, db)
     await db.delete(cred)
     await db.commit()
+    invalidate_naver_service(credential_id)
 
 
 @router.post("/{credential_id}/verify", response_model=CredentialVerifyResponse)
@@ -97,9 +99,7 @@ async def verify_credential(
 ):
     """자격증명 인증 테스트."""
     cred = await _get_user_credential(credential_id, user.id, db)
-    secret = decrypt_secret(cred.naver_client_secret)
-
-    service = NaverService(cred.naver_client_id, secret)
+    service = get_naver_service(cred)
     try:
         ok = await service.test_connection()
     except Exception as e:
@@ -12,7 +12,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_app_settings
 from app.core.database import get_db
-from app.core.security import decrypt_secret
 from app.dependencies import get_current_user
 from app.models.job import Job, JobStatus
 from app.models.naver_credential import NaverCredential
@@ -24,7 +23,7 @@ from app.schemas.job import (
     ProductResultListResponse,
     ProductResultResponse,
 )
-from app.services.naver_service import NaverService
+from app.services.naver_service import get_naver_service
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -95,8 +94,7 @@ async def create_job(
         shutil.copyfileobj(file.file, f)
 
     # 검증
-    secret = decrypt_secret(cred.naver_client_secret)
-    service = NaverService(cred.naver_client_id, secret)
+    service = get_naver_service(cred)
     validation = await service.validate_file(str(stored_path))
 
     job = Job(
@@ -54,9 +54,9 @@ async def quick_crawl(
     detected_config = await CrawlPresetService.auto_detect_config(body.url)
 
     if not detected_config:
-        # 감지 실패 시 기본 정적 크롤러 사용
+        # 감지 실패 시 정적 크롤링을 먼저 시도하고 필요하면 브라우저로 전환
         detected_config = {
-            "crawler_type": "static",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": ".product, .item, [class*='product']",
                 "title_selector": "h1, h2, h3, .title, [class*='title']",
@@ -14,7 +14,7 @@ class CrawlJobCreate(BaseModel):
     """크롤링 작업 생성 요청."""
 
     target_url: str = Field(..., description="크롤링 대상 URL")
-    target_type: str = Field(default="static", description="크롤러 타입 (static/dynamic)")
+    target_type: str = Field(default="static", description="크롤러 타입 (static/dynamic/auto)")
     crawl_config: dict | None = Field(
         default=None,
         description="크롤링 설정 (셀렉터, 페이지네이션 등)",
@@ -24,6 +24,7 @@ class CrawlJobCreate(BaseModel):
                 "title_selector": ".title",
                 "price_selector": ".price",
                 "image_selector": "img",
+                "pagination": {"page_param": "page", "max_pages": 5},
             }
         ],
     )
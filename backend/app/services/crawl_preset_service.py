@@ -20,13 +20,14 @@ class CrawlPresetService:
             "name": "쿠팡",
             "site_url": "https://www.coupang.com",
             "url_pattern": r"coupang\.com",
-            "crawler_type": "dynamic",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": ".search-product",
                 "title_selector": ".name",
                 "price_selector": ".price-value",
                 "image_selector": "img.search-product-wrap-img",
                 "link_selector": "a.search-product-link",
+                "wait_until": "domcontentloaded",
             },
             "description": "쿠팡 상품 페이지 크롤링",
         },
@@ -34,13 +35,14 @@ class CrawlPresetService:
             "name": "11번가",
             "site_url": "https://www.11st.co.kr",
             "url_pattern": r"11st\.co\.kr",
-            "crawler_type": "static",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": ".c_card",
                 "title_selector": ".c_card__name",
                 "price_selector": ".c_card__price",
                 "image_selector": "img",
                 "link_selector": "a",
+                "pagination": {"page_param": "pageNo", "max_pages": 5},
             },
             "description": "11번가 상품 페이지 크롤링",
         },
@@ -48,13 +50,14 @@ class CrawlPresetService:
             "name": "Amazon US",
             "site_url": "https://www.amazon.com",
             "url_pattern": r"amazon\.com",
-            "crawler_type": "dynamic",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": "[data-component-type='s-search-result']",
                 "title_selector": "h2 a span",
                 "price_selector": ".a-price-whole",
                 "image_selector": ".s-image",
                 "link_selector": "h2 a",
+                "wait_until": "domcontentloaded",
             },
             "description": "Amazon US 상품 검색 결과 크롤링",
         },
@@ -62,13 +65,14 @@ class CrawlPresetService:
             "name": "eBay",
             "site_url": "https://www.ebay.com",
             "url_pattern": r"ebay\.com",
-            "crawler_type": "static",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": ".s-item",
                 "title_selector": ".s-item__title",
                 "price_selector": ".s-item__price",
                 "image_selector": ".s-item__image-img",
                 "link_selector": ".s-item__link",
+                "pagination": {"page_param": "_pgn", "max_pages": 5},
             },
             "description": "eBay 상품 검색 결과 크롤링",
         },
@@ -76,13 +80,14 @@ class CrawlPresetService:
             "name": "AliExpress",
             "site_url": "https://www.aliexpress.com",
             "url_pattern": r"aliexpress\.com",
-            "crawler_type": "dynamic",
+            "crawler_type": "auto",
             "crawl_config": {
                 "item_selector": "[data-item-id]",
                 "title_selector": ".multi--titleText--nXeOvyr",
                 "price_selector": ".multi--price-sale--U-S0jtj",
                 "image_selector": "img",
                 "link_selector": "a",
+                "wait_until": "domcontentloaded",
             },
             "description": "AliExpress 상품 검색 결과 크롤링",
         },
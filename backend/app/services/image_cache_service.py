@@ -0,0 +1,83 @@
+"""DB 기반 이미지 업로드 캐시 (Celery 등록 작업용)."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.image_upload_cache import ImageUploadCacheEntry
+from richlychee.api.image_cache import ImageUploadCache
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("app.image_cache")
+
+
+class DbImageUploadCache(ImageUploadCache):
+    """image_upload_cache 테이블을 사용하는 ImageUploadCache.
+
+    캐시 범위는 자격증명(스토어) 단위이며, 호출한 스레드의 동기 세션으로 즉시 커밋한다.
+
+    Args:
+        db: 동기 SQLAlchemy 세션.
+        credential_id: 자격증명 ID.
+        ttl_days: 이 기간이 지난 항목은 다시 업로드.
+    """
+
+    def __init__(self, db: Session, credential_id: uuid.UUID, ttl_days: int = 30) -> None:
+        self._db = db
+        self._credential_id = credential_id
+        self._ttl = timedelta(days=ttl_days)
+
+    def get_many(self, digests: Iterable[str]) -> dict[str, str]:
+        keys = list(digests)
+        if not keys:
+            return {}
+        rows = self._db.execute(
+            select(ImageUploadCacheEntry.sha256, ImageUploadCacheEntry.url).where(
+                ImageUploadCacheEntry.credential_id == self._credential_id,
+                ImageUploadCacheEntry.sha256.in_(keys),
+                ImageUploadCacheEntry.uploaded_at >= datetime.now(UTC) - self._ttl,
+            )
+        ).all()
+        return {sha256: url for sha256, url in rows}
+
+    def put_many(self, urls: dict[str, str]) -> None:
+        if not urls:
+            return
+        # 만료 항목이 남아 있을 수 있으므로 지우고 새로 기록한다. 같은 자격증명의 다른
+        # 작업이 같은 이미지를 동시에 기록하면 유니크 제약에 걸리므로, 세이브포인트만
+        # 되돌리고 넘어간다 (캐시 기록은 최선 노력).
+        try:
+            with self._db.begin_nested():
+                self._db.execute(
+                    delete(ImageUploadCacheEntry).where(
+                        ImageUploadCacheEntry.credential_id == self._credential_id,
+                        ImageUploadCacheEntry.sha256.in_(list(urls)),
+                    )
+                )
+                self._db.add_all(
+                    ImageUploadCacheEntry(
+                        credential_id=self._credential_id, sha256=digest, url=url
+                    )
+                    for digest, url in urls.items()
+                )
+        except IntegrityError as e:
+            logger.warning("이미지 캐시 저장 충돌 — 건너뜀: %s", e.orig)
+        self._db.commit()
+
+    def discard_urls(self, urls: Iterable[str]) -> None:
+        targets = list(urls)
+        if not targets:
+            return
+        self._db.execute(
+            delete(ImageUploadCacheEntry).where(
+                ImageUploadCacheEntry.credential_id == self._credential_id,
+                ImageUploadCacheEntry.url.in_(targets),
+            )
+        )
+        self._db.commit()
@@ -3,27 +3,93 @@
 from __future__ import annotations
 
 import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from richlychee.api.categories import get_categories, search_category
+import httpx
+
+from richlychee.api.async_client import AsyncNaverCommerceClient, create_http_client
+from richlychee.api.categories import search_category_async
 from richlychee.api.client import NaverCommerceClient
-from richlychee.api.images import upload_image, upload_images_batch
-from richlychee.api.products import register_product, search_products
+from richlychee.api.images import upload_image_async, upload_images_batch_async
+from richlychee.api.products import register_product_async, search_products_async
 from richlychee.auth.session import AuthSession
-from richlychee.config import Settings
+from richlychee.config import ReaderSettings, Settings
+from richlychee.data.parsed_cache import ParsedFileCache
 from richlychee.data.reader import read_file
-from richlychee.data.transformer import (
-    collect_local_images,
-    product_row_to_payload,
-    row_to_product_row,
-    transform_dataframe,
-)
-from richlychee.data.validator import validate_dataframe
+from richlychee.data.validator import ValidationResult, validate_chunks
+from richlychee.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from app.models.naver_credential import NaverCredential
+
+logger = get_logger("app.naver_service")
+
+# 프로세스 전체에서 공유하는 httpx 커넥션 풀 (lifespan 종료 시 닫힘)
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """공유 httpx.AsyncClient 반환 (최초 호출 시 생성)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = create_http_client(Settings())
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """공유 httpx.AsyncClient 종료."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _validate_file(
+    file_path: str,
+    reader: ReaderSettings,
+    cache_dir: str,
+    cache_ttl_days: int,
+) -> tuple[int, ValidationResult]:
+    """파일을 청크 단위로 읽으며 검증 (API 프로세스가 파일 전체를 올리지 않도록).
+
+    파싱 결과와 검증 결과는 원본 해시별로 캐시되어, 같은 파일을 다시 검증하거나
+    Celery 워커가 등록할 때 원본을 다시 파싱하지 않는다.
+    """
+    parsed = ParsedFileCache(cache_dir, cache_ttl_days).open(file_path)
+    cached = parsed.load_validation()
+    if cached is not None:
+        return cached
+
+    total_rows = 0
+
+    def _count(chunks):
+        nonlocal total_rows
+        for chunk in chunks:
+            total_rows += len(chunk)
+            yield chunk
+
+    chunks = parsed.iter_chunks(
+        reader.chunk_size,
+        excel_engine=reader.excel_engine,
+        csv_engine=reader.csv_engine,
+    )
+    result = validate_chunks(_count(chunks))
+    parsed.save_validation(total_rows, result)
+    return total_rows, result
 
 
 class NaverService:
-    """네이버 커머스 API 래핑 서비스 (동기 → 비동기)."""
+    """네이버 커머스 API 래핑 서비스.
+
+    API 호출은 공유 커넥션 풀 위의 비동기 클라이언트로 직접 수행하고,
+    파일 파싱처럼 CPU 위주인 작업만 스레드 풀에서 실행한다.
+    """
 
     def __init__(self, client_id: str, client_secret: str):
         self._settings = Settings(
@@ -32,6 +98,12 @@ class NaverService:
         )
         self._auth = AuthSession(self._settings)
         self._client = NaverCommerceClient(self._settings, self._auth)
+        self._async_client = AsyncNaverCommerceClient(
+            self._settings,
+            self._auth,
+            http_client=get_http_client(),
+            rate_limiter=self._client.rate_limiter,
+        )
 
     async def test_connection(self) -> bool:
         """인증 테스트."""
@@ -40,11 +112,19 @@ class NaverService:
 
     async def validate_file(self, file_path: str | Path) -> dict[str, Any]:
         """파일 읽기 + 유효성 검증."""
+        from app.core.config import get_app_settings
+
         loop = asyncio.get_event_loop()
-        df = await loop.run_in_executor(None, read_file, str(file_path))
-        result = await loop.run_in_executor(None, validate_dataframe, df)
+        total_rows, result = await loop.run_in_executor(
+            None,
+            _validate_file,
+            str(file_path),
+            self._settings.reader,
+            get_app_settings().parsed_cache_dir,
+            get_app_settings().parsed_cache_ttl_days,
+        )
         return {
-            "total_rows": len(df),
+            "total_rows": total_rows,
             "is_valid": result.is_valid,
             "errors": [
                 {"row": e.row, "field": e.field, "message": e.message}
@@ -59,28 +139,28 @@ class NaverService:
     async def read_file(self, file_path: str | Path):
         """파일 읽기."""
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, read_file, str(file_path))
-
-    async def upload_images(self, image_paths: list[str]) -> dict[str, str]:
-        """이미지 일괄 업로드."""
-        loop = asyncio.get_event_loop()
+        reader = self._settings.reader
         return await loop.run_in_executor(
-            None, upload_images_batch, self._client, image_paths
+            None,
+            partial(
+                read_file,
+                str(file_path),
+                excel_engine=reader.excel_engine,
+                csv_engine=reader.csv_engine,
+            ),
         )
 
+    async def upload_images(self, image_paths: list[str]) -> dict[str, str]:
+        """이미지 일괄 업로드 (멀티파일 묶음 요청, 레이트 리밋은 공유 버킷이 제어)."""
+        return await upload_images_batch_async(self._async_client, image_paths)
+
     async def upload_image(self, image_path: str) -> str:
         """단일 이미지 업로드."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, upload_image, self._client, image_path
-        )
+        return await upload_image_async(self._async_client, image_path)
 
     async def register_product(self, payload) -> dict[str, Any]:
         """단일 상품 등록."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, register_product, self._client, payload
-        )
+        return await register_product_async(self._async_client, payload)
 
     async def search_products(
         self,
@@ -90,23 +170,17 @@ class NaverService:
         size: int = 50,
     ) -> dict[str, Any]:
         """상품 검색."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            search_products,
-            self._client,
-            product_name,
-            seller_managed_code,
-            page,
-            size,
+        return await search_products_async(
+            self._async_client,
+            product_name=product_name,
+            seller_managed_code=seller_managed_code,
+            page=page,
+            size=size,
         )
 
     async def search_categories(self, keyword: str) -> list[dict[str, Any]]:
         """카테고리 검색."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, search_category, self._client, keyword
-        )
+        return await search_category_async(self._async_client, keyword)
 
     def get_sync_client(self) -> NaverCommerceClient:
         """동기 클라이언트 반환 (Celery 워커용)."""
@@ -115,3 +189,120 @@ class NaverService:
     def get_sync_settings(self) -> Settings:
         """동기 설정 반환."""
         return self._settings
+
+    def invalidate_token(self) -> None:
+        """캐시된 액세스 토큰 폐기."""
+        self._auth.invalidate()
+
+    def close(self) -> None:
+        """동기 세션 커넥션 정리 (비동기 클라이언트는 공유 풀을 사용하므로 유지)."""
+        self._client.close()
+
+
+@dataclass
+class _CachedService:
+    service: NaverService
+    fingerprint: tuple[str, str]
+    last_used: float
+
+
+class NaverServiceRegistry:
+    """자격증명 ID별 NaverService 캐시 (LRU + 유휴 만료).
+
+    요청마다 시크릿 복호화, Settings 로드, 세션 생성을 반복하지 않고
+    keep-alive 커넥션과 토큰이 살아있는 서비스를 재사용한다. 캐시 키는
+    자격증명 ID이며, client_id 또는 암호화된 시크릿이 바뀌면 자동으로 새로 만든다.
+    이벤트 루프 스레드에서만 호출되므로 별도 락을 두지 않는다.
+
+    Args:
+        max_size: 최대 보관 서비스 수. 넘으면 가장 오래 쓰지 않은 것부터 제거.
+        idle_seconds: 이 시간(초) 동안 사용되지 않은 서비스는 제거.
+    """
+
+    def __init__(self, max_size: int = 128, idle_seconds: float = 600) -> None:
+        self._max_size = max_size
+        self._idle_seconds = idle_seconds
+        self._entries: OrderedDict[uuid.UUID, _CachedService] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, credential: NaverCredential) -> NaverService:
+        """자격증명에 해당하는 서비스 반환 (없거나 변경되었으면 생성)."""
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        fingerprint = (credential.naver_client_id, credential.naver_client_secret)
+        entry = self._entries.get(credential.id)
+        if entry is not None and entry.fingerprint == fingerprint:
+            entry.last_used = now
+            self._entries.move_to_end(credential.id)
+            return entry.service
+
+        if entry is not None:
+            self._discard(credential.id)
+
+        from app.core.security import decrypt_secret
+
+        service = NaverService(
+            credential.naver_client_id,
+            decrypt_secret(credential.naver_client_secret),
+        )
+        self._entries[credential.id] = _CachedService(service, fingerprint, now)
+        while len(self._entries) > self._max_size:
+            self._discard(next(iter(self._entries)))
+        return service
+
+    def invalidate(self, credential_id: uuid.UUID) -> None:
+        """자격증명 수정/삭제 시 캐시된 서비스와 토큰 제거."""
+        entry = self._discard(credential_id)
+        if entry is not None:
+            entry.service.invalidate_token()
+
+    def clear(self) -> None:
+        """전체 캐시 제거."""
+        for credential_id in list(self._entries):
+            self._discard(credential_id)
+
+    def _evict_idle(self, now: float) -> None:
+        expired = [
+            credential_id
+            for credential_id, entry in self._entries.items()
+            if now - entry.last_used > self._idle_seconds
+        ]
+        for credential_id in expired:
+            self._discard(credential_id)
+
+    def _discard(self, credential_id: uuid.UUID) -> _CachedService | None:
+        entry = self._entries.pop(credential_id, None)
+        if entry is not None:
+            entry.service.close()
+        return entry
+
+
+_registry: NaverServiceRegistry | None = None
+
+
+def get_service_registry() -> NaverServiceRegistry:
+    """프로세스 공용 NaverServiceRegistry 반환."""
+    global _registry
+    if _registry is None:
+        from app.core.config import get_app_settings
+
+        settings = get_app_settings()
+        _registry = NaverServiceRegistry(
+            max_size=settings.naver_client_cache_size,
+            idle_seconds=settings.naver_client_idle_seconds,
+        )
+    return _registry
+
+
+def get_naver_service(credential: NaverCredential) -> NaverService:
+    """자격증명으로 캐시된 NaverService 반환."""
+    return get_service_registry().get(credential)
+
+
+def invalidate_naver_service(credential_id: uuid.UUID) -> None:
+    """자격증명에 캐시된 NaverService 제거."""
+    if _registry is not None:
+        _registry.invalidate(credential_id)
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
+from app.core.browser import dispose_browser_pool, init_browser_pool
 from app.core.config import get_app_settings
+from app.core.database import dispose_sync_engine, init_sync_engine
 
 settings = get_app_settings()
 
@@ -26,3 +29,17 @@ celery_app.conf.update(
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])
+
+
+@worker_process_init.connect
+def _init_worker_resources(**kwargs) -> None:
+    """prefork 자식 프로세스마다 전용 DB 커넥션 풀과 브라우저 풀 준비."""
+    init_sync_engine()
+    init_browser_pool()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _dispose_worker_resources(**kwargs) -> None:
+    dispose_browser_pool()
+    dispose_sync_engine()
@@ -2,25 +2,102 @@
 
 from __future__ import annotations
 
-import asyncio
 import uuid
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
+from typing import Any
 
 from celery import shared_task
-from sqlalchemy import create_engine, select
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.browser import get_browser_pool, get_crawler_type_cache, get_worker_loop
 from app.core.config import get_app_settings
+from app.core.database import sync_session
 from app.models.crawl_job import CrawlJob, CrawlJobStatus
 from app.models.crawled_product import CrawledProduct
+from app.tasks.progress import Checkpoint
+from richlychee.utils.logging import get_logger
 
+logger = get_logger("app.crawling")
 
-def _get_sync_engine():
-    """동기 SQLAlchemy 엔진 (Celery 워커용)."""
-    settings = get_app_settings()
-    # asyncpg → psycopg2 변환
-    url = settings.database_url.replace("+asyncpg", "+psycopg2")
-    return create_engine(url)
+
+async def _with_krw_prices(
+    products: AsyncGenerator[dict[str, Any], None],
+) -> AsyncGenerator[dict[str, Any], None]:
+    """크롤링 결과에 원화 가격(krw_price)과 환율(exchange_rate)을 붙인다 (외화만 환율 조회)."""
+    from richlychee.utils.exchange_rate import convert_price, get_exchange_rate
+
+    try:
+        async for data in products:
+            currency = data.get("currency", "KRW")
+            original_price = data.get("price", 0)
+
+            if currency != "KRW" and original_price > 0:
+                data["krw_price"] = await convert_price(original_price, currency, "KRW")
+                data["exchange_rate"] = await get_exchange_rate(currency, "KRW")
+            else:
+                data["krw_price"] = original_price
+                data["exchange_rate"] = 1.0
+            yield data
+    finally:
+        await products.aclose()
+
+
+def _crawled_product_row(
+    crawl_job_id: uuid.UUID,
+    user_id: uuid.UUID,
+    data: dict[str, Any],
+    now: datetime,
+) -> dict[str, Any]:
+    """크롤링 결과 1건 → crawled_products INSERT 값."""
+    return {
+        "id": uuid.uuid4(),
+        "crawl_job_id": crawl_job_id,
+        "user_id": user_id,
+        # 원본 데이터
+        "original_title": data.get("title", ""),
+        "original_price": data.get("price", 0),
+        "original_currency": data.get("currency", "KRW"),
+        "original_images": data.get("images", []),
+        "original_url": data.get("url", ""),
+        "original_data": data,
+        # 가공된 데이터 (환율 변환 적용)
+        "product_name": data.get("title", ""),
+        "sale_price": data.get("krw_price", 0),
+        "exchange_rate": data.get("exchange_rate", 1.0),
+        "stock_quantity": 0,
+        "is_registered": False,
+        "crawled_at": now,
+        "updated_at": now,
+    }
+
+
+def _insert_products(db: Session, rows: list[dict[str, Any]]) -> int:
+    """crawled_products에 한 번의 다중 행 INSERT로 저장하고 실패한 행 수를 반환.
+
+    배치 INSERT가 실패하면(제약 조건 위반 등) 그 배치만 행 단위로 다시 저장해
+    문제가 있는 행만 건너뛴다. 현재 트랜잭션은 commit하지 않는다.
+    """
+    if not rows:
+        return 0
+    try:
+        with db.begin_nested():
+            db.execute(insert(CrawledProduct), rows)
+        return 0
+    except SQLAlchemyError as e:
+        logger.warning("상품 일괄 저장 실패 — 행 단위로 재시도: %s", e)
+
+    failures = 0
+    for row in rows:
+        try:
+            with db.begin_nested():
+                db.execute(insert(CrawledProduct), [row])
+        except SQLAlchemyError as e:
+            failures += 1
+            logger.warning("상품 저장 실패 (%s): %s", row["original_url"], e)
+    return failures
 
 
 @shared_task(bind=True, name="crawling.run")
@@ -33,9 +110,7 @@ def run_crawl_job(self, crawl_job_id: str):
     3. 크롤링된 데이터를 CrawledProduct 테이블에 저장
     4. 완료 시 상태 COMPLETED/FAILED로 변경
     """
-    engine = _get_sync_engine()
-
-    with Session(engine) as db:
+    with sync_session() as db:
         job = db.execute(
             select(CrawlJob).where(CrawlJob.id == uuid.UUID(crawl_job_id))
         ).scalar_one_or_none()
@@ -50,48 +125,89 @@ def run_crawl_job(self, crawl_job_id: str):
 
         try:
             # 크롤러 모듈 임포트
-            from richlychee.crawler import StaticCrawler, DynamicCrawler
-            from richlychee.crawler.extractor import detect_currency
+            from richlychee.crawler import AutoCrawler, StaticCrawler, DynamicCrawler
 
             # 크롤러 생성
             if job.target_type == "static":
                 crawler = StaticCrawler(job.target_url, job.crawl_config)
             elif job.target_type == "dynamic":
-                crawler = DynamicCrawler(job.target_url, job.crawl_config)
+                crawler = DynamicCrawler(
+                    job.target_url, job.crawl_config, browser_pool=get_browser_pool()
+                )
+            elif job.target_type == "auto":
+                # 브라우저는 정적 크롤링으로 상품을 얻지 못할 때만 실행된다
+                crawler = AutoCrawler(
+                    job.target_url,
+                    job.crawl_config,
+                    browser_pool=get_browser_pool(),
+                    type_cache=get_crawler_type_cache(),
+                )
             else:
                 raise ValueError(f"지원하지 않는 크롤러 타입: {job.target_type}")
 
-            # 크롤링 실행 (비동기 → 동기 변환)
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                products_data = loop.run_until_complete(crawler.crawl())
-
-                # 환율 변환 (외화인 경우)
-                from richlychee.utils.exchange_rate import convert_price, get_exchange_rate
-
-                for data in products_data:
-                    currency = data.get("currency", "KRW")
-                    original_price = data.get("price", 0)
-
-                    if currency != "KRW" and original_price > 0:
-                        # 환율 조회 및 가격 변환
-                        krw_price = loop.run_until_complete(
-                            convert_price(original_price, currency, "KRW")
-                        )
-                        exchange_rate = loop.run_until_complete(
-                            get_exchange_rate(currency, "KRW")
-                        )
-                        data["krw_price"] = krw_price
-                        data["exchange_rate"] = exchange_rate
-                    else:
-                        data["krw_price"] = original_price
-                        data["exchange_rate"] = 1.0
+            # 크롤링 실행: 결과를 받는 대로 batch 단위(또는 일정 시간마다)로 저장
+            app_settings = get_app_settings()
+            job_pk = job.id
+            user_id = job.user_id
+            checkpoint = Checkpoint(
+                app_settings.crawl_insert_batch_size, app_settings.job_commit_interval
+            )
+            pending: list[dict[str, Any]] = []
+
+            def _store_pending() -> bool:
+                """쌓인 결과를 저장하고 진행 상황 보고. 작업이 취소되었으면 저장하지 않고 False."""
+                # 취소 확인 (Job 전체를 refresh하지 않고 상태 컬럼만 조회)
+                status = db.execute(
+                    select(CrawlJob.status).where(CrawlJob.id == job_pk)
+                ).scalar_one()
+                if status == CrawlJobStatus.CANCELLED:
+                    job.status = CrawlJobStatus.CANCELLED
+                    return False
+
+                now = datetime.now(UTC)
+                rows = [_crawled_product_row(job_pk, user_id, data, now) for data in pending]
+                failures = _insert_products(db, rows)
+
+                job.crawled_items += len(rows)
+                # 전체 개수는 크롤링이 끝나야 알 수 있으므로 지금까지 수집한 개수
+                job.total_items = job.crawled_items
+                job.success_count += len(rows) - failures
+                job.failure_count += failures
+                pending.clear()
+                db.commit()
 
+                # Celery 상태 업데이트
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "crawled": job.crawled_items,
+                        "total": job.total_items,
+                        "success": job.success_count,
+                        "failure": job.failure_count,
+                    },
+                )
+                return True
+
+            # async generator를 한 항목씩 진행시키고, 그 사이에 DB 저장은 동기로 처리.
+            # 브라우저 풀이 묶인 워커 공용 루프를 쓰므로 작업이 끝나도 루프는 닫지 않는다
+            loop = get_worker_loop()
+            products = _with_krw_prices(crawler.stream())
+            try:
+                while True:
+                    try:
+                        data = loop.run_until_complete(anext(products))
+                    except StopAsyncIteration:
+                        break
+                    pending.append(data)
+                    if checkpoint.due() and not _store_pending():
+                        break
+                if pending and job.status != CrawlJobStatus.CANCELLED:
+                    _store_pending()
             finally:
-                loop.close()
+                # 취소 등으로 중간에 멈춘 경우 브라우저/HTTP 클라이언트 정리
+                loop.run_until_complete(products.aclose())
 
-            if not products_data:
+            if job.crawled_items == 0 and job.status != CrawlJobStatus.CANCELLED:
                 job.status = CrawlJobStatus.COMPLETED
                 job.finished_at = datetime.now(UTC)
                 job.error_message = "크롤링 결과가 없습니다."
@@ -103,63 +219,6 @@ def run_crawl_job(self, crawl_job_id: str):
                     "success": 0,
                 }
 
-            job.total_items = len(products_data)
-            db.commit()
-
-            # 데이터베이스에 저장
-            for idx, data in enumerate(products_data):
-                # 취소 확인
-                db.refresh(job)
-                if job.status == CrawlJobStatus.CANCELLED:
-                    break
-
-                try:
-                    # CrawledProduct 생성
-                    product = CrawledProduct(
-                        crawl_job_id=job.id,
-                        user_id=job.user_id,
-                        # 원본 데이터
-                        original_title=data.get("title", ""),
-                        original_price=data.get("price", 0),
-                        original_currency=data.get("currency", "KRW"),
-                        original_images=data.get("images", []),
-                        original_url=data.get("url", ""),
-                        original_data=data,
-                        # 가공된 데이터 (환율 변환 적용)
-                        product_name=data.get("title", ""),
-                        sale_price=data.get("krw_price", 0),
-                        exchange_rate=data.get("exchange_rate", 1.0),
-                        stock_quantity=0,
-                        crawled_at=datetime.now(UTC),
-                        updated_at=datetime.now(UTC),
-                    )
-                    db.add(product)
-                    job.crawled_items = idx + 1
-                    job.success_count += 1
-
-                    # 10개마다 커밋
-                    if idx % 10 == 0:
-                        db.commit()
-
-                        # Celery 상태 업데이트
-                        self.update_state(
-                            state="PROGRESS",
-                            meta={
-                                "crawled": job.crawled_items,
-                                "total": job.total_items,
-                                "success": job.success_count,
-                                "failure": job.failure_count,
-                            },
-                        )
-
-                except Exception as e:
-                    job.failure_count += 1
-                    print(f"상품 저장 실패 (idx={idx}): {e}")
-                    continue
-
-            # 마지막 커밋
-            db.commit()
-
             # 완료
             if job.status != CrawlJobStatus.CANCELLED:
                 job.status = CrawlJobStatus.COMPLETED
@@ -245,9 +304,7 @@ def run_crawl_job(self, crawl_job_id: str):
 @shared_task(name="crawling.cancel")
 def cancel_crawl_job(crawl_job_id: str):
     """크롤링 작업 취소."""
-    engine = _get_sync_engine()
-
-    with Session(engine) as db:
+    with sync_session() as db:
         job = db.execute(
             select(CrawlJob).where(CrawlJob.id == uuid.UUID(crawl_job_id))
         ).scalar_one_or_none()
@@ -0,0 +1,65 @@
+"""Celery 작업 진행 상황 기록/취소 확인 주기 관리."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class Checkpoint:
+    """rows행 또는 interval초마다 한 번 True를 반환 (DB commit/진행 상황 보고 시점).
+
+    행마다 commit하면 상품 1개당 DB 왕복과 fsync가 생기므로 결과를 모아서 기록한다.
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rows = max(1, rows)
+        self._interval = interval
+        self._clock = clock
+        self._pending = 0
+        self._last = clock()
+
+    def due(self) -> bool:
+        """행 1개 처리 후 호출. 기록할 때가 되었으면 True."""
+        self._pending += 1
+        now = self._clock()
+        if self._pending >= self._rows or now - self._last >= self._interval:
+            self._pending = 0
+            self._last = now
+            return True
+        return False
+
+
+class CancelCheck:
+    """작업 취소 여부를 interval초마다만 DB에서 확인 (행마다 SELECT하지 않도록).
+
+    Args:
+        fetch_cancelled: 취소 여부를 DB에서 조회하는 함수.
+        interval: 조회 간격(초). 그 사이에는 마지막 조회 결과를 반환.
+    """
+
+    def __init__(
+        self,
+        fetch_cancelled: Callable[[], bool],
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch_cancelled
+        self._interval = interval
+        self._clock = clock
+        self._cancelled = False
+        self._checked_at: float | None = None
+
+    def __call__(self) -> bool:
+        if self._cancelled:
+            return True
+        now = self._clock()
+        if self._checked_at is None or now - self._checked_at >= self._interval:
+            self._checked_at = now
+            self._cancelled = self._fetch()
+        return self._cancelled
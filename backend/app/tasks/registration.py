@@ -2,26 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from datetime import UTC, datetime
+from itertools import chain
 
 from celery import shared_task
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
 from app.core.config import get_app_settings
+from app.core.database import sync_session
 from app.core.security import decrypt_secret
 from app.models.job import Job, JobStatus
 from app.models.naver_credential import NaverCredential
 from app.models.product_result import ProductResult
+from app.tasks.progress import CancelCheck, Checkpoint
 
 
-def _get_sync_engine():
-    """동기 SQLAlchemy 엔진 (Celery 워커용)."""
-    settings = get_app_settings()
-    # asyncpg → psycopg2 변환
-    url = settings.database_url.replace("+asyncpg", "+psycopg2")
-    return create_engine(url)
+def _capture(fn):
+    """예외를 (결과, 예외) 튜플로 감싸 워커 스레드 밖으로 전달."""
+
+    def wrapper(item):
+        try:
+            return fn(item), None
+        except Exception as e:
+            return None, e
+
+    return wrapper
+
+
+def _is_image_http_error(error: Exception) -> bool:
+    """등록 실패가 이미지 URL 문제로 인한 HTTP 오류인지 판별."""
+    from richlychee.api.image_cache import is_image_error
+
+    response = getattr(error, "response", None)
+    if response is None:
+        return False
+    try:
+        return is_image_error(response.json())
+    except Exception:
+        return False
+
+
+def _rehost_remote_images(settings, auth, client, image_urls, image_cache) -> dict[str, str]:
+    """크롤링 이미지를 네이버 CDN으로 재호스팅 (동기 클라이언트와 인증/레이트 리밋 공유)."""
+    from richlychee.api.async_client import AsyncNaverCommerceClient
+    from richlychee.crawler.image_downloader import rehost_images
+
+    async def _run() -> dict[str, str]:
+        async with AsyncNaverCommerceClient(
+            settings, auth, rate_limiter=client.rate_limiter
+        ) as async_client:
+            return await rehost_images(async_client, image_urls, cache=image_cache)
+
+    return asyncio.run(_run())
 
 
 @shared_task(bind=True, name="registration.run")
@@ -33,9 +67,7 @@ def run_registration(self, job_id: str):
     3. 상품 순차 등록 (상태: RUNNING)
     4. 완료 시 상태 COMPLETED/FAILED로 변경
     """
-    engine = _get_sync_engine()
-
-    with Session(engine) as db:
+    with sync_session() as db:
         job = db.execute(select(Job).where(Job.id == uuid.UUID(job_id))).scalar_one_or_none()
         if not job:
             return {"error": "Job not found"}
@@ -50,16 +82,19 @@ def run_registration(self, job_id: str):
             return {"error": "Credential not found"}
 
         # richlychee 모듈 임포트
+        from richlychee.api.image_cache import payload_image_urls
         from richlychee.api.images import upload_images_batch
         from richlychee.api.products import register_product
         from richlychee.auth.session import AuthSession
         from richlychee.api.client import NaverCommerceClient
         from richlychee.config import Settings
-        from richlychee.data.reader import read_file
+        from richlychee.data.parsed_cache import iter_cached_chunks
+        from richlychee.engine.pool import run_ordered
         from richlychee.data.transformer import (
             collect_local_images,
-            row_to_product_row,
-            product_row_to_payload,
+            collect_remote_images,
+            iter_row_records,
+            record_to_product_body,
         )
 
         secret = decrypt_secret(cred.naver_client_secret)
@@ -71,10 +106,30 @@ def run_registration(self, job_id: str):
         client = NaverCommerceClient(settings, auth)
 
         try:
-            # 데이터 소스에 따라 처리
+            # 데이터 소스에 따라 처리: 행 청크를 반환하는 함수 (파일은 등록 시 다시 읽음)
             if job.source_type == "file":
-                # 파일 읽기
-                df = read_file(job.stored_file_path)
+                # 파일은 청크 단위로 읽어 워커 메모리가 파일 크기에 비례하지 않게 한다
+                stored_file_path = job.stored_file_path
+
+                # 업로드 시 검증하며 만든 파싱 캐시가 있으면 원본을 다시 파싱하지 않는다
+                parsed_cache_dir = get_app_settings().parsed_cache_dir
+                parsed_cache_ttl_days = get_app_settings().parsed_cache_ttl_days
+
+                def _read_chunks():
+                    return iter_cached_chunks(
+                        stored_file_path,
+                        settings.reader.chunk_size,
+                        parsed_cache_dir,
+                        cache_ttl_days=parsed_cache_ttl_days,
+                        excel_engine=settings.reader.excel_engine,
+                        csv_engine=settings.reader.csv_engine,
+                    )
+
+                total_rows = 0
+                local_images: set[str] = set()
+                for chunk in _read_chunks():
+                    total_rows += len(chunk)
+                    local_images.update(collect_local_images(chunk))
             elif job.source_type == "crawled":
                 # 크롤링된 데이터 읽기
                 import pandas as pd
@@ -99,37 +154,85 @@ def run_registration(self, job_id: str):
                         "optional_images": p.optional_images or "",
                     })
                 df = pd.DataFrame(data)
+                total_rows = len(df)
+
+                def _read_chunks():
+                    return iter([df])
             else:
                 raise ValueError(f"지원하지 않는 소스 타입: {job.source_type}")
 
-            job.total_rows = len(df)
+            job.total_rows = total_rows
             job.status = JobStatus.UPLOADING
             job.started_at = datetime.now(UTC)
             db.commit()
 
-            # 이미지 업로드 (파일 소스만 해당)
-            local_images = []
+            # 이미지 업로드: 파일 소스는 로컬 이미지, 크롤링 소스는 외부 이미지를 재호스팅
+            from app.services.image_cache_service import DbImageUploadCache
+
             image_url_map = {}
+            image_cache = DbImageUploadCache(db, cred.id, get_app_settings().image_cache_ttl_days)
             if job.source_type == "file":
-                local_images = collect_local_images(df)
                 if local_images:
-                    image_url_map = upload_images_batch(client, local_images)
+                    image_url_map = upload_images_batch(
+                        client, sorted(local_images), cache=image_cache
+                    )
+            elif job.source_type == "crawled":
+                remote_images = collect_remote_images(df)
+                if remote_images:
+                    image_url_map = _rehost_remote_images(
+                        settings, auth, client, remote_images, image_cache
+                    )
 
             # 상품 등록
             job.status = JobStatus.RUNNING
             db.commit()
 
-            for idx, row_data in df.iterrows():
-                # 취소 확인
-                db.refresh(job)
-                if job.status == JobStatus.CANCELLED:
-                    break
+            # ORM 객체는 워커 스레드에서 접근하지 않도록 미리 복사
+            dry_run = job.dry_run
+            job_pk = job.id
 
-                product_name = row_data.get("product_name", f"Row {idx}")
-                try:
-                    product_row = row_to_product_row(row_data)
-                    payload = product_row_to_payload(product_row, image_url_map)
+            def _register(item):
+                idx, row_data = item
+                body = record_to_product_body(row_data, image_url_map)
+                if dry_run:
+                    return None
+                return register_product(client, body)
+
+            app_settings = get_app_settings()
+
+            def _fetch_cancelled() -> bool:
+                # Job 전체를 refresh하지 않고 상태 컬럼만 조회 (쌓인 결과는 flush하지 않음)
+                with db.no_autoflush:
+                    status = db.execute(select(Job.status).where(Job.id == job_pk)).scalar_one()
+                return status == JobStatus.CANCELLED
 
+            cancelled = CancelCheck(_fetch_cancelled, app_settings.job_cancel_check_interval)
+            checkpoint = Checkpoint(
+                settings.registration.batch_size, app_settings.job_commit_interval
+            )
+
+            def _report_progress() -> None:
+                self.update_state(
+                    state="PROGRESS",
+                    meta={
+                        "processed": job.processed_rows,
+                        "total": job.total_rows,
+                        "success": job.success_count,
+                        "failure": job.failure_count,
+                        "rate": round(client.rate_limiter.rate, 2),
+                    },
+                )
+
+            # 네이버 API 호출은 워커 스레드에서, DB 기록은 현재 스레드에서 행 순서대로 처리
+            outcomes = run_ordered(
+                _capture(_register),
+                chain.from_iterable(iter_row_records(chunk) for chunk in _read_chunks()),
+                concurrency=settings.registration.concurrency,
+                should_stop=cancelled,
+            )
+            for (idx, row_data), (api_resp, error) in outcomes:
+                product_name = row_data.get("product_name", f"Row {idx}")
+                if error is None:
                     if job.dry_run:
                         result = ProductResult(
                             job_id=job.id,
@@ -140,7 +243,6 @@ def run_registration(self, job_id: str):
                         )
                         naver_product_id = "DRY_RUN"
                     else:
-                        api_resp = register_product(client, payload)
                         product_id = str(
                             api_resp.get("smartstoreChannelProductNo")
                             or api_resp.get("originProductNo", "")
@@ -164,30 +266,31 @@ def run_registration(self, job_id: str):
                         crawled_product.job_id = job.id
                         crawled_product.naver_product_id = naver_product_id
                         db.add(crawled_product)
-                except Exception as e:
+                else:
                     result = ProductResult(
                         job_id=job.id,
                         row_index=idx,
                         product_name=product_name,
                         success=False,
-                        error_message=str(e),
+                        error_message=str(error),
                     )
                     job.failure_count += 1
 
+                    # 캐시된 CDN URL이 더 이상 유효하지 않으면 다음 작업에서 다시 업로드
+                    if image_cache is not None and _is_image_http_error(error):
+                        body = record_to_product_body(row_data, image_url_map)
+                        image_cache.discard_urls(payload_image_urls(body))
+
+                # 결과는 세션에만 추가해 두고 batch_size행 또는 일정 시간마다 한 번에 INSERT
                 db.add(result)
                 job.processed_rows = idx + 1
-                db.commit()
+                if checkpoint.due():
+                    db.commit()
+                    _report_progress()
 
-                # Celery 상태 업데이트
-                self.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "processed": job.processed_rows,
-                        "total": job.total_rows,
-                        "success": job.success_count,
-                        "failure": job.failure_count,
-                    },
-                )
+            # 남은 결과 기록 (commit 후 job 속성을 다시 읽으므로 그 사이 취소도 반영된다)
+            db.commit()
+            _report_progress()
 
             # 완료
             if job.status != JobStatus.CANCELLED:
@@ -200,7 +303,6 @@ def run_registration(self, job_id: str):
                 try:
                     from app.services.email_service import EmailService
                     from app.models.user import User
-                    from app.core.config import get_app_settings
 
                     settings = get_app_settings()
                     email_service = EmailService(
@@ -6,21 +6,13 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 from celery import shared_task
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
+from sqlalchemy import select
 
-from app.core.config import get_app_settings
+from app.core.database import sync_session
 from app.models.crawl_job import CrawlJob, CrawlJobStatus
 from app.models.crawl_schedule import CrawlSchedule, ScheduleFrequency
 
 
-def _get_sync_engine():
-    """동기 SQLAlchemy 엔진."""
-    settings = get_app_settings()
-    url = settings.database_url.replace("+asyncpg", "+psycopg2")
-    return create_engine(url)
-
-
 @shared_task(name="scheduler.run_scheduled_crawls")
 def run_scheduled_crawls():
     """
@@ -28,9 +20,7 @@ def run_scheduled_crawls():
 
     실행 주기: 1시간마다
     """
-    engine = _get_sync_engine()
-
-    with Session(engine) as db:
+    with sync_session() as db:
         now = datetime.now(UTC)
 
         # 실행할 스케줄 조회 (활성 + 실행 시간 도래)
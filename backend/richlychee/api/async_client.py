@@ -0,0 +1,220 @@
+"""비동기 HTTP 클라이언트 (httpx + 레이트 리밋 + 재시도)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from richlychee.auth.session import AuthSession
+from richlychee.config import Settings
+from richlychee.utils.logging import get_logger
+from richlychee.utils.rate_limiter import (
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+    parse_retry_after,
+)
+from richlychee.utils.serialization import dumps_json
+
+logger = get_logger("api.async_client")
+
+
+class AsyncNaverCommerceClient:
+    """네이버 커머스 API 비동기 HTTP 클라이언트.
+
+    NaverCommerceClient와 같은 레이트 리밋/재시도/401 갱신 규칙을 따르며,
+    keep-alive 커넥션을 재사용하는 httpx.AsyncClient 위에서 동작한다.
+
+    Args:
+        settings: 설정.
+        auth_session: 인증 세션 (동기 클라이언트와 공유 가능).
+        http_client: 공유할 httpx.AsyncClient. None이면 자체 생성하고 aclose에서 닫는다.
+        rate_limiter: 공유할 레이트 리미터. None이면 설정값으로 생성.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        auth_session: AuthSession,
+        *,
+        http_client: httpx.AsyncClient | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ) -> None:
+        self._settings = settings
+        self._auth = auth_session
+        self._base_url = settings.api.base_url.rstrip("/")
+        self._timeout = settings.api.timeout
+        self._max_retries = settings.api.max_retries
+        self._owns_http = http_client is None
+        self._http = http_client or create_http_client(settings)
+        self._rate_limiter = rate_limiter or create_rate_limiter(
+            settings.rate_limit, key=settings.naver_client_id
+        )
+
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """이 클라이언트가 사용하는 레이트 리미터."""
+        return self._rate_limiter
+
+    async def aclose(self) -> None:
+        """자체 생성한 httpx 클라이언트를 닫는다 (공유 클라이언트는 유지)."""
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncNaverCommerceClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _url(self, path: str) -> str:
+        """전체 URL 조합."""
+        if path.startswith("http"):
+            return path
+        return f"{self._base_url}/{path.lstrip('/')}"
+
+    async def _auth_header(self) -> dict[str, str]:
+        """Authorization 헤더. 토큰 갱신이 필요할 때만 스레드에서 발급."""
+        if self._auth.needs_refresh:
+            return await asyncio.to_thread(self._auth.get_auth_header)
+        return self._auth.get_auth_header()
+
+    async def _headers(self, extra: dict[str, str] | None = None) -> dict[str, str]:
+        """공통 헤더 구성."""
+        headers = {
+            "Content-Type": "application/json",
+            **(await self._auth_header()),
+        }
+        if extra:
+            headers.update(extra)
+        return headers
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any | None = None,
+        data: Any | None = None,
+        files: Any | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: int | None = None,
+    ) -> httpx.Response:
+        """내부 요청 메서드 (레이트 리밋 + 단일 시도)."""
+        await self._rate_limiter.wait_async()
+
+        url = self._url(path)
+        req_headers = await self._headers(headers)
+
+        # 파일 업로드 시 Content-Type 제거 (httpx가 multipart 경계를 자동 설정)
+        if files:
+            req_headers.pop("Content-Type", None)
+
+        logger.debug("%s %s", method.upper(), url)
+
+        # JSON 본문은 직접 직렬화해 bytes로 보낸다 (Content-Type은 공통 헤더에 있음)
+        content = dumps_json(json) if json is not None else None
+
+        def _send() -> Any:
+            return self._http.request(
+                method,
+                url,
+                content=content,
+                data=data,
+                files=files,
+                params=params,
+                headers=req_headers,
+                timeout=timeout or self._timeout,
+            )
+
+        resp = await _send()
+
+        if resp.status_code == 401:
+            logger.warning("401 Unauthorized — 토큰 갱신 후 재시도")
+            self._auth.invalidate()
+            req_headers.update(await self._auth_header())
+            resp = await _send()
+
+        return resp
+
+    async def request_with_retry(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Any | None = None,
+        data: Any | None = None,
+        files: Any | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: int | None = None,
+    ) -> httpx.Response:
+        """재시도가 포함된 요청.
+
+        HTTP 429(Too Many Requests) 및 5xx 에러 시 지수 백오프로 재시도.
+        """
+
+        @retry(
+            stop=stop_after_attempt(self._max_retries),
+            wait=wait_exponential_jitter(
+                initial=self._settings.api.retry_backoff_factor,
+                max=30,
+            ),
+            retry=retry_if_exception_type(httpx.HTTPStatusError),
+            reraise=True,
+        )
+        async def _do_request() -> httpx.Response:
+            resp = await self._request(
+                method, path,
+                json=json, data=data, files=files,
+                params=params, headers=headers, timeout=timeout,
+            )
+
+            if resp.status_code == 429:
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                logger.warning("429 Rate Limited — %.1f초간 일시정지 후 재시도", retry_after)
+                # 같은 버킷을 쓰는 모든 호출자가 Retry-After 동안 대기 (재시도도 버킷에서 대기)
+                self._rate_limiter.on_throttle(retry_after)
+                resp.raise_for_status()
+
+            if resp.status_code >= 500:
+                logger.warning("서버 오류 %d — 재시도", resp.status_code)
+                self._rate_limiter.on_server_error()
+                resp.raise_for_status()
+
+            self._rate_limiter.on_success()
+            return resp
+
+        return await _do_request()
+
+    async def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request_with_retry("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request_with_retry("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request_with_retry("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs: Any) -> httpx.Response:
+        return await self.request_with_retry("DELETE", path, **kwargs)
+
+
+def create_http_client(settings: Settings) -> httpx.AsyncClient:
+    """커넥션 풀 크기가 설정된 httpx.AsyncClient 생성 (여러 클라이언트가 공유 가능)."""
+    max_connections = settings.api.max_connections
+    return httpx.AsyncClient(
+        timeout=settings.api.timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
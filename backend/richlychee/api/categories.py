@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from richlychee.api.client import NaverCommerceClient
 from richlychee.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from richlychee.api.async_client import AsyncNaverCommerceClient
+
 logger = get_logger("api.categories")
 
 
@@ -44,6 +47,19 @@ def search_category(
     return results
 
 
+async def search_category_async(
+    client: AsyncNaverCommerceClient,
+    keyword: str,
+) -> list[dict[str, Any]]:
+    """search_category의 비동기 버전."""
+    resp = await client.get("categories", params={"keyword": keyword})
+    resp.raise_for_status()
+
+    results = resp.json()
+    logger.info("카테고리 검색 '%s': %d건", keyword, len(results))
+    return results
+
+
 def get_category_attributes(
     client: NaverCommerceClient,
     category_id: str,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -15,7 +16,12 @@ from tenacity import (
 from richlychee.auth.session import AuthSession
 from richlychee.config import Settings
 from richlychee.utils.logging import get_logger
-from richlychee.utils.rate_limiter import TokenBucketRateLimiter
+from richlychee.utils.rate_limiter import (
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+    parse_retry_after,
+)
+from richlychee.utils.serialization import dumps_json
 
 logger = get_logger("api.client")
 
@@ -26,18 +32,39 @@ class NaverCommerceClient:
     레이트 리밋 준수, 자동 재시도, 인증 헤더 자동 부여를 담당.
     """
 
-    def __init__(self, settings: Settings, auth_session: AuthSession) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        auth_session: AuthSession,
+        *,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ) -> None:
         self._settings = settings
         self._auth = auth_session
         self._base_url = settings.api.base_url.rstrip("/")
         self._timeout = settings.api.timeout
         self._max_retries = settings.api.max_retries
         self._session = requests.Session()
-        self._rate_limiter = TokenBucketRateLimiter(
-            rate=settings.rate_limit.requests_per_second,
-            burst=settings.rate_limit.burst_max,
+
+        # 동시 등록 워커 수만큼 keep-alive 커넥션을 재사용할 수 있도록 풀 크기 조정
+        pool_size = max(10, settings.registration.concurrency)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._rate_limiter = rate_limiter or create_rate_limiter(
+            settings.rate_limit, key=settings.naver_client_id
         )
 
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """이 클라이언트가 사용하는 레이트 리미터 (다른 클라이언트와 공유 가능)."""
+        return self._rate_limiter
+
+    def close(self) -> None:
+        """keep-alive 커넥션 정리."""
+        self._session.close()
+
     def _url(self, path: str) -> str:
         """전체 URL 조합."""
         if path.startswith("http"):
@@ -78,10 +105,13 @@ class NaverCommerceClient:
 
         logger.debug("%s %s", method.upper(), url)
 
+        # JSON 본문은 직접 직렬화해 bytes로 보낸다 (Content-Type은 공통 헤더에 있음)
+        if json is not None:
+            data = dumps_json(json)
+
         resp = self._session.request(
             method=method,
             url=url,
-            json=json,
             data=data,
             files=files,
             params=params,
@@ -96,7 +126,6 @@ class NaverCommerceClient:
             resp = self._session.request(
                 method=method,
                 url=url,
-                json=json,
                 data=data,
                 files=files,
                 params=params,
@@ -140,16 +169,18 @@ class NaverCommerceClient:
             )
 
             if resp.status_code == 429:
-                retry_after = int(resp.headers.get("Retry-After", 1))
-                logger.warning("429 Rate Limited — %d초 후 재시도", retry_after)
-                import time
-                time.sleep(retry_after)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                logger.warning("429 Rate Limited — %.1f초간 일시정지 후 재시도", retry_after)
+                # 같은 버킷을 쓰는 모든 호출자가 Retry-After 동안 대기 (재시도도 버킷에서 대기)
+                self._rate_limiter.on_throttle(retry_after)
                 resp.raise_for_status()
 
             if resp.status_code >= 500:
                 logger.warning("서버 오류 %d — 재시도", resp.status_code)
+                self._rate_limiter.on_server_error()
                 resp.raise_for_status()
 
+            self._rate_limiter.on_success()
             return resp
 
         return _do_request()
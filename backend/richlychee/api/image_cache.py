@@ -0,0 +1,162 @@
+"""이미지 업로드 캐시 (이미지 내용 SHA-256 → CDN URL)."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from richlychee.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from richlychee.config import ImageCacheSettings
+    from richlychee.data.models import ProductPayload
+
+logger = get_logger("api.image_cache")
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_image(path: str | Path) -> str:
+    """이미지 파일 내용의 SHA-256 해시 (파일명과 무관)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageUploadCache(ABC):
+    """업로드된 이미지 URL 캐시 인터페이스.
+
+    키는 이미지 내용 해시이며, 같은 스토어(client_id/자격증명) 범위 안에서만 유효하다.
+    """
+
+    @abstractmethod
+    def get_many(self, digests: Iterable[str]) -> dict[str, str]:
+        """캐시된 {해시: URL} 조회 (만료 항목 제외)."""
+
+    @abstractmethod
+    def put_many(self, urls: dict[str, str]) -> None:
+        """업로드 결과 {해시: URL} 저장."""
+
+    @abstractmethod
+    def discard_urls(self, urls: Iterable[str]) -> None:
+        """유효하지 않은 것으로 확인된 CDN URL 제거."""
+
+
+class SqliteImageUploadCache(ImageUploadCache):
+    """CLI용 로컬 sqlite 캐시.
+
+    Args:
+        path: sqlite 파일 경로.
+        namespace: 캐시 범위 (네이버 client_id).
+        ttl_days: 이 기간이 지난 항목은 다시 업로드.
+    """
+
+    def __init__(self, path: str | Path, namespace: str, ttl_days: int = 30) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._namespace = namespace
+        self._ttl = ttl_days * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS image_uploads ("
+            " namespace TEXT NOT NULL,"
+            " sha256 TEXT NOT NULL,"
+            " url TEXT NOT NULL,"
+            " uploaded_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, sha256))"
+        )
+        self._conn.commit()
+
+    def get_many(self, digests: Iterable[str]) -> dict[str, str]:
+        keys = list(digests)
+        if not keys:
+            return {}
+        min_uploaded_at = time.time() - self._ttl
+        found: dict[str, str] = {}
+        with self._lock:
+            # sqlite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT sha256, url FROM image_uploads"
+                    f" WHERE namespace = ? AND uploaded_at > ? AND sha256 IN ({placeholders})",
+                    [self._namespace, min_uploaded_at, *chunk],
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def put_many(self, urls: dict[str, str]) -> None:
+        if not urls:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO image_uploads (namespace, sha256, url, uploaded_at)"
+                " VALUES (?, ?, ?, ?)",
+                [(self._namespace, digest, url, now) for digest, url in urls.items()],
+            )
+            self._conn.commit()
+
+    def discard_urls(self, urls: Iterable[str]) -> None:
+        targets = list(urls)
+        if not targets:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM image_uploads WHERE namespace = ? AND url = ?",
+                [(self._namespace, url) for url in targets],
+            )
+            self._conn.commit()
+        logger.info("이미지 캐시에서 %d개 URL 제거", len(targets))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_image_cache(
+    settings: ImageCacheSettings,
+    namespace: str,
+) -> SqliteImageUploadCache | None:
+    """설정에 따라 로컬 이미지 캐시를 연다. 비활성화되었거나 열 수 없으면 None."""
+    if not settings.enabled:
+        return None
+    try:
+        return SqliteImageUploadCache(settings.path, namespace, settings.ttl_days)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("이미지 캐시를 열 수 없습니다 (%s) — 캐시 없이 업로드: %s", settings.path, e)
+        return None
+
+
+def is_image_error(error_body: dict[str, Any]) -> bool:
+    """상품 등록 오류 응답이 이미지 URL 문제인지 판별."""
+    for item in error_body.get("invalidInputs") or []:
+        if "image" in str(item.get("name", "")).lower():
+            return True
+    message = str(error_body.get("message", ""))
+    return "이미지" in message or "image" in message.lower()
+
+
+def payload_image_urls(payload: ProductPayload | dict[str, Any]) -> list[str]:
+    """ProductPayload 또는 상품 등록 요청 본문에 포함된 이미지 URL 목록."""
+    if isinstance(payload, dict):
+        images = payload.get("originProduct", {}).get("images") or {}
+        urls = [images["representativeImage"]["url"]] if "representativeImage" in images else []
+        urls.extend(img["url"] for img in images.get("optionalImages") or [])
+        return urls
+
+    urls = []
+    if payload.representative_image:
+        urls.append(payload.representative_image.url)
+    urls.extend(img.url for img in payload.optional_images or [])
+    return urls
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import aiofiles
 
 from richlychee.api.client import NaverCommerceClient
+from richlychee.api.image_cache import ImageUploadCache, hash_image
+from richlychee.engine.pool import run_ordered
 from richlychee.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from richlychee.api.async_client import AsyncNaverCommerceClient
+    from richlychee.config import ImagePreprocessSettings
+
 logger = get_logger("api.images")
 
 
@@ -30,51 +40,320 @@ def upload_image(client: NaverCommerceClient, image_path: str | Path) -> str:
 
     logger.debug("이미지 업로드: %s", path.name)
 
-    with open(path, "rb") as f:
-        resp = client.post(
-            "product-images/upload",
-            files={"imageFiles": (path.name, f, _guess_content_type(path))},
-            timeout=client._settings.registration.image_upload_timeout,
-        )
+    # 파일 핸들을 넘기면 재시도 요청에는 이미 끝까지 읽은 핸들이 전달되므로 바이트로 보낸다
+    content = path.read_bytes()
+    resp = client.post(
+        "product-images/upload",
+        files={"imageFiles": (path.name, content, _guess_content_type(path))},
+        timeout=client._settings.registration.image_upload_timeout,
+    )
+
+    resp.raise_for_status()
+
+    url = _extract_uploaded_url(resp.json())
+    logger.info("이미지 업로드 완료: %s → %s", path.name, url)
+
+    return url
+
+
+async def upload_image_async(
+    client: AsyncNaverCommerceClient,
+    image_path: str | Path,
+) -> str:
+    """upload_image의 비동기 버전. 파일 읽기와 업로드 모두 이벤트 루프를 막지 않는다."""
+    path = Path(image_path)
+    if not path.exists():
+        raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {path}")
+
+    async with aiofiles.open(path, "rb") as f:
+        content = await f.read()
+
+    return await upload_image_bytes_async(client, path.name, content)
+
+
+async def upload_image_bytes_async(
+    client: AsyncNaverCommerceClient,
+    filename: str,
+    content: bytes,
+) -> str:
+    """메모리에 있는 이미지를 업로드하고 CDN URL을 반환 (디스크를 거치지 않음).
+
+    Args:
+        client: 비동기 HTTP 클라이언트.
+        filename: 업로드 파일명 (확장자로 Content-Type 결정).
+        content: 이미지 바이트.
+
+    Returns:
+        업로드된 이미지의 CDN URL.
+    """
+    logger.debug("이미지 업로드: %s", filename)
 
+    resp = await client.post(
+        "product-images/upload",
+        files={"imageFiles": (filename, content, _guess_content_type(Path(filename)))},
+        timeout=client._settings.registration.image_upload_timeout,
+    )
     resp.raise_for_status()
 
-    result = resp.json()
-    # API 응답에서 이미지 URL 추출
+    url = _extract_uploaded_url(resp.json())
+    logger.info("이미지 업로드 완료: %s → %s", filename, url)
+
+    return url
+
+
+def upload_images(client: NaverCommerceClient, image_paths: list[str]) -> list[str]:
+    """여러 이미지를 요청 1건(imageFiles 멀티파트)으로 업로드.
+
+    Args:
+        client: HTTP 클라이언트.
+        image_paths: 로컬 이미지 파일 경로 리스트 (존재하는 파일).
+
+    Returns:
+        입력 순서와 같은 CDN URL 리스트.
+
+    Raises:
+        requests.HTTPError: 업로드 실패 시.
+        ValueError: 응답의 이미지 수가 요청과 다를 때.
+    """
+    paths = [Path(p) for p in image_paths]
+    # 재시도 시에도 같은 본문을 보내도록 파일 핸들 대신 바이트로 전달
+    files = [("imageFiles", (p.name, p.read_bytes(), _guess_content_type(p))) for p in paths]
+    resp = client.post(
+        "product-images/upload",
+        files=files,
+        timeout=client._settings.registration.image_upload_timeout,
+    )
+
+    resp.raise_for_status()
+    return _extract_uploaded_urls(resp.json(), len(paths))
+
+
+async def upload_images_async(
+    client: AsyncNaverCommerceClient,
+    image_paths: list[str],
+) -> list[str]:
+    """upload_images의 비동기 버전."""
+    paths = [Path(p) for p in image_paths]
+    files = []
+    for p in paths:
+        async with aiofiles.open(p, "rb") as f:
+            files.append(("imageFiles", (p.name, await f.read(), _guess_content_type(p))))
+
+    resp = await client.post(
+        "product-images/upload",
+        files=files,
+        timeout=client._settings.registration.image_upload_timeout,
+    )
+    resp.raise_for_status()
+    return _extract_uploaded_urls(resp.json(), len(paths))
+
+
+def _extract_uploaded_url(result: dict[str, Any]) -> str:
+    """업로드 API 응답에서 이미지 URL 추출."""
     images = result.get("images", [])
     if not images:
         raise ValueError(f"이미지 업로드 응답에 URL이 없습니다: {result}")
+    return images[0].get("url", "")
 
-    url = images[0].get("url", "")
-    logger.info("이미지 업로드 완료: %s → %s", path.name, url)
 
-    return url
+def _extract_uploaded_urls(result: dict[str, Any], expected: int) -> list[str]:
+    """멀티파일 업로드 응답에서 요청 순서대로 URL 추출."""
+    urls = [img.get("url", "") for img in result.get("images", [])]
+    if len(urls) != expected or not all(urls):
+        raise ValueError(
+            f"이미지 업로드 응답의 URL 수가 요청과 다릅니다 ({len(urls)}/{expected}): {result}"
+        )
+    return urls
+
+
+def _existing_unique(image_paths: list[str]) -> list[str]:
+    """중복과 존재하지 않는 파일 제외."""
+    unique: list[str] = []
+    for img_path in dict.fromkeys(image_paths):
+        if Path(img_path).exists():
+            unique.append(img_path)
+        else:
+            logger.error("이미지 업로드 실패: %s — 파일을 찾을 수 없습니다", img_path)
+    return unique
+
+
+class _UploadPlan:
+    """전처리와 캐시 조회 후 실제로 업로드할 이미지 묶음과 결과 매핑 정보.
+
+    내용이 같은 파일(이름만 다른 사본 포함)은 대표 파일 1개만 업로드한다.
+    """
+
+    def __init__(
+        self,
+        image_paths: list[str],
+        batch_size: int,
+        cache: ImageUploadCache | None,
+        preprocess: ImagePreprocessSettings | None = None,
+    ) -> None:
+        self.cache = cache
+        self.digests: dict[str, str] = {}
+        self._uploaded: dict[str, str] = {}
+
+        # {원본 경로: 업로드할 경로}
+        paths = _existing_unique(image_paths)
+        if preprocess is not None and preprocess.enabled:
+            from richlychee.data.image_preprocess import preprocess_images
+
+            self.sources = preprocess_images(paths, preprocess)
+        else:
+            self.sources = {p: p for p in paths}
+
+        upload_paths = list(dict.fromkeys(self.sources.values()))
+        if cache is not None:
+            upload_paths = self._apply_cache(upload_paths, cache)
+
+        size = max(1, batch_size)
+        self.batches = [upload_paths[i:i + size] for i in range(0, len(upload_paths), size)]
+
+    @property
+    def url_map(self) -> dict[str, str]:
+        """{원본 경로: CDN URL} 매핑."""
+        return {
+            src: self._uploaded[path]
+            for src, path in self.sources.items()
+            if path in self._uploaded
+        }
+
+    def _apply_cache(self, paths: list[str], cache: ImageUploadCache) -> list[str]:
+        for img_path in paths:
+            try:
+                self.digests[img_path] = hash_image(img_path)
+            except OSError as e:
+                logger.error("이미지 업로드 실패: %s — %s", img_path, e)
+
+        try:
+            hits = cache.get_many(set(self.digests.values()))
+        except Exception as e:
+            logger.warning("이미지 캐시 조회 실패 — 전체 업로드: %s", e)
+            hits = {}
+
+        representatives: dict[str, str] = {}
+        for img_path, digest in self.digests.items():
+            if digest in hits:
+                self._uploaded[img_path] = hits[digest]
+            else:
+                representatives.setdefault(digest, img_path)
+
+        if self._uploaded:
+            logger.info("이미지 캐시 적중: %d개 (업로드 생략)", len(self._uploaded))
+        return list(representatives.values())
+
+    def record(self, uploaded: dict[str, str]) -> None:
+        """업로드 결과를 반영하고 같은 내용의 다른 경로에도 URL을 채운다."""
+        if self.cache is None:
+            self._uploaded.update(uploaded)
+            return
+
+        by_digest = {self.digests[p]: url for p, url in uploaded.items()}
+        for img_path, digest in self.digests.items():
+            if digest in by_digest:
+                self._uploaded[img_path] = by_digest[digest]
+        try:
+            self.cache.put_many(by_digest)
+        except Exception as e:
+            logger.warning("이미지 캐시 저장 실패: %s", e)
 
 
 def upload_images_batch(
     client: NaverCommerceClient,
     image_paths: list[str],
+    *,
+    cache: ImageUploadCache | None = None,
 ) -> dict[str, str]:
     """여러 이미지를 업로드하고 로컬 경로 → CDN URL 매핑을 반환.
 
+    registration.image_batch_size개씩 묶어 멀티파일 요청으로 보내고, 요청은
+    registration.image_upload_concurrency개까지 동시에 실행한다 (레이트 리밋은
+    클라이언트의 버킷이 제어). 묶음 요청이 실패하면 그 묶음의 이미지를 1개씩
+    다시 업로드해 실패한 파일만 결과에서 빠지도록 한다.
+
+    image_preprocess가 켜져 있으면 업로드 전에 프로세스 풀에서 리사이즈/재압축한다.
+    cache가 주어지면 이미지 내용 해시로 이전 업로드 URL을 먼저 찾고,
+    캐시에 없는 이미지만 업로드한 뒤 결과를 캐시에 저장한다.
+
     Args:
         client: HTTP 클라이언트.
         image_paths: 로컬 이미지 파일 경로 리스트.
+        cache: 이미지 업로드 캐시. None이면 모두 업로드.
 
     Returns:
         {로컬경로: CDN URL} 매핑.
     """
+    reg = client._settings.registration
+    plan = _UploadPlan(
+        image_paths, reg.image_batch_size, cache, client._settings.image_preprocess
+    )
+
+    def _upload_batch(batch: list[str]) -> dict[str, str]:
+        try:
+            return dict(zip(batch, upload_images(client, batch)))
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning("이미지 묶음 업로드 실패 (%d개) — 개별 재시도: %s", len(batch), e)
+            return _upload_individually(client, batch)
+
+    for _, uploaded in run_ordered(
+        _upload_batch, plan.batches, concurrency=reg.image_upload_concurrency
+    ):
+        plan.record(uploaded)
+
+    logger.info("이미지 업로드 완료: %d/%d", len(plan.url_map), len(set(image_paths)))
+    return plan.url_map
+
+
+def _upload_individually(client: NaverCommerceClient, batch: list[str]) -> dict[str, str]:
     url_map: dict[str, str] = {}
+    for img_path in batch:
+        try:
+            url_map[img_path] = upload_image(client, img_path)
+        except Exception as e:
+            logger.error("이미지 업로드 실패: %s — %s", img_path, e)
+    return url_map
+
 
-    for img_path in image_paths:
+async def upload_images_batch_async(
+    client: AsyncNaverCommerceClient,
+    image_paths: list[str],
+    *,
+    cache: ImageUploadCache | None = None,
+) -> dict[str, str]:
+    """upload_images_batch의 비동기 버전 (동시 요청 수는 세마포어로 제한)."""
+    reg = client._settings.registration
+    # 전처리, 해시 계산, 캐시 조회는 블로킹 작업이므로 스레드에서 실행
+    plan = await asyncio.to_thread(
+        _UploadPlan, image_paths, reg.image_batch_size, cache, client._settings.image_preprocess
+    )
+    semaphore = asyncio.Semaphore(max(1, reg.image_upload_concurrency))
+
+    async def _upload_one(img_path: str) -> tuple[str, str | None]:
         try:
-            url = upload_image(client, img_path)
-            url_map[img_path] = url
+            return img_path, await upload_image_async(client, img_path)
         except Exception as e:
             logger.error("이미지 업로드 실패: %s — %s", img_path, e)
+            return img_path, None
 
-    logger.info("이미지 업로드 완료: %d/%d", len(url_map), len(image_paths))
-    return url_map
+    async def _upload_batch(batch: list[str]) -> dict[str, str]:
+        async with semaphore:
+            try:
+                return dict(zip(batch, await upload_images_async(client, batch)))
+            except Exception as e:
+                if len(batch) > 1:
+                    logger.warning(
+                        "이미지 묶음 업로드 실패 (%d개) — 개별 재시도: %s", len(batch), e
+                    )
+                results = [await _upload_one(p) for p in batch]
+        return {path: url for path, url in results if url is not None}
+
+    for uploaded in await asyncio.gather(*(_upload_batch(b) for b in plan.batches)):
+        await asyncio.to_thread(plan.record, uploaded)
+
+    logger.info("이미지 업로드 완료: %d/%d", len(plan.url_map), len(set(image_paths)))
+    return plan.url_map
 
 
 def _guess_content_type(path: Path) -> str:
@@ -2,119 +2,188 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from richlychee.api.client import NaverCommerceClient
 from richlychee.data.models import ProductPayload
 from richlychee.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from richlychee.api.async_client import AsyncNaverCommerceClient
+
 logger = get_logger("api.products")
 
 
-def _payload_to_dict(payload: ProductPayload) -> dict[str, Any]:
-    """ProductPayload를 네이버 API 형식의 dict로 변환."""
+def build_product_body(
+    *,
+    name: str,
+    category_id: str,
+    sale_price: int,
+    stock_quantity: int,
+    detail_content: str = "",
+    product_condition: str = "NEW",
+    delivery_type: str = "DELIVERY",
+    delivery_fee_type: str = "PAID",
+    base_fee: int = 0,
+    free_condition_amount: int | None = None,
+    return_fee: int = 0,
+    exchange_fee: int = 0,
+    representative_image: str | None = None,
+    optional_images: list[str] | None = None,
+    option_names: list[str] | None = None,
+    option_combinations: list[dict[str, Any]] | None = None,
+    manufacturer: str | None = None,
+    brand: str | None = None,
+    origin_area: str | None = None,
+    seller_managed_code: str | None = None,
+    seller_tags: list[str] | None = None,
+) -> dict[str, Any]:
+    """네이버 API 상품 등록 요청 본문 구성.
+
+    ProductPayload 변환(_payload_to_dict)과 검증된 행의 빠른 변환이 같은 형식을
+    쓰도록 본문 구조는 이 함수에만 둔다.
+
+    인자는 ProductPayload의 같은 이름 필드에 대응하며 enum은 값 문자열로 받는다.
+    option_combinations는 네이버 형식의 옵션 조합 dict 리스트
+    ({"optionName1": ..., "stockQuantity": ..., "price": ..., "usable": ...}).
+    """
     data: dict[str, Any] = {
         "originProduct": {
             "statusType": "SALE",
             "saleType": "NEW",
-            "leafCategoryId": payload.category_id,
-            "name": payload.name,
-            "detailContent": payload.detail_content,
+            "leafCategoryId": category_id,
+            "name": name,
+            "detailContent": detail_content,
             "saleStartDate": "",
             "saleEndDate": "",
-            "salePrice": payload.sale_price,
-            "stockQuantity": payload.stock_quantity,
+            "salePrice": sale_price,
+            "stockQuantity": stock_quantity,
             "deliveryInfo": {
-                "deliveryType": payload.delivery_info.delivery_type.value,
+                "deliveryType": delivery_type,
                 "deliveryAttributeType": "NORMAL",
                 "deliveryFee": {
-                    "deliveryFeeType": payload.delivery_info.delivery_fee_type.value,
-                    "baseFee": payload.delivery_info.base_fee,
-                    "returnFee": payload.delivery_info.return_fee,
-                    "exchangeFee": payload.delivery_info.exchange_fee,
+                    "deliveryFeeType": delivery_fee_type,
+                    "baseFee": base_fee,
+                    "returnFee": return_fee,
+                    "exchangeFee": exchange_fee,
                 },
             },
             "detailAttribute": {
                 "naverShoppingSearchInfo": {
-                    "manufacturerName": payload.manufacturer or "",
-                    "brandName": payload.brand or "",
+                    "manufacturerName": manufacturer or "",
+                    "brandName": brand or "",
                     "modelName": "",
                 },
                 "originAreaInfo": {
                     "originAreaCode": "00",
-                    "content": payload.origin_area or "상세설명참조",
+                    "content": origin_area or "상세설명참조",
                     "plural": False,
                 },
                 "sellerCodeInfo": {
-                    "sellerManagementCode": payload.seller_managed_code or "",
+                    "sellerManagementCode": seller_managed_code or "",
                 },
-                "productCondition": payload.product_condition.value,
+                "productCondition": product_condition,
             },
         },
     }
 
     # 조건부 무료배송 금액
-    if (
-        payload.delivery_info.delivery_fee_type.value == "CONDITIONAL_FREE"
-        and payload.delivery_info.free_condition_amount
-    ):
+    if delivery_fee_type == "CONDITIONAL_FREE" and free_condition_amount:
         data["originProduct"]["deliveryInfo"]["deliveryFee"][
             "freeConditionalAmount"
-        ] = payload.delivery_info.free_condition_amount
+        ] = free_condition_amount
 
     # 대표 이미지
-    if payload.representative_image:
+    if representative_image:
         data["originProduct"]["images"] = {
-            "representativeImage": {"url": payload.representative_image.url},
+            "representativeImage": {"url": representative_image},
         }
-        if payload.optional_images:
+        if optional_images:
             data["originProduct"]["images"]["optionalImages"] = [
-                {"url": img.url} for img in payload.optional_images
+                {"url": url} for url in optional_images
             ]
 
     # 옵션
-    if payload.options and payload.option_combinations:
-        option_info: dict[str, Any] = {
+    if option_names and option_combinations:
+        data["originProduct"]["optionInfo"] = {
             "optionCombinationSortType": "CREATE",
-            "optionCombinationGroupNames": {},
-            "optionCombinations": [],
+            "optionCombinationGroupNames": {
+                f"optionGroupName{i + 1}": option_name
+                for i, option_name in enumerate(option_names)
+            },
+            "optionCombinations": option_combinations,
         }
 
-        for i, opt in enumerate(payload.options):
-            key = f"optionGroupName{i + 1}"
-            option_info["optionCombinationGroupNames"][key] = opt.name
+    # SEO 태그
+    if seller_tags:
+        data["originProduct"]["detailAttribute"]["sellerTags"] = [
+            {"code": 0, "text": tag} for tag in seller_tags[:10]
+        ]
 
-        for combo in payload.option_combinations:
-            combo_data: dict[str, Any] = {
-                "stockQuantity": combo.stock_quantity,
-                "price": combo.price,
-                "usable": combo.use_yn,
-            }
-            for i, (name, value) in enumerate(combo.options.items()):
-                combo_data[f"optionName{i + 1}"] = value
+    return data
 
-            if combo.seller_managed_code:
-                combo_data["sellerManagementCode"] = combo.seller_managed_code
 
-            option_info["optionCombinations"].append(combo_data)
+def _payload_to_dict(payload: ProductPayload) -> dict[str, Any]:
+    """ProductPayload를 네이버 API 형식의 dict로 변환."""
+    option_combinations = []
+    for combo in payload.option_combinations:
+        combo_data: dict[str, Any] = {
+            "stockQuantity": combo.stock_quantity,
+            "price": combo.price,
+            "usable": combo.use_yn,
+        }
+        for i, value in enumerate(combo.options.values()):
+            combo_data[f"optionName{i + 1}"] = value
 
-        data["originProduct"]["optionInfo"] = option_info
+        if combo.seller_managed_code:
+            combo_data["sellerManagementCode"] = combo.seller_managed_code
 
-    # SEO 태그
-    if payload.seo_info and payload.seo_info.seller_tags:
-        data["originProduct"]["detailAttribute"]["sellerTags"] = [
-            {"code": 0, "text": tag} for tag in payload.seo_info.seller_tags[:10]
-        ]
+        option_combinations.append(combo_data)
 
-    return data
+    delivery = payload.delivery_info
+    return build_product_body(
+        name=payload.name,
+        category_id=payload.category_id,
+        sale_price=payload.sale_price,
+        stock_quantity=payload.stock_quantity,
+        detail_content=payload.detail_content,
+        product_condition=payload.product_condition.value,
+        delivery_type=delivery.delivery_type.value,
+        delivery_fee_type=delivery.delivery_fee_type.value,
+        base_fee=delivery.base_fee,
+        free_condition_amount=delivery.free_condition_amount,
+        return_fee=delivery.return_fee,
+        exchange_fee=delivery.exchange_fee,
+        representative_image=(
+            payload.representative_image.url if payload.representative_image else None
+        ),
+        optional_images=[img.url for img in payload.optional_images],
+        option_names=[opt.name for opt in payload.options],
+        option_combinations=option_combinations,
+        manufacturer=payload.manufacturer,
+        brand=payload.brand,
+        origin_area=payload.origin_area,
+        seller_managed_code=payload.seller_managed_code,
+        seller_tags=payload.seo_info.seller_tags if payload.seo_info else None,
+    )
 
 
-def register_product(client: NaverCommerceClient, payload: ProductPayload) -> dict[str, Any]:
+def _request_body(payload: ProductPayload | dict[str, Any]) -> dict[str, Any]:
+    """ProductPayload 또는 이미 구성된 요청 본문(dict)을 요청 본문으로."""
+    if isinstance(payload, dict):
+        return payload
+    return _payload_to_dict(payload)
+
+
+def register_product(
+    client: NaverCommerceClient,
+    payload: ProductPayload | dict[str, Any],
+) -> dict[str, Any]:
     """상품을 네이버 스마트스토어에 등록.
 
     Args:
         client: HTTP 클라이언트.
-        payload: 상품 페이로드.
+        payload: 상품 페이로드 또는 build_product_body로 구성한 요청 본문.
 
     Returns:
         API 응답 dict.
@@ -122,19 +191,57 @@ def register_product(client: NaverCommerceClient, payload: ProductPayload) -> di
     Raises:
         requests.HTTPError: 등록 실패 시.
     """
-    data = _payload_to_dict(payload)
-    logger.info("상품 등록: %s", payload.name)
+    data = _request_body(payload)
+    name = data["originProduct"]["name"]
+    logger.info("상품 등록: %s", name)
 
     resp = client.post("products", json=data)
     resp.raise_for_status()
 
     result = resp.json()
     product_id = result.get("smartstoreChannelProduct", {}).get("channelProductNo")
-    logger.info("상품 등록 완료: %s (ID: %s)", payload.name, product_id)
+    logger.info("상품 등록 완료: %s (ID: %s)", name, product_id)
+
+    return result
+
+
+async def register_product_async(
+    client: AsyncNaverCommerceClient,
+    payload: ProductPayload | dict[str, Any],
+) -> dict[str, Any]:
+    """register_product의 비동기 버전."""
+    data = _request_body(payload)
+    name = data["originProduct"]["name"]
+    logger.info("상품 등록: %s", name)
+
+    resp = await client.post("products", json=data)
+    resp.raise_for_status()
+
+    result = resp.json()
+    product_id = result.get("smartstoreChannelProduct", {}).get("channelProductNo")
+    logger.info("상품 등록 완료: %s (ID: %s)", name, product_id)
 
     return result
 
 
+def _search_params(
+    product_name: str | None,
+    seller_managed_code: str | None,
+    page: int,
+    size: int,
+) -> dict[str, Any]:
+    """상품 검색 쿼리 파라미터 구성."""
+    params: dict[str, Any] = {
+        "page": page,
+        "size": size,
+    }
+    if product_name:
+        params["productName"] = product_name
+    if seller_managed_code:
+        params["sellerManagementCode"] = seller_managed_code
+    return params
+
+
 def search_products(
     client: NaverCommerceClient,
     *,
@@ -155,16 +262,26 @@ def search_products(
     Returns:
         API 응답 dict.
     """
-    params: dict[str, Any] = {
-        "page": page,
-        "size": size,
-    }
-    if product_name:
-        params["productName"] = product_name
-    if seller_managed_code:
-        params["sellerManagementCode"] = seller_managed_code
+    params = _search_params(product_name, seller_managed_code, page, size)
 
     resp = client.get("products/search", params=params)
     resp.raise_for_status()
 
     return resp.json()
+
+
+async def search_products_async(
+    client: AsyncNaverCommerceClient,
+    *,
+    product_name: str | None = None,
+    seller_managed_code: str | None = None,
+    page: int = 1,
+    size: int = 50,
+) -> dict[str, Any]:
+    """search_products의 비동기 버전."""
+    params = _search_params(product_name, seller_managed_code, page, size)
+
+    resp = await client.get("products/search", params=params)
+    resp.raise_for_status()
+
+    return resp.json()
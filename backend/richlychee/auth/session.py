@@ -7,51 +7,114 @@ import threading
 import requests
 
 from richlychee.auth.token import TokenInfo, request_token
+from richlychee.auth.token_store import TokenStore, get_token_store
 from richlychee.config import Settings
 from richlychee.utils.logging import get_logger
 
 logger = get_logger("auth.session")
 
+# 갱신 락 유지 시간 여유분 (bcrypt 서명 등 HTTP 요청 외 시간)
+_LOCK_TTL_MARGIN = 10.0
+
 
 class AuthSession:
     """자동 토큰 갱신 기능이 있는 인증 세션.
 
     모든 API 호출에서 이 세션을 통해 Authorization 헤더를 자동 부여한다.
+    토큰은 client_id 단위로 TokenStore에 공유되므로 세션을 새로 만들어도
+    유효한 토큰이 있으면 재발급하지 않는다. 만료가 refresh_margin초 안으로
+    다가오면 현재 토큰을 계속 쓰면서 백그라운드에서 미리 갱신한다.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, token_store: TokenStore | None = None) -> None:
         self._settings = settings
+        self._client_id = settings.naver_client_id
+        self._refresh_margin = settings.token_cache.refresh_margin
+        self._store = token_store or get_token_store(settings.token_cache)
+        # requests의 timeout은 연결/읽기에 각각 적용되므로 발급 1회는 최대 2 × timeout
+        self._lock_ttl = settings.api.timeout * 2 + _LOCK_TTL_MARGIN
         self._token: TokenInfo | None = None
         self._lock = threading.Lock()
+        self._background_refresh: threading.Thread | None = None
 
     @property
     def token(self) -> TokenInfo:
         """유효한 토큰을 반환. 만료 시 자동 갱신."""
-        with self._lock:
-            if self._token is None or self._token.is_expired:
-                self._refresh_token()
-            assert self._token is not None
-            return self._token
+        token = self._token
+        if token is None or token.is_expired:
+            with self._lock:
+                token = self._store.get(self._client_id)
+                if token is None:
+                    token = self._store.refresh(
+                        self._client_id, self._request_token, lock_ttl=self._lock_ttl
+                    )
+                self._token = token
+
+        if token.expires_within(self._margin_for(token)):
+            self._refresh_in_background()
+
+        return token
+
+    def _margin_for(self, token: TokenInfo) -> float:
+        """선제 갱신 마진. 수명이 짧은 토큰은 수명의 절반을 넘지 않게 한다."""
+        lifetime = token.expires_at - token.issued_at
+        return min(self._refresh_margin, lifetime / 2)
+
+    @property
+    def needs_refresh(self) -> bool:
+        """다음 token 접근 시 I/O(토큰 발급 또는 Redis 조회)가 필요한지 여부."""
+        token = self._token
+        if token is not None and not token.is_expired:
+            return False
+        return self._store.peek(self._client_id) is None
 
-    def _refresh_token(self) -> None:
+    def _request_token(self) -> TokenInfo:
         """토큰을 새로 발급."""
         logger.info("토큰 갱신 중...")
-        self._token = request_token(
-            client_id=self._settings.naver_client_id,
+        return request_token(
+            client_id=self._client_id,
             client_secret=self._settings.naver_client_secret,
             token_url=self._settings.api.token_url,
             timeout=self._settings.api.timeout,
         )
 
+    def _refresh_in_background(self) -> None:
+        """만료 임박 토큰을 데몬 스레드에서 미리 갱신 (세션당 1개)."""
+        with self._lock:
+            if self._background_refresh is not None and self._background_refresh.is_alive():
+                return
+            self._background_refresh = threading.Thread(
+                target=self._background_refresh_worker,
+                name=f"token-refresh-{self._client_id}",
+                daemon=True,
+            )
+            self._background_refresh.start()
+
+    def _background_refresh_worker(self) -> None:
+        try:
+            current = self._token
+            margin = self._margin_for(current) if current else self._refresh_margin
+            token = self._store.refresh(
+                self._client_id, self._request_token, margin=margin, lock_ttl=self._lock_ttl
+            )
+        except Exception as e:
+            logger.warning("백그라운드 토큰 갱신 실패 (만료 시 재시도): %s", e)
+            return
+        with self._lock:
+            self._token = token
+
     def get_auth_header(self) -> dict[str, str]:
         """Authorization 헤더를 반환."""
         t = self.token
         return {"Authorization": f"{t.token_type} {t.access_token}"}
 
     def test_connection(self) -> bool:
-        """인증 테스트. 토큰 발급 성공 여부를 반환."""
+        """인증 테스트. 캐시와 무관하게 실제로 토큰을 발급해 성공 여부를 반환."""
         try:
-            _ = self.token
+            token = self._request_token()
+            self._store.set(self._client_id, token)
+            with self._lock:
+                self._token = token
             logger.info("인증 테스트 성공")
             return True
         except requests.HTTPError as e:
@@ -62,6 +125,11 @@ class AuthSession:
             return False
 
     def invalidate(self) -> None:
-        """현재 토큰을 무효화하여 다음 호출 시 갱신 강제."""
+        """현재 토큰을 무효화하여 다음 호출 시 갱신 강제.
+
+        공유 캐시에서도 같은 토큰이면 함께 삭제해 다른 세션이 재사용하지 않도록 한다.
+        """
         with self._lock:
+            stale = self._token
             self._token = None
+        self._store.delete(self._client_id, stale)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import base64
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import bcrypt
 import requests
@@ -21,11 +21,16 @@ class TokenInfo:
     access_token: str
     expires_at: float  # epoch seconds
     token_type: str = "Bearer"
+    issued_at: float = field(default_factory=time.time)  # epoch seconds
 
     @property
     def is_expired(self) -> bool:
         """토큰 만료 여부 (30초 마진)."""
-        return time.time() >= (self.expires_at - 30)
+        return self.expires_within(30)
+
+    def expires_within(self, seconds: float) -> bool:
+        """seconds초 안에 만료되는지 여부."""
+        return time.time() >= (self.expires_at - seconds)
 
 
 def generate_signature(client_id: str, client_secret: str, timestamp: int | None = None) -> tuple[str, int]:
@@ -0,0 +1,250 @@
+"""client_id별 액세스 토큰 공유 캐시 (프로세스 내 L1 + 선택적 Redis L2)."""
+
+from __future__ import annotations
+
+import json
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from richlychee.auth.token import TokenInfo
+from richlychee.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from richlychee.config import TokenCacheSettings
+
+logger = get_logger("auth.token_store")
+
+_KEY_PREFIX = "richlychee:token:"
+_LOCK_PREFIX = "richlychee:token-lock:"
+# 갱신 락 유지 시간. 락을 잡은 워커가 죽었을 때만 만료되어야 하므로 발급 1회에
+# 걸릴 수 있는 최대 시간(AuthSession이 HTTP 타임아웃으로 계산해 전달)보다 길게 둔다.
+_DEFAULT_LOCK_TTL = 120.0
+_POLL_INTERVAL = 0.1
+
+# 락 값이 내 소유 토큰일 때만 삭제 (만료 후 다른 워커가 잡은 락을 지우지 않도록)
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class TokenStore:
+    """발급된 토큰을 client_id 단위로 공유하는 캐시.
+
+    같은 프로세스의 모든 AuthSession은 L1(dict)을 공유하고, Redis가 설정되면
+    다른 워커 프로세스와도 토큰을 공유한다. 갱신은 single-flight로 수행되어
+    프로세스 내에서는 스레드 락, 프로세스 간에는 Redis 락을 잡은 한 곳만
+    bcrypt 서명 + 토큰 발급을 수행하고 나머지는 그 결과를 기다린다.
+
+    Args:
+        redis_client: Redis 클라이언트. None이면 프로세스 내 캐시만 사용.
+    """
+
+    def __init__(self, redis_client: Any | None = None) -> None:
+        self._redis = redis_client
+        self._release_script = (
+            redis_client.register_script(_RELEASE_SCRIPT) if redis_client is not None else None
+        )
+        self._local: dict[str, TokenInfo] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, client_id: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(client_id)
+            if lock is None:
+                lock = self._locks[client_id] = threading.Lock()
+            return lock
+
+    def peek(self, client_id: str) -> TokenInfo | None:
+        """I/O 없이 L1에서만 유효한 토큰 조회."""
+        token = self._local.get(client_id)
+        if token is not None and not token.is_expired:
+            return token
+        return None
+
+    def get(self, client_id: str) -> TokenInfo | None:
+        """유효한 토큰 조회 (L1 → Redis 순)."""
+        token = self.peek(client_id)
+        if token is not None:
+            return token
+
+        token = self._get_remote(client_id)
+        if token is not None:
+            self._local[client_id] = token
+        return token
+
+    def set(self, client_id: str, token: TokenInfo) -> None:
+        """토큰 저장 (L1 + Redis, Redis TTL은 토큰 만료 시각까지)."""
+        self._local[client_id] = token
+        if self._redis is None:
+            return
+
+        ttl = int(token.expires_at - time.time())
+        if ttl <= 0:
+            return
+        value = json.dumps({
+            "access_token": token.access_token,
+            "expires_at": token.expires_at,
+            "token_type": token.token_type,
+            "issued_at": token.issued_at,
+        })
+        try:
+            self._redis.set(f"{_KEY_PREFIX}{client_id}", value, ex=ttl)
+        except Exception as e:
+            logger.warning("토큰 캐시 저장 실패 (Redis): %s", e)
+
+    def delete(self, client_id: str, token: TokenInfo | None = None) -> None:
+        """토큰 삭제. token을 주면 저장된 토큰이 그것과 같을 때만 삭제.
+
+        401을 받은 쪽이 다른 곳에서 이미 새로 발급한 토큰을 지우지 않도록 한다.
+        """
+        current = self._local.get(client_id)
+        if token is None or (current is not None and current.access_token == token.access_token):
+            self._local.pop(client_id, None)
+
+        if self._redis is None:
+            return
+        try:
+            if token is None:
+                self._redis.delete(f"{_KEY_PREFIX}{client_id}")
+                return
+            remote = self._get_remote(client_id)
+            if remote is not None and remote.access_token == token.access_token:
+                self._redis.delete(f"{_KEY_PREFIX}{client_id}")
+        except Exception as e:
+            logger.warning("토큰 캐시 삭제 실패 (Redis): %s", e)
+
+    def refresh(
+        self,
+        client_id: str,
+        fetch: Callable[[], TokenInfo],
+        *,
+        margin: float = 0,
+        lock_ttl: float = _DEFAULT_LOCK_TTL,
+    ) -> TokenInfo:
+        """single-flight 토큰 갱신.
+
+        대기하는 동안 다른 스레드/프로세스가 만료까지 margin초 넘게 남은 토큰을
+        저장했다면 새로 발급하지 않고 그 토큰을 반환한다.
+
+        Args:
+            client_id: 클라이언트 ID.
+            fetch: 실제 토큰 발급 함수 (bcrypt 서명 + HTTP 요청).
+            margin: 이 시간(초) 안에 만료되는 토큰은 갱신 대상으로 간주.
+            lock_ttl: Redis 갱신 락 유지 시간(초). fetch 1회의 최대 소요 시간보다 길어야 한다.
+
+        Returns:
+            유효한 토큰.
+        """
+        with self._lock_for(client_id):
+            current = self.get(client_id)
+            if current is not None and not current.expires_within(margin):
+                return current
+
+            if self._redis is None:
+                return self._fetch_and_store(client_id, fetch)
+
+            lock_key = f"{_LOCK_PREFIX}{client_id}"
+            owner = secrets.token_hex(16)
+            try:
+                acquired = self._redis.set(lock_key, owner, nx=True, px=int(lock_ttl * 1000))
+            except Exception as e:
+                logger.warning("토큰 갱신 락 획득 실패 (Redis) — 직접 발급: %s", e)
+                return self._fetch_and_store(client_id, fetch)
+
+            if acquired:
+                try:
+                    return self._fetch_and_store(client_id, fetch)
+                finally:
+                    try:
+                        self._release_script(keys=[lock_key], args=[owner])
+                    except Exception:
+                        pass
+
+            # 다른 프로세스가 갱신 중 → 결과 대기 (락이 풀렸는데 토큰이 없으면 발급 실패)
+            deadline = time.monotonic() + lock_ttl
+            while time.monotonic() < deadline:
+                time.sleep(_POLL_INTERVAL)
+                current = self._get_remote(client_id)
+                if current is not None and not current.expires_within(margin):
+                    self._local[client_id] = current
+                    return current
+                try:
+                    if not self._redis.exists(lock_key):
+                        break
+                except Exception:
+                    break
+
+            logger.warning("다른 워커의 토큰 갱신 결과 없음 — 직접 발급")
+            return self._fetch_and_store(client_id, fetch)
+
+    def _fetch_and_store(self, client_id: str, fetch: Callable[[], TokenInfo]) -> TokenInfo:
+        token = fetch()
+        self.set(client_id, token)
+        return token
+
+    def _get_remote(self, client_id: str) -> TokenInfo | None:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(f"{_KEY_PREFIX}{client_id}")
+        except Exception as e:
+            logger.warning("토큰 캐시 조회 실패 (Redis): %s", e)
+            return None
+        if not raw:
+            return None
+
+        data = json.loads(raw)
+        token = TokenInfo(
+            access_token=data["access_token"],
+            expires_at=float(data["expires_at"]),
+            token_type=data.get("token_type", "Bearer"),
+            issued_at=float(data.get("issued_at", time.time())),
+        )
+        return None if token.is_expired else token
+
+    def clear(self) -> None:
+        """L1 캐시 초기화 (테스트용)."""
+        self._local.clear()
+
+
+_stores: dict[tuple[str, str], TokenStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_token_store(settings: TokenCacheSettings) -> TokenStore:
+    """설정별 프로세스 공용 TokenStore 반환.
+
+    backend가 "redis"이고 연결 가능하면 Redis L2를 사용하고, 아니면 프로세스 내 캐시만 사용.
+    """
+    cache_key = (settings.backend, settings.redis_url)
+    with _stores_lock:
+        store = _stores.get(cache_key)
+        if store is not None:
+            return store
+
+        redis_client = None
+        if settings.backend == "redis":
+            from richlychee.utils.redis_client import get_redis_client
+
+            try:
+                redis_client = get_redis_client(settings.redis_url)
+                redis_client.ping()
+            except Exception as e:
+                logger.warning("Redis 연결 실패 — 프로세스 내 토큰 캐시 사용: %s", e)
+                redis_client = None
+
+        store = _stores[cache_key] = TokenStore(redis_client)
+        return store
+
+
+def reset_token_stores() -> None:
+    """모든 프로세스 공용 TokenStore 초기화 (테스트용)."""
+    with _stores_lock:
+        _stores.clear()
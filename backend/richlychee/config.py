@@ -37,6 +37,7 @@ class ApiSettings(BaseSettings):
     timeout: int = _yaml.get("api", {}).get("timeout", 30)
     max_retries: int = _yaml.get("api", {}).get("max_retries", 3)
     retry_backoff_factor: float = _yaml.get("api", {}).get("retry_backoff_factor", 1.0)
+    max_connections: int = _yaml.get("api", {}).get("max_connections", 100)
 
 
 class RateLimitSettings(BaseSettings):
@@ -44,6 +45,63 @@ class RateLimitSettings(BaseSettings):
 
     requests_per_second: int = _yaml.get("rate_limit", {}).get("requests_per_second", 10)
     burst_max: int = _yaml.get("rate_limit", {}).get("burst_max", 15)
+    # 적응형(AIMD) 모드: 429/5xx 시 감소, 성공 시 requests_per_second까지 회복
+    adaptive: bool = _yaml.get("rate_limit", {}).get("adaptive", False)
+    min_rate: float = _yaml.get("rate_limit", {}).get("min_rate", 1.0)
+    decrease_factor: float = _yaml.get("rate_limit", {}).get("decrease_factor", 0.5)
+    increase_step: float = _yaml.get("rate_limit", {}).get("increase_step", 0.5)
+    # 버킷 저장소: "memory"(프로세스별) 또는 "redis"(client_id별로 모든 워커가 공유)
+    backend: str = _yaml.get("rate_limit", {}).get("backend", "memory")
+    redis_url: str = _yaml.get("rate_limit", {}).get("redis_url", "redis://localhost:6379/0")
+
+
+class TokenCacheSettings(BaseSettings):
+    """액세스 토큰 공유 캐시 설정."""
+
+    # 저장소: "memory"(프로세스 내 공유) 또는 "redis"(모든 워커가 공유)
+    backend: str = _yaml.get("token_cache", {}).get("backend", "memory")
+    redis_url: str = _yaml.get("token_cache", {}).get("redis_url", "redis://localhost:6379/0")
+    # 만료까지 이 시간(초)보다 적게 남으면 백그라운드에서 미리 갱신
+    refresh_margin: int = _yaml.get("token_cache", {}).get("refresh_margin", 300)
+
+
+class ImageCacheSettings(BaseSettings):
+    """이미지 업로드 캐시 설정 (CLI)."""
+
+    enabled: bool = _yaml.get("image_cache", {}).get("enabled", True)
+    path: str = _yaml.get("image_cache", {}).get("path", ".richlychee/image_cache.sqlite3")
+    # 이 기간(일)이 지난 캐시 항목은 다시 업로드
+    ttl_days: int = _yaml.get("image_cache", {}).get("ttl_days", 30)
+
+
+class ImagePreprocessSettings(BaseSettings):
+    """업로드 전 이미지 전처리 설정."""
+
+    enabled: bool = _yaml.get("image_preprocess", {}).get("enabled", False)
+    max_dimension: int = _yaml.get("image_preprocess", {}).get("max_dimension", 2000)
+    quality: int = _yaml.get("image_preprocess", {}).get("quality", 85)
+    # "jpeg": 투명도가 없으면 JPEG로 변환 / "webp": WebP로 변환
+    output_format: str = _yaml.get("image_preprocess", {}).get("output_format", "jpeg")
+    # 전처리 프로세스 수 (0 = CPU 코어 수)
+    workers: int = _yaml.get("image_preprocess", {}).get("workers", 0)
+    cache_dir: str = _yaml.get("image_preprocess", {}).get(
+        "cache_dir", ".richlychee/preprocessed"
+    )
+
+
+class ReaderSettings(BaseSettings):
+    """입력 파일 읽기 설정."""
+
+    # 파일을 이 행 수 단위로 나눠 읽고 검증/등록한다 (메모리 사용량이 청크 크기에 비례)
+    chunk_size: int = _yaml.get("reader", {}).get("chunk_size", 5000)
+    # 정규화된 결과를 원본 해시별 Parquet으로 저장해 같은 파일은 다시 파싱하지 않는다
+    cache_enabled: bool = _yaml.get("reader", {}).get("cache_enabled", True)
+    cache_dir: str = _yaml.get("reader", {}).get("cache_dir", ".richlychee/parsed")
+    # 이 기간(일) 동안 쓰이지 않은 파싱 캐시 항목은 삭제
+    cache_ttl_days: int = _yaml.get("reader", {}).get("cache_ttl_days", 7)
+    # 리더 엔진. auto는 설치 여부와 파일 크기로 고른다 (어느 엔진이든 결과는 같다)
+    excel_engine: str = _yaml.get("reader", {}).get("excel_engine", "auto")
+    csv_engine: str = _yaml.get("reader", {}).get("csv_engine", "auto")
 
 
 class RegistrationSettings(BaseSettings):
@@ -52,6 +110,14 @@ class RegistrationSettings(BaseSettings):
     batch_size: int = _yaml.get("registration", {}).get("batch_size", 50)
     stop_on_error: bool = _yaml.get("registration", {}).get("stop_on_error", False)
     image_upload_timeout: int = _yaml.get("registration", {}).get("image_upload_timeout", 60)
+    concurrency: int = _yaml.get("registration", {}).get("concurrency", 1)
+    image_batch_size: int = _yaml.get("registration", {}).get("image_batch_size", 10)
+    image_upload_concurrency: int = _yaml.get("registration", {}).get(
+        "image_upload_concurrency", 4
+    )
+    image_download_concurrency: int = _yaml.get("registration", {}).get(
+        "image_download_concurrency", 8
+    )
 
 
 class OutputSettings(BaseSettings):
@@ -77,7 +143,11 @@ class Settings(BaseSettings):
     # 하위 설정
     api: ApiSettings = Field(default_factory=ApiSettings)
     rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
+    token_cache: TokenCacheSettings = Field(default_factory=TokenCacheSettings)
+    reader: ReaderSettings = Field(default_factory=ReaderSettings)
     registration: RegistrationSettings = Field(default_factory=RegistrationSettings)
+    image_cache: ImageCacheSettings = Field(default_factory=ImageCacheSettings)
+    image_preprocess: ImagePreprocessSettings = Field(default_factory=ImagePreprocessSettings)
     output: OutputSettings = Field(default_factory=OutputSettings)
 
 
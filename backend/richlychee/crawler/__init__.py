@@ -1,7 +1,16 @@
 """웹 크롤링 모듈."""
 
+from richlychee.crawler.auto import AutoCrawler, CrawlerTypeCache
 from richlychee.crawler.base import BaseCrawler
+from richlychee.crawler.browser_pool import BrowserPool
 from richlychee.crawler.static import StaticCrawler
 from richlychee.crawler.dynamic import DynamicCrawler
 
-__all__ = ["BaseCrawler", "StaticCrawler", "DynamicCrawler"]
+__all__ = [
+    "AutoCrawler",
+    "BaseCrawler",
+    "BrowserPool",
+    "CrawlerTypeCache",
+    "StaticCrawler",
+    "DynamicCrawler",
+]
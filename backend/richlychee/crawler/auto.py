@@ -0,0 +1,156 @@
+"""정적 크롤링을 먼저 시도하고 필요할 때만 브라우저로 전환하는 크롤러."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from urllib.parse import urlsplit
+
+from richlychee.crawler.base import BaseCrawler
+from richlychee.crawler.browser_pool import BrowserPool
+from richlychee.crawler.dynamic import DynamicCrawler
+from richlychee.crawler.static import StaticCrawler
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("crawler.auto")
+
+_KEY_PREFIX = "richlychee:crawler-type:"
+_CRAWLER_TYPES = ("static", "dynamic")
+
+
+class CrawlerTypeCache:
+    """도메인별로 실제 상품을 얻은 크롤러 타입(static/dynamic)을 기억하는 캐시.
+
+    프로세스 내 dict를 L1로 쓰고, Redis가 있으면 다른 워커와도 공유한다. 사이트가
+    바뀔 수 있으므로 ttl_seconds가 지나면 다시 정적 크롤링부터 시도한다.
+
+    Args:
+        redis_client: Redis 클라이언트. None이면 프로세스 내 캐시만 사용.
+        ttl_seconds: 기억 유지 시간.
+    """
+
+    def __init__(self, redis_client: Any | None = None, ttl_seconds: int = 7 * 86400) -> None:
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+        self._local: dict[str, tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, domain: str) -> str | None:
+        """기억된 크롤러 타입 (없거나 만료되었으면 None)."""
+        with self._lock:
+            cached = self._local.get(domain)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(f"{_KEY_PREFIX}{domain}")
+        except Exception as e:
+            logger.warning("Redis 크롤러 타입 조회 실패: %s", e)
+            return None
+        if raw is None:
+            return None
+        crawler_type = raw.decode() if isinstance(raw, bytes) else str(raw)
+        if crawler_type not in _CRAWLER_TYPES:
+            return None
+        with self._lock:
+            # 남은 TTL은 모르므로 L1에는 짧게만 둔다
+            self._local[domain] = (crawler_type, time.time() + min(self._ttl, 300))
+        return crawler_type
+
+    def set(self, domain: str, crawler_type: str) -> None:
+        """크롤러 타입 기록."""
+        with self._lock:
+            self._local[domain] = (crawler_type, time.time() + self._ttl)
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(f"{_KEY_PREFIX}{domain}", crawler_type, ex=self._ttl)
+        except Exception as e:
+            logger.warning("Redis 크롤러 타입 저장 실패: %s", e)
+
+
+class AutoCrawler(BaseCrawler):
+    """StaticCrawler로 먼저 크롤링하고, 상품을 얻지 못하면 DynamicCrawler로 다시 크롤링.
+
+    정적 HTML에서 상품을 하나라도 얻으면(item_selector 또는 JSON-LD/__NEXT_DATA__ 등
+    구조화 데이터) 그대로 정적 크롤링을 이어가고, 요청이 차단되었거나 상품이 없으면
+    (JavaScript로 렌더링하는 페이지) 브라우저로 전환한다. 실제로 상품을 얻은 타입을
+    도메인별로 기억해 두고, 동적으로 기억된 도메인은 다음부터 정적 시도 없이 바로
+    브라우저로 크롤링한다.
+
+    Args:
+        url: 크롤링 대상 URL
+        config: 크롤링 설정 (두 크롤러에 그대로 전달)
+        browser_pool: DynamicCrawler가 빌려 쓸 브라우저 풀
+        type_cache: 도메인별 크롤러 타입 캐시. 없으면 매번 정적 크롤링부터 시도한다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        config: dict | None = None,
+        browser_pool: BrowserPool | None = None,
+        type_cache: CrawlerTypeCache | None = None,
+    ):
+        super().__init__(url, config)
+        self.browser_pool = browser_pool
+        self.type_cache = type_cache
+        # 실제로 사용한 크롤러 타입 (크롤링 후 확인용)
+        self.used_type: str | None = None
+
+    @property
+    def domain(self) -> str:
+        return urlsplit(self.url).netloc.lower()
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """
+        정적 → (필요 시) 동적 순서로 크롤링.
+
+        Yields:
+            상품 정보
+        """
+        remembered = self.type_cache.get(self.domain) if self.type_cache else None
+
+        if remembered != "dynamic":
+            found = False
+            static = StaticCrawler(self.url, self.config)
+            products = static.stream()
+            try:
+                async for product in products:
+                    if not found:
+                        found = True
+                        self._remember("static")
+                    yield product
+            except RuntimeError as e:
+                if found:
+                    raise
+                # 봇 차단(403 등)은 브라우저로는 통과하는 경우가 많다
+                logger.info("정적 요청 실패 — 브라우저로 전환: %s (%s)", self.url, e)
+            else:
+                if not found:
+                    logger.info("정적 HTML에서 상품을 찾지 못함 — 브라우저로 전환: %s", self.url)
+            finally:
+                await products.aclose()
+            if found:
+                return
+
+        found = False
+        dynamic = DynamicCrawler(self.url, self.config, browser_pool=self.browser_pool)
+        products = dynamic.stream()
+        try:
+            async for product in products:
+                if not found:
+                    found = True
+                    self._remember("dynamic")
+                yield product
+        finally:
+            await products.aclose()
+
+    def _remember(self, crawler_type: str) -> None:
+        self.used_type = crawler_type
+        if self.type_cache is not None:
+            self.type_cache.set(self.domain, crawler_type)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator
 
 
 class BaseCrawler(ABC):
@@ -19,24 +19,23 @@ class BaseCrawler(ABC):
         self.config = config or {}
 
     @abstractmethod
-    async def crawl(self) -> list[dict]:
+    def stream(self) -> AsyncIterator[dict]:
         """
-        크롤링 실행 → 원시 데이터 리스트 반환.
+        크롤링 실행 → 상품을 추출되는 대로 하나씩 반환하는 async generator.
 
-        Returns:
-            크롤링된 상품 정보 리스트
-        """
-        pass
+        호출자는 결과를 받는 즉시 저장할 수 있고, 크롤러는 전체 결과를 들고 있지
+        않으므로 메모리 사용량이 결과 수와 무관하다. 중간에 aclose()하면 브라우저
+        등 자원을 정리한다.
 
-    @abstractmethod
-    def extract_product(self, raw_data: Any) -> dict:
+        Yields:
+            상품 정보 딕셔너리
         """
-        원시 데이터 → 상품 정보 변환.
 
-        Args:
-            raw_data: 크롤러별 원시 데이터 (HTML element, JSON 등)
+    async def crawl(self) -> list[dict]:
+        """
+        크롤링 실행 → 원시 데이터 리스트 반환 (stream() 결과를 모두 모음).
 
         Returns:
-            상품 정보 딕셔너리 {title, price, images, url, ...}
+            크롤링된 상품 정보 리스트
         """
-        pass
+        return [product async for product in self.stream()]
@@ -0,0 +1,134 @@
+"""재사용 가능한 Chromium 브라우저 풀 (Playwright)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+from playwright.async_api import Error as PlaywrightError
+
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("crawler.browser_pool")
+
+_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+
+class BrowserPool:
+    """Chromium 하나를 여러 크롤링 작업이 빌려 쓰는 풀.
+
+    브라우저 실행(1~3초, 수백 MB)을 작업마다 반복하지 않도록 첫 사용 시 한 번만 띄우고,
+    작업마다 쿠키/스토리지가 격리된 BrowserContext를 새로 만들어 준다. 동시에 열 수
+    있는 컨텍스트는 max_pages개로 제한한다. 브라우저는 컨텍스트를 max_uses번 만들었거나
+    비정상 종료되면 새로 띄우며, 이전 브라우저는 쓰던 작업이 끝나면 닫는다.
+
+    Playwright 객체는 만들어진 이벤트 루프에 묶이므로 풀은 한 이벤트 루프에서만 사용한다.
+
+    Args:
+        max_pages: 동시에 열 수 있는 컨텍스트 수.
+        max_uses: 브라우저를 새로 띄우기 전까지 만들 컨텍스트 수.
+    """
+
+    def __init__(self, max_pages: int = 4, max_uses: int = 50) -> None:
+        self._max_uses = max_uses
+        self._slots = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._uses = 0
+        # 브라우저별 사용 중인 컨텍스트 수 (교체된 브라우저는 0이 되면 닫는다)
+        self._active: dict[Browser, int] = {}
+
+    @asynccontextmanager
+    async def context(self, **options: Any) -> AsyncIterator[BrowserContext]:
+        """격리된 BrowserContext를 빌려준다. 블록을 벗어나면 컨텍스트를 닫는다.
+
+        Args:
+            **options: Browser.new_context 옵션 (user_agent 등).
+        """
+        async with self._slots:
+            browser, context = await self._new_context(options)
+            try:
+                yield context
+            finally:
+                try:
+                    await context.close()
+                except PlaywrightError:
+                    # 브라우저가 이미 죽은 경우
+                    pass
+                await self._release(browser)
+
+    async def _new_context(self, options: dict[str, Any]) -> tuple[Browser, BrowserContext]:
+        browser = await self._acquire()
+        try:
+            return browser, await browser.new_context(**options)
+        except PlaywrightError as e:
+            # 확인과 사용 사이에 브라우저가 죽었으면 한 번만 새로 띄워 재시도
+            logger.warning("브라우저 컨텍스트 생성 실패 — 브라우저 재실행: %s", e)
+            await self._release(browser, broken=True)
+            browser = await self._acquire()
+            try:
+                return browser, await browser.new_context(**options)
+            except BaseException:
+                await self._release(browser)
+                raise
+
+    async def _acquire(self) -> Browser:
+        """현재 브라우저를 사용 등록. 없거나 수명이 다했으면 새로 띄운다."""
+        async with self._lock:
+            browser = self._browser
+            if browser is None or not browser.is_connected() or self._uses >= self._max_uses:
+                if browser is not None:
+                    await self._retire(browser)
+                browser = self._browser = await self._launch()
+                self._uses = 0
+                self._active[browser] = 0
+            self._uses += 1
+            self._active[browser] += 1
+            return browser
+
+    async def _release(self, browser: Browser, broken: bool = False) -> None:
+        async with self._lock:
+            self._active[browser] -= 1
+            if broken and browser is self._browser:
+                self._browser = None
+                await self._retire(browser)
+            elif browser is not self._browser and self._active[browser] == 0:
+                await self._close_browser(browser)
+
+    async def _retire(self, browser: Browser) -> None:
+        """교체된 브라우저 정리 (사용 중인 작업이 있으면 끝날 때 닫는다)."""
+        if self._browser is browser:
+            self._browser = None
+        if self._active.get(browser, 0) == 0:
+            await self._close_browser(browser)
+
+    async def _close_browser(self, browser: Browser) -> None:
+        self._active.pop(browser, None)
+        try:
+            await browser.close()
+        except PlaywrightError as e:
+            logger.debug("브라우저 종료 중 오류 (무시): %s", e)
+
+    async def _launch(self) -> Browser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        logger.info("Chromium 실행")
+        return await self._playwright.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+
+    async def close(self) -> None:
+        """모든 브라우저와 Playwright 드라이버 종료."""
+        async with self._lock:
+            for browser in list(self._active):
+                await self._close_browser(browser)
+            self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
@@ -2,74 +2,229 @@
 
 from __future__ import annotations
 
-from playwright.async_api import async_playwright
+import time
+from collections.abc import AsyncIterator
+from urllib.parse import urljoin
 
 from richlychee.crawler.base import BaseCrawler
+from richlychee.crawler.browser_pool import BrowserPool
 from richlychee.crawler.extractor import (
     clean_text,
     detect_currency,
     parse_price,
 )
+from richlychee.crawler.structured import extract_structured_products
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("crawler.dynamic")
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# 상품 요소마다 필드 원시 값을 읽는 스크립트 (page.eval_on_selector_all로 한 번에 실행)
+_EXTRACT_JS = """
+(items, sel) => items.map((item) => {
+  const title = item.querySelector(sel.title);
+  const price = item.querySelector(sel.price);
+  const link = item.querySelector(sel.link);
+  return {
+    title: title ? title.innerText : null,
+    price: price ? price.innerText : null,
+    images: Array.from(
+      item.querySelectorAll(sel.image),
+      (img) => img.getAttribute("src") || img.getAttribute("data-src"),
+    ),
+    href: link ? link.getAttribute("href") : null,
+  };
+})
+"""
+
+# 목록 추출에는 이미지 URL만 필요하고 이미지 파일 자체는 받을 필요가 없다
+_DEFAULT_BLOCKED_RESOURCES = ["image", "media", "font"]
+# 광고/분석 스크립트 (URL에 포함되면 차단)
+_DEFAULT_BLOCKED_URLS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "criteo.com",
+    "criteo.net",
+    "scorecardresearch.com",
+    "hotjar.com",
+    "amazon-adsystem.com",
+]
+
+
+class _RequestBlocker:
+    """리소스 유형/URL 패턴에 해당하는 요청을 중단시키는 route 핸들러."""
+
+    def __init__(self, resource_types: list[str], url_patterns: list[str]) -> None:
+        self._resource_types = frozenset(resource_types)
+        self._url_patterns = tuple(url_patterns)
+        self.blocked = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._resource_types or self._url_patterns)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        return resource_type in self._resource_types or any(
+            pattern in url for pattern in self._url_patterns
+        )
+
+    async def __call__(self, route) -> None:
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+
+async def _iter_list(items: list[dict]) -> AsyncIterator[dict]:
+    for item in items:
+        yield item
 
 
 class DynamicCrawler(BaseCrawler):
-    """Playwright를 사용한 동적 JavaScript 페이지 크롤러."""
+    """Playwright를 사용한 동적 JavaScript 페이지 크롤러.
+
+    crawl_config의 페이지 로드 설정:
+
+    - wait_until: page.goto 완료 기준 (기본 "networkidle"). "domcontentloaded"로 두면
+      광고/이미지 요청을 기다리지 않고 item_selector가 나타나는 즉시 추출한다.
+    - block_resources: 중단할 리소스 유형 (기본 image/media/font, []이면 차단 안 함)
+    - block_urls: URL에 포함되면 중단할 문자열 (기본 주요 광고/분석 도메인)
+    - structured_data: 페이지의 구조화 데이터(JSON-LD 등)를 셀렉터보다 먼저 사용 (기본 True)
+
+    크롤링이 끝나면 단계별 소요 시간(setup/load/wait/total, 초)과 차단한 요청 수를
+    timings에 남기고 로그로 출력한다.
+    """
 
-    async def crawl(self) -> list[dict]:
+    def __init__(
+        self,
+        url: str,
+        config: dict | None = None,
+        browser_pool: BrowserPool | None = None,
+    ):
         """
-        Playwright로 동적 페이지 크롤링.
+        Args:
+            url: 크롤링 대상 URL
+            config: 크롤링 설정 (셀렉터 등)
+            browser_pool: 브라우저를 빌려 쓸 풀. 없으면 이 크롤링에서만 쓸 브라우저를 띄운다.
+        """
+        super().__init__(url, config)
+        self.browser_pool = browser_pool
+        self.timings: dict[str, float] = {}
 
-        Returns:
-            상품 정보 리스트
+    async def stream(self) -> AsyncIterator[dict]:
         """
-        async with async_playwright() as p:
-            # 브라우저 실행
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                ]
-            )
-            page = await browser.new_page()
+        Playwright로 동적 페이지 크롤링.
 
-            # User-Agent 설정
-            await page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                              "AppleWebKit/537.36 (KHTML, like Gecko) "
-                              "Chrome/120.0.0.0 Safari/537.36"
-            })
+        Yields:
+            상품 정보
+        """
+        pool = self.browser_pool or BrowserPool(max_pages=1)
+        blocker = _RequestBlocker(
+            self.config.get("block_resources", _DEFAULT_BLOCKED_RESOURCES),
+            self.config.get("block_urls", _DEFAULT_BLOCKED_URLS),
+        )
+        wait_until = self.config.get("wait_until", "networkidle")
+        item_selector = self.config.get("item_selector", ".product-item")
+        started = time.perf_counter()
+        count = 0
+        try:
+            # 작업마다 격리된 컨텍스트 (쿠키/스토리지를 다른 작업과 공유하지 않음)
+            async with pool.context(user_agent=_USER_AGENT) as context:
+                if blocker:
+                    await context.route("**/*", blocker)
+                page = await context.new_page()
+                lap = self._lap("setup", started)
 
-            try:
                 # 페이지 로드
-                await page.goto(self.url, wait_until="networkidle", timeout=30000)
+                await page.goto(self.url, wait_until=wait_until, timeout=30000)
+                lap = self._lap("load", lap)
+
+                # 구조화 데이터가 있으면 셀렉터를 기다리지 않고 바로 추출
+                structured = []
+                if self.config.get("structured_data", True):
+                    structured = extract_structured_products(await page.content(), self.url)
+
+                if structured:
+                    products = _iter_list(structured)
+                else:
+                    # 셀렉터 대기
+                    await page.wait_for_selector(item_selector, timeout=10000)
+                    self._lap("wait", lap)
+                    products = self._extract_products(page, item_selector)
 
-                # 셀렉터 대기
-                item_selector = self.config.get("item_selector", ".product-item")
-                await page.wait_for_selector(item_selector, timeout=10000)
+                async for product in products:
+                    count += 1
+                    yield product
 
-                # 상품 요소 찾기
-                items = await page.query_selector_all(item_selector)
+        finally:
+            if self.browser_pool is None:
+                await pool.close()
+            self.timings["total"] = time.perf_counter() - started
+            self.timings["blocked_requests"] = blocker.blocked
+            logger.info(
+                "동적 크롤링 %s: 상품 %d개, %s (wait_until=%s, 차단 요청 %d개)",
+                self.url,
+                count,
+                ", ".join(
+                    f"{step} {self.timings[step]:.2f}s"
+                    for step in ("setup", "load", "wait", "total")
+                    if step in self.timings
+                ),
+                wait_until,
+                blocker.blocked,
+            )
 
-                products = []
-                for item in items:
-                    try:
-                        product = await self.extract_product(item)
-                        if product and product.get("title"):
-                            products.append(product)
-                    except Exception as e:
-                        print(f"상품 추출 실패: {e}")
-                        continue
+    def _lap(self, step: str, since: float) -> float:
+        """since부터 지금까지의 시간을 timings[step]에 기록하고 현재 시각 반환."""
+        now = time.perf_counter()
+        self.timings[step] = now - since
+        return now
 
-                return products
+    async def _extract_products(self, page, item_selector: str) -> AsyncIterator[dict]:
+        """페이지의 상품 추출. 기본은 page.evaluate 한 번으로 모든 상품의 필드를 받는다."""
+        if self.config.get("extract_mode") == "element":
+            # 상품/필드마다 Playwright 호출 (상품당 6 + 이미지 수×2회 왕복)
+            for item in await page.query_selector_all(item_selector):
+                try:
+                    product = await self.extract_product(item)
+                except Exception as e:
+                    print(f"상품 추출 실패: {e}")
+                    continue
+                if product and product.get("title"):
+                    yield product
+            return
 
-            finally:
-                await browser.close()
+        fields = await page.eval_on_selector_all(item_selector, _EXTRACT_JS, self._selectors())
+        for raw in fields:
+            try:
+                product = self._build_product(**raw)
+            except Exception as e:
+                logger.warning("상품 추출 실패: %s", e)
+                continue
+            if product.get("title"):
+                yield product
+
+    def _selectors(self) -> dict[str, str]:
+        """상품 내부 필드 셀렉터 (기본값 제공)."""
+        return {
+            "title": self.config.get("title_selector", ".title"),
+            "price": self.config.get("price_selector", ".price"),
+            "image": self.config.get("image_selector", "img"),
+            "link": self.config.get("link_selector", "a"),
+        }
 
     async def extract_product(self, element) -> dict:
         """
-        Playwright 요소에서 상품 정보 추출.
+        Playwright 요소에서 상품 정보 추출 (extract_mode가 "element"일 때).
 
         Args:
             element: Playwright ElementHandle
@@ -77,56 +232,49 @@ class DynamicCrawler(BaseCrawler):
         Returns:
             상품 정보 딕셔너리
         """
-        # 셀렉터 읽기
-        title_selector = self.config.get("title_selector", ".title")
-        price_selector = self.config.get("price_selector", ".price")
-        image_selector = self.config.get("image_selector", "img")
-        link_selector = self.config.get("link_selector", "a")
-
-        # 제목 추출
-        title_elem = await element.query_selector(title_selector)
-        title = ""
-        if title_elem:
-            title_text = await title_elem.inner_text()
-            title = clean_text(title_text)
-
-        # 가격 추출
-        price = 0
-        currency = "KRW"
-        price_elem = await element.query_selector(price_selector)
-        if price_elem:
-            price_text = await price_elem.inner_text()
-            price_text = clean_text(price_text)
-            price = parse_price(price_text)
-            currency = detect_currency(price_text)
+        selectors = self._selectors()
+
+        title_elem = await element.query_selector(selectors["title"])
+        title = await title_elem.inner_text() if title_elem else None
+
+        price_elem = await element.query_selector(selectors["price"])
+        price = await price_elem.inner_text() if price_elem else None
 
-        # 이미지 추출
         images = []
-        image_elems = await element.query_selector_all(image_selector)
-        for img in image_elems:
-            img_url = await img.get_attribute("src")
-            if not img_url:
-                img_url = await img.get_attribute("data-src")
-            if img_url and img_url.startswith("http"):
-                images.append(img_url)
-
-        # 링크 추출
-        url = ""
-        link_elem = await element.query_selector(link_selector)
-        if link_elem:
-            href = await link_elem.get_attribute("href")
-            if href:
-                # 상대 URL → 절대 URL 변환
-                if href.startswith("/"):
-                    from urllib.parse import urljoin
-                    url = urljoin(self.url, href)
-                else:
-                    url = href
+        for img in await element.query_selector_all(selectors["image"]):
+            images.append(await img.get_attribute("src") or await img.get_attribute("data-src"))
+
+        link_elem = await element.query_selector(selectors["link"])
+        href = await link_elem.get_attribute("href") if link_elem else None
+
+        return self._build_product(title, price, images, href)
+
+    def _build_product(
+        self,
+        title: str | None,
+        price: str | None,
+        images: list[str | None],
+        href: str | None,
+    ) -> dict:
+        """브라우저에서 읽은 원시 값 → 상품 정보 딕셔너리."""
+        # 가격
+        if price is not None:
+            price_text = clean_text(price)
+            parsed_price = parse_price(price_text)
+            currency = detect_currency(price_text)
+        else:
+            parsed_price = 0
+            currency = "KRW"
+
+        # 링크 (상대 URL → 절대 URL 변환)
+        url = href or ""
+        if url.startswith("/"):
+            url = urljoin(self.url, url)
 
         return {
-            "title": title,
-            "price": price,
+            "title": clean_text(title) if title else "",
+            "price": parsed_price,
             "currency": currency,
-            "images": images,
+            "images": [img for img in images if img and img.startswith("http")],
             "url": url,
         }
@@ -7,11 +7,15 @@ import re
 
 def parse_price(price_str: str) -> int:
     """
-    가격 문자열 → 정수 변환.
+    가격 문자열 → 정수 변환 (통화 기본 단위, 소수점 이하 반올림).
+
+    마지막 구분자(. 또는 ,) 뒤가 1~2자리면 소수점, 그 외에는 천 단위 구분자로 본다.
+    구조화 데이터(JSON-LD 등)의 가격과 같은 단위이며, 환율 변환도 이 단위를 기준으로 한다.
 
     Examples:
         "₩29,900" → 29900
-        "$29.90" → 2990
+        "$29.90" → 30
+        "€1.234,56" → 1235
         "¥2,990" → 2990
         "29.900원" → 29900
 
@@ -19,21 +23,20 @@ def parse_price(price_str: str) -> int:
         price_str: 가격 문자열
 
     Returns:
-        정수형 가격 (소수점 제거)
+        정수형 가격
     """
-    # 숫자와 소수점만 남기고 제거
-    cleaned = re.sub(r'[^\d.]', '', price_str)
+    # 숫자와 구분자만 남기고 제거
+    cleaned = re.sub(r'[^\d.,]', '', price_str).rstrip('.,')
 
     if not cleaned:
         return 0
 
-    # 소수점 제거 (예: "29.90" → "2990")
-    cleaned = cleaned.replace('.', '')
+    decimal = re.search(r'[.,](\d{1,2})$', cleaned)
+    if decimal:
+        integer = re.sub(r'\D', '', cleaned[:decimal.start()]) or '0'
+        return round(float(f'{integer}.{decimal.group(1)}'))
 
-    try:
-        return int(cleaned)
-    except ValueError:
-        return 0
+    return int(re.sub(r'\D', '', cleaned))
 
 
 def detect_currency(price_str: str) -> str:
@@ -6,17 +6,29 @@ import asyncio
 import hashlib
 from pathlib import Path
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 import aiofiles
 import httpx
 
+from richlychee.api.images import upload_image_bytes_async
 from richlychee.utils.logging import get_logger
 
 if TYPE_CHECKING:
+    from richlychee.api.async_client import AsyncNaverCommerceClient
     from richlychee.api.client import NaverCommerceClient
+    from richlychee.api.image_cache import ImageUploadCache
 
 logger = get_logger("crawler.image_downloader")
 
+_DOWNLOAD_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+}
+# 네이버 이미지 업로드 한도. 이보다 큰 파일은 내려받다가 중단한다.
+_MAX_IMAGE_BYTES = 20 * 1024 * 1024
+# 이미 네이버 CDN에 있는 이미지는 재호스팅하지 않는다.
+_NAVER_CDN_SUFFIX = ".pstatic.net"
+
 
 async def download_image(url: str, save_path: Path) -> Path:
     """
@@ -32,12 +44,8 @@ async def download_image(url: str, save_path: Path) -> Path:
     Raises:
         httpx.HTTPError: 다운로드 실패 시
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    }
-
     async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-        resp = await client.get(url, headers=headers)
+        resp = await client.get(url, headers=_DOWNLOAD_HEADERS)
         resp.raise_for_status()
 
         # 디렉토리 생성
@@ -101,44 +109,137 @@ async def _download_with_error_handling(url: str, save_path: Path) -> Path | Exc
 async def download_and_upload_images(
     client: NaverCommerceClient,
     image_urls: list[str],
-    temp_dir: Path,
+    temp_dir: Path | None = None,
 ) -> list[str]:
     """
-    외부 이미지 URL → 로컬 다운로드 → 네이버 CDN 업로드.
+    외부 이미지 URL → 네이버 CDN 업로드 (rehost_images 래퍼).
 
     Args:
-        client: Naver Commerce API 클라이언트
+        client: Naver Commerce API 클라이언트 (인증 세션과 레이트 리미터를 공유)
         image_urls: 외부 이미지 URL 리스트
-        temp_dir: 임시 저장 디렉토리
+        temp_dir: 사용하지 않음 (이미지는 메모리에서 바로 업로드, 하위 호환용)
 
     Returns:
-        업로드된 CDN URL 리스트 (실패한 이미지는 제외)
+        업로드된 CDN URL 리스트 (입력 순서, 실패한 이미지는 제외)
+    """
+    from richlychee.api.async_client import AsyncNaverCommerceClient
+
+    async with AsyncNaverCommerceClient(
+        client._settings, client._auth, rate_limiter=client.rate_limiter
+    ) as async_client:
+        url_map = await rehost_images(async_client, image_urls)
+
+    return [url_map[url] for url in dict.fromkeys(image_urls) if url in url_map]
+
+
+async def rehost_images(
+    client: AsyncNaverCommerceClient,
+    image_urls: list[str],
+    *,
+    http_client: httpx.AsyncClient | None = None,
+    cache: ImageUploadCache | None = None,
+) -> dict[str, str]:
     """
-    from richlychee.api.images import upload_image
-
-    # 1. 병렬 다운로드
-    download_map = await download_images_batch(image_urls, temp_dir)
-
-    # 2. 순차 업로드 (upload_image는 동기 함수)
-    uploaded_urls = []
-    for original_url, local_path in download_map.items():
-        try:
-            # 동기 함수를 이벤트 루프에서 실행
-            cdn_url = await asyncio.to_thread(upload_image, client, local_path)
-            uploaded_urls.append(cdn_url)
-            logger.info("이미지 업로드 성공: %s → %s", original_url, cdn_url)
-        except Exception as e:
-            logger.error("이미지 업로드 실패 %s: %s", original_url, e)
-
-        finally:
-            # 임시 파일 삭제
-            try:
-                local_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-
-    logger.info("CDN 업로드 완료: %d/%d", len(uploaded_urls), len(image_urls))
-    return uploaded_urls
+    외부 이미지를 내려받는 즉시 네이버 CDN에 올리는 파이프라인.
+
+    이미지마다 다운로드 → 업로드가 하나의 태스크로 이어지므로, 먼저 받은 이미지는
+    나머지 다운로드가 끝나기를 기다리지 않고 업로드된다. 다운로드는 공유 커넥션 풀
+    위에서 registration.image_download_concurrency개, 업로드는
+    registration.image_upload_concurrency개까지 동시에 실행하며(레이트 리밋은
+    클라이언트 버킷이 제어), 메모리에 올라가는 이미지 수도 그 합으로 제한한다.
+
+    Args:
+        client: 네이버 커머스 비동기 클라이언트
+        image_urls: 외부 이미지 URL 리스트 (중복/네이버 CDN URL은 제외)
+        http_client: 다운로드용 httpx.AsyncClient. None이면 생성 후 종료 시 닫는다.
+        cache: 이미지 업로드 캐시. 내용이 같은 이미지는 이전 CDN URL을 재사용한다.
+            호출 스레드의 DB 세션을 쓸 수 있도록 이벤트 루프 스레드에서 호출한다.
+
+    Returns:
+        {원본 URL: CDN URL} 매핑 (실패한 이미지는 제외)
+    """
+    reg = client._settings.registration
+    urls = [url for url in dict.fromkeys(image_urls) if _needs_rehost(url)]
+    if not urls:
+        return {}
+
+    download_limit = max(1, reg.image_download_concurrency)
+    upload_limit = max(1, reg.image_upload_concurrency)
+    in_flight = asyncio.Semaphore(download_limit + upload_limit)
+    download_slots = asyncio.Semaphore(download_limit)
+    upload_slots = asyncio.Semaphore(upload_limit)
+
+    owns_http = http_client is None
+    http = http_client or httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=30.0,
+        headers=_DOWNLOAD_HEADERS,
+        limits=httpx.Limits(
+            max_connections=download_limit,
+            max_keepalive_connections=download_limit,
+        ),
+    )
+
+    async def _rehost(url: str) -> str:
+        async with in_flight:
+            async with download_slots:
+                content = await _download_to_memory(http, url)
+
+            digest = None
+            if cache is not None:
+                digest = hashlib.sha256(content).hexdigest()
+                cached = cache.get_many([digest]).get(digest)
+                if cached:
+                    return cached
+
+            async with upload_slots:
+                cdn_url = await upload_image_bytes_async(client, _filename_for(url), content)
+
+            if cache is not None:
+                cache.put_many({digest: cdn_url})
+            return cdn_url
+
+    try:
+        results = await asyncio.gather(*(_rehost(url) for url in urls), return_exceptions=True)
+    finally:
+        if owns_http:
+            await http.aclose()
+
+    url_map: dict[str, str] = {}
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logger.error("이미지 재호스팅 실패 %s: %s", url, result)
+        else:
+            url_map[url] = result
+
+    logger.info("이미지 재호스팅 완료: %d/%d", len(url_map), len(urls))
+    return url_map
+
+
+async def _download_to_memory(http: httpx.AsyncClient, url: str) -> bytes:
+    """이미지를 스트리밍으로 내려받아 바이트로 반환 (크기 한도 초과 시 중단)."""
+    async with http.stream("GET", url) as resp:
+        resp.raise_for_status()
+        buffer = bytearray()
+        async for chunk in resp.aiter_bytes():
+            buffer.extend(chunk)
+            if len(buffer) > _MAX_IMAGE_BYTES:
+                raise ValueError(f"이미지 크기가 한도({_MAX_IMAGE_BYTES} bytes)를 넘습니다")
+    return bytes(buffer)
+
+
+def _needs_rehost(url: str) -> bool:
+    """외부 URL이고 네이버 CDN 이미지가 아니면 재호스팅 대상."""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https"):
+        return False
+    return not (parsed.hostname or "").endswith(_NAVER_CDN_SUFFIX)
+
+
+def _filename_for(url: str) -> str:
+    """업로드 파일명 (URL 해시 + 확장자)."""
+    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    return f"image_{url_hash}{_extract_extension(url) or '.jpg'}"
 
 
 def _extract_extension(url: str) -> str | None:
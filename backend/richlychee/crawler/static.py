@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
 import httpx
 from bs4 import BeautifulSoup
 
@@ -12,55 +17,242 @@ from richlychee.crawler.extractor import (
     extract_image_url,
     parse_price,
 )
+from richlychee.crawler.structured import extract_structured_products
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("crawler.static")
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+_DEFAULT_MAX_PAGES = 10
+# 한 호스트에 동시에 보내는 요청 수 (차단되지 않도록 작게 유지)
+_DEFAULT_CONCURRENCY_PER_HOST = 4
+
+
+class _PageFetcher:
+    """커넥션 풀 하나를 공유하면서 호스트별 동시 요청 수를 제한하는 페이지 요청기."""
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int) -> None:
+        self._client = client
+        self._concurrency = concurrency
+        self._limits: dict[str, asyncio.Semaphore] = {}
+
+    async def get(self, url: str) -> str:
+        host = urlsplit(url).netloc
+        limit = self._limits.get(host)
+        if limit is None:
+            limit = self._limits[host] = asyncio.Semaphore(self._concurrency)
+        async with limit:
+            try:
+                resp = await self._client.get(url)
+                resp.raise_for_status()
+            except httpx.HTTPError as e:
+                raise RuntimeError(f"HTTP 요청 실패: {e}") from e
+        return resp.text
 
 
 class StaticCrawler(BaseCrawler):
-    """BeautifulSoup을 사용한 정적 HTML 페이지 크롤러."""
+    """BeautifulSoup을 사용한 정적 HTML 페이지 크롤러.
+
+    config["pagination"]이 있으면 여러 페이지를 크롤링한다.
+
+    - page_param: 페이지 번호 쿼리 파라미터 (예: "page", eBay는 "_pgn")
+    - url_template: page_param 대신 "{page}" 자리에 번호를 넣을 URL
+    - next_selector: 번호 방식이 아닌 사이트의 "다음 페이지" 링크 셀렉터
+    - start_page: 첫 페이지 번호 (기본 1, 대상 URL에 page_param이 있으면 그 값)
+    - max_pages: 최대 페이지 수 (기본 10)
+    - concurrency: 호스트당 동시 요청 수 (기본 4)
 
-    async def crawl(self) -> list[dict]:
+    페이지에 구조화 데이터(JSON-LD / __NEXT_DATA__ / OpenGraph)가 있으면 셀렉터보다
+    먼저 사용한다 (config["structured_data"]가 False이면 셀렉터만 사용).
+
+    번호 방식은 여러 페이지를 동시에 받되 결과는 페이지 순서대로 반환하고, 새 상품이
+    없는 페이지에서 멈춘다. 다음 링크 방식은 페이지를 차례로 따라간다. 여러 페이지에
+    같은 상품이 나오면 URL 기준으로 한 번만 반환한다.
+    """
+
+    async def stream(self) -> AsyncIterator[dict]:
         """
         BeautifulSoup으로 정적 페이지 크롤링.
 
-        Returns:
-            상품 정보 리스트
+        Yields:
+            상품 정보
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                          "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
+        pagination = self.config.get("pagination") or {}
+        concurrency = max(
+            1, int(pagination.get("concurrency", _DEFAULT_CONCURRENCY_PER_HOST))
+        )
+        seen_urls: set[str] = set()
+
+        async with httpx.AsyncClient(
+            follow_redirects=True, timeout=30.0, headers=_HEADERS
+        ) as client:
+            fetcher = _PageFetcher(client, concurrency)
+            if pagination.get("page_param") or pagination.get("url_template"):
+                pages = self._iter_numbered_pages(
+                    fetcher, self._page_urls(pagination), concurrency, seen_urls
+                )
+            elif pagination.get("next_selector"):
+                pages = self._iter_linked_pages(
+                    fetcher,
+                    pagination["next_selector"],
+                    int(pagination.get("max_pages", _DEFAULT_MAX_PAGES)),
+                    seen_urls,
+                )
+            else:
+                pages = self._iter_numbered_pages(fetcher, [self.url], 1, seen_urls)
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
             try:
-                resp = await client.get(self.url, headers=headers)
-                resp.raise_for_status()
-            except httpx.HTTPError as e:
-                raise RuntimeError(f"HTTP 요청 실패: {e}") from e
+                async for products in pages:
+                    for product in products:
+                        yield product
+            finally:
+                await pages.aclose()
+
+    def _page_urls(self, pagination: dict) -> list[str]:
+        """번호 방식 페이지네이션의 페이지 URL 목록."""
+        max_pages = int(pagination.get("max_pages", _DEFAULT_MAX_PAGES))
+        start = int(pagination.get("start_page", 1))
 
-            # HTML 파싱
-            soup = BeautifulSoup(resp.text, "lxml")
+        template = pagination.get("url_template")
+        if template:
+            return [template.format(page=n) for n in range(start, start + max_pages)]
 
-            # config에서 셀렉터 읽기
-            item_selector = self.config.get("item_selector", ".product-item")
-            items = soup.select(item_selector)
+        param = pagination["page_param"]
+        parts = urlsplit(self.url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        current = dict(query).get(param, "")
+        if current.isdigit():
+            start = int(current)
+        others = [(k, v) for k, v in query if k != param]
+        return [
+            urlunsplit(parts._replace(query=urlencode([*others, (param, str(n))])))
+            for n in range(start, start + max_pages)
+        ]
 
-            if not items:
-                return []
+    async def _iter_numbered_pages(
+        self,
+        fetcher: _PageFetcher,
+        page_urls: list[str],
+        concurrency: int,
+        seen_urls: set[str],
+    ) -> AsyncIterator[list[dict]]:
+        """페이지를 concurrency개씩 미리 요청하고 페이지 순서대로 새 상품 목록을 반환."""
+        urls = iter(page_urls)
+        pending: deque[tuple[str, asyncio.Task[str]]] = deque()
 
-            # 각 상품 아이템 추출
-            products = []
-            for item in items:
+        def schedule() -> None:
+            url = next(urls, None)
+            if url is not None:
+                pending.append((url, asyncio.create_task(fetcher.get(url))))
+
+        for _ in range(concurrency):
+            schedule()
+
+        first = True
+        try:
+            while pending:
+                url, task = pending.popleft()
                 try:
-                    product = self.extract_product(item)
-                    if product and product.get("title"):  # 필수 필드 검증
-                        products.append(product)
-                except Exception as e:
-                    # 개별 상품 파싱 실패는 무시하고 계속
-                    print(f"상품 추출 실패: {e}")
+                    html = await task
+                except RuntimeError as e:
+                    if first:
+                        raise
+                    # 마지막 페이지 다음을 요청해 404가 나는 사이트가 많다
+                    logger.info("페이지 요청 실패 — 페이지네이션 종료: %s", e)
+                    return
+                first = False
+
+                products = self._page_products(html, url, seen_urls)
+                if not products and len(page_urls) > 1:
+                    # 상품이 없거나 (마지막 페이지를 지남) 모두 본 상품 (마지막 페이지 반복)
+                    return
+                yield products
+                schedule()
+        finally:
+            for _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+    async def _iter_linked_pages(
+        self,
+        fetcher: _PageFetcher,
+        next_selector: str,
+        max_pages: int,
+        seen_urls: set[str],
+    ) -> AsyncIterator[list[dict]]:
+        """다음 페이지 링크를 따라가며 페이지별 새 상품 목록을 반환."""
+        url = self.url
+        visited = {url}
+        for page in range(max_pages):
+            try:
+                html = await fetcher.get(url)
+            except RuntimeError as e:
+                if page == 0:
+                    raise
+                logger.info("페이지 요청 실패 — 페이지네이션 종료: %s", e)
+                return
+
+            soup = BeautifulSoup(html, "lxml")
+            products = self._page_products(html, url, seen_urls, soup)
+            if not products and page > 0:
+                return
+            yield products
+
+            link = soup.select_one(next_selector)
+            href = link.get("href") if link else None
+            if not href:
+                return
+            url = urljoin(url, href)
+            if url in visited:
+                return
+            visited.add(url)
+
+    def _page_products(
+        self,
+        html: str,
+        page_url: str,
+        seen_urls: set[str],
+        soup: BeautifulSoup | None = None,
+    ) -> list[dict]:
+        """페이지에서 아직 반환하지 않은 상품 추출.
+
+        구조화 데이터(JSON-LD 등)가 있으면 그것을 쓰고, 없을 때만 셀렉터로 추출한다.
+        """
+        candidates = []
+        if self.config.get("structured_data", True):
+            candidates = extract_structured_products(html, page_url)
+        if not candidates:
+            candidates = self._select_products(soup or BeautifulSoup(html, "lxml"))
+
+        products = []
+        for product in candidates:
+            if product["url"]:
+                if product["url"] in seen_urls:
                     continue
+                seen_urls.add(product["url"])
+            products.append(product)
+        return products
 
-            return products
+    def _select_products(self, soup: BeautifulSoup) -> list[dict]:
+        """item_selector로 상품 추출."""
+        item_selector = self.config.get("item_selector", ".product-item")
+        products = []
+        for item in soup.select(item_selector):
+            try:
+                product = self.extract_product(item)
+            except Exception as e:
+                # 개별 상품 파싱 실패는 무시하고 계속
+                print(f"상품 추출 실패: {e}")
+                continue
+            if product and product.get("title"):  # 필수 필드 검증
+                products.append(product)
+        return products
 
     def extract_product(self, element) -> dict:
         """
@@ -107,7 +299,6 @@ class StaticCrawler(BaseCrawler):
             url = link_elem["href"]
             # 상대 URL → 절대 URL 변환
             if url.startswith("/"):
-                from urllib.parse import urljoin
                 url = urljoin(self.url, url)
 
         return {
@@ -0,0 +1,261 @@
+"""구조화 데이터(JSON-LD / __NEXT_DATA__ / OpenGraph)에서 상품 추출.
+
+셀렉터보다 사이트 개편에 강하고, 스크립트/메타 태그만 찾으므로 BeautifulSoup 트리를
+만드는 것보다 빠르다. 결과는 셀렉터 추출과 같은 {title, price, currency, images, url}
+형식이다.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import urljoin
+
+import lxml.html
+import orjson
+from lxml.etree import ParserError
+
+from richlychee.crawler.extractor import clean_text, detect_currency, parse_price
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("crawler.structured")
+
+# __NEXT_DATA__ 등 사이트별 JSON에서 상품으로 볼 객체의 키 (앞에 있을수록 우선)
+_TITLE_KEYS = ("name", "title", "productName", "itemName", "goodsName")
+_PRICE_KEYS = ("price", "salePrice", "finalPrice", "sellPrice", "discountedPrice", "currentPrice")
+_CURRENCY_KEYS = ("currency", "priceCurrency", "currencyCode")
+_IMAGE_KEYS = ("image", "imageUrl", "imageURL", "thumbnail", "thumbnailUrl", "images", "img")
+_URL_KEYS = ("url", "link", "href", "productUrl", "detailUrl")
+# 비정상적으로 깊은 JSON에서 멈추기 위한 제한
+_MAX_DEPTH = 12
+
+
+def extract_structured_products(html: str, base_url: str) -> list[dict]:
+    """HTML에 포함된 구조화 데이터에서 상품 목록 추출.
+
+    JSON-LD(Product / ItemList) → __NEXT_DATA__ → OpenGraph(product) 순서로 시도해
+    처음으로 상품이 나온 출처의 결과를 반환한다.
+
+    Args:
+        html: 페이지 HTML
+        base_url: 상대 URL 변환을 위한 페이지 URL
+
+    Returns:
+        상품 정보 리스트 (구조화 데이터가 없으면 빈 리스트)
+    """
+    try:
+        try:
+            tree = lxml.html.fromstring(html)
+        except ValueError:
+            # 인코딩 선언(<?xml ... encoding=...?>)이 있는 문자열은 바이트로만 파싱된다
+            tree = lxml.html.fromstring(html.encode("utf-8"))
+    except (ParserError, ValueError):
+        return []
+
+    for extract in (_from_json_ld, _from_next_data, _from_open_graph):
+        products = [p for p in extract(tree, base_url) if p["title"]]
+        if products:
+            # 상세 페이지의 상품 1개는 URL이 없으면 페이지 URL
+            if len(products) == 1 and not products[0]["url"]:
+                products[0]["url"] = base_url
+            return products
+    return []
+
+
+def _from_json_ld(tree, base_url: str) -> Iterator[dict]:
+    for text in tree.xpath('//script[@type="application/ld+json"]/text()'):
+        data = _loads(text)
+        if data is not None:
+            for node in _json_ld_products(data, 0):
+                yield _json_ld_product(node, base_url)
+
+
+def _json_ld_products(data: Any, depth: int) -> Iterator[dict]:
+    """JSON-LD 문서에서 Product 노드 찾기 (@graph, ItemList 안쪽 포함)."""
+    if depth > _MAX_DEPTH:
+        return
+    if isinstance(data, list):
+        for item in data:
+            yield from _json_ld_products(item, depth + 1)
+        return
+    if not isinstance(data, dict):
+        return
+
+    types = data.get("@type")
+    types = types if isinstance(types, list) else [types]
+    if "Product" in types:
+        yield data
+    elif "ItemList" in types:
+        for element in data.get("itemListElement") or []:
+            # ListItem은 item 안에 Product를 담거나 그 자체에 Product 필드를 가진다
+            if isinstance(element, dict) and isinstance(element.get("item"), dict):
+                element = element["item"]
+            yield from _json_ld_products(element, depth + 1)
+    elif "@graph" in data:
+        yield from _json_ld_products(data["@graph"], depth + 1)
+
+
+def _json_ld_product(node: dict, base_url: str) -> dict:
+    offers = node.get("offers")
+    if isinstance(offers, list):
+        offers = offers[0] if offers else None
+    price: Any = None
+    currency = None
+    if isinstance(offers, dict):
+        spec = offers.get("priceSpecification")
+        if isinstance(spec, list):
+            spec = spec[0] if spec else None
+        price = offers.get("price", offers.get("lowPrice"))
+        if price is None and isinstance(spec, dict):
+            price = spec.get("price")
+        currency = offers.get("priceCurrency") or (
+            spec.get("priceCurrency") if isinstance(spec, dict) else None
+        )
+
+    url = node.get("url") or (offers.get("url") if isinstance(offers, dict) else None)
+    return _product(node.get("name"), price, currency, node.get("image"), url, base_url)
+
+
+def _from_next_data(tree, base_url: str) -> Iterator[dict]:
+    for text in tree.xpath('//script[@id="__NEXT_DATA__"]/text()'):
+        data = _loads(text)
+        if data is None:
+            continue
+        seen: set[tuple] = set()
+        for node in _product_like_nodes(data, 0):
+            product = _product(
+                _first(node, _TITLE_KEYS),
+                _first(node, _PRICE_KEYS),
+                _first(node, _CURRENCY_KEYS),
+                _first(node, _IMAGE_KEYS),
+                _first(node, _URL_KEYS),
+                base_url,
+            )
+            # 같은 상품이 여러 곳(목록/캐시 등)에 들어 있는 경우가 많다
+            key = (product["url"] or product["title"], product["price"])
+            if key not in seen:
+                seen.add(key)
+                yield product
+
+
+def _product_like_nodes(data: Any, depth: int) -> Iterator[dict]:
+    """제목/가격과 함께 이미지나 링크가 있는 객체 찾기 (찾은 객체 안쪽은 보지 않는다)."""
+    if depth > _MAX_DEPTH:
+        return
+    if isinstance(data, list):
+        for item in data:
+            yield from _product_like_nodes(item, depth + 1)
+        return
+    if not isinstance(data, dict):
+        return
+
+    title = _first(data, _TITLE_KEYS)
+    price = _first(data, _PRICE_KEYS)
+    if isinstance(price, dict):
+        price = _first(price, ("value", "amount", "price"))
+    if (
+        isinstance(title, str)
+        and _to_price(price) is not None
+        and (_first(data, _IMAGE_KEYS) or _first(data, _URL_KEYS))
+    ):
+        yield data
+        return
+    for value in data.values():
+        if isinstance(value, (dict, list)):
+            yield from _product_like_nodes(value, depth + 1)
+
+
+def _from_open_graph(tree, base_url: str) -> Iterator[dict]:
+    meta: dict[str, str] = {}
+    for element in tree.xpath("//meta[@property and @content]"):
+        meta.setdefault(element.get("property"), element.get("content"))
+
+    price = meta.get("product:price:amount") or meta.get("og:price:amount")
+    # og:title은 거의 모든 페이지에 있으므로 상품 페이지일 때만 사용
+    if "product" not in meta.get("og:type", "") and price is None:
+        return
+    currency = meta.get("product:price:currency") or meta.get("og:price:currency")
+    yield _product(
+        meta.get("og:title"), price, currency, meta.get("og:image"), meta.get("og:url"), base_url
+    )
+
+
+def _product(
+    title: Any,
+    price: Any,
+    currency: Any,
+    images: Any,
+    url: Any,
+    base_url: str,
+) -> dict:
+    """구조화 데이터 값 → 상품 정보 딕셔너리."""
+    if isinstance(price, dict):
+        currency = currency or _first(price, _CURRENCY_KEYS)
+        price = _first(price, ("value", "amount", "price"))
+    parsed_price = _to_price(price)
+    if not isinstance(currency, str) or not currency:
+        currency = detect_currency(str(price)) if isinstance(price, str) else "KRW"
+
+    url = url if isinstance(url, str) else ""
+    return {
+        "title": clean_text(title) if isinstance(title, str) else "",
+        "price": parsed_price or 0,
+        "currency": currency.upper(),
+        "images": _image_urls(images, base_url),
+        "url": urljoin(base_url, url) if url else "",
+    }
+
+
+def _to_price(value: Any) -> int | None:
+    """구조화 데이터의 가격 → 정수 (소수점 이하 반올림, parse_price와 같은 단위).
+
+    JSON-LD/JSON의 가격은 "29.90"처럼 기계가 읽는 소수 표기이므로 float로 읽는다.
+    "29,900원"처럼 사람이 읽는 표기는 parse_price로 처리한다.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return round(value) if math.isfinite(value) else None
+    if isinstance(value, str) and value.strip():
+        try:
+            number = float(value)
+        except ValueError:
+            return parse_price(value) or None
+        return round(number) if math.isfinite(number) else None
+    return None
+
+
+def _image_urls(value: Any, base_url: str) -> list[str]:
+    """이미지 값(문자열 / 리스트 / ImageObject) → 절대 URL 리스트."""
+    if isinstance(value, (str, dict)):
+        value = [value]
+    if not isinstance(value, list):
+        return []
+    urls = []
+    for item in value:
+        if isinstance(item, dict):
+            item = _first(item, ("url", "contentUrl", "src"))
+        if isinstance(item, str) and item:
+            url = urljoin(base_url, item)
+            if url.startswith("http") and url not in urls:
+                urls.append(url)
+    return urls
+
+
+def _first(data: dict, keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        value = data.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _loads(text: str) -> Any:
+    try:
+        return orjson.loads(text.strip())
+    except orjson.JSONDecodeError as e:
+        logger.debug("구조화 데이터 JSON 파싱 실패 (무시): %s", e)
+        return None
@@ -0,0 +1,192 @@
+"""업로드 전 이미지 전처리 (리사이즈 + 재압축 + EXIF 제거)."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from PIL import Image, ImageOps
+
+from richlychee.api.image_cache import hash_image
+from richlychee.engine.pool import process_pool
+from richlychee.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from richlychee.config import ImagePreprocessSettings
+
+logger = get_logger("data.image_preprocess")
+
+# 전처리해도 작아지지 않는 이미지는 이 확장자의 빈 표시 파일로 기록해 다시 처리하지 않는다
+_KEEP_ORIGINAL_SUFFIX = ".orig"
+_OUTPUT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp"}
+
+
+@dataclass(frozen=True)
+class PreprocessOptions:
+    """전처리 옵션 (워커 프로세스로 전달되므로 pickle 가능한 값만 둔다)."""
+
+    max_dimension: int = 2000
+    quality: int = 85
+    # "jpeg": 투명도가 없으면 JPEG, 있으면 PNG 유지 / "webp": 항상 WebP
+    output_format: str = "jpeg"
+
+    @property
+    def cache_key(self) -> str:
+        """옵션이 바뀌면 캐시를 새로 만들도록 파일명에 넣는 짧은 키."""
+        raw = json.dumps(asdict(self), sort_keys=True).encode()
+        return hashlib.sha256(raw).hexdigest()[:8]
+
+
+def preprocess_image(source: str, output_dir: str, options: PreprocessOptions) -> str:
+    """이미지 1개를 전처리해 output_dir에 저장하고 경로를 반환 (워커 프로세스에서 실행).
+
+    긴 변을 max_dimension 이하로 줄이고, EXIF 방향을 적용한 뒤 메타데이터 없이 다시
+    저장한다. 투명도가 없는 PNG 등은 JPEG로 바꾼다. 애니메이션 GIF이거나 결과가
+    원본보다 크면 원본 경로를 그대로 반환한다.
+
+    Args:
+        source: 원본 이미지 경로.
+        output_dir: 전처리 결과 저장 디렉토리 (캐시).
+        options: 전처리 옵션.
+
+    Returns:
+        업로드할 이미지 경로.
+    """
+    source_path = Path(source)
+    cache_dir = Path(output_dir)
+    stem = f"{hash_image(source_path)}-{options.cache_key}"
+    cached = _lookup_cache(source, cache_dir, stem)
+    if cached is not None:
+        return cached
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with Image.open(source_path) as img:
+        if getattr(img, "is_animated", False):
+            (cache_dir / f"{stem}{_KEEP_ORIGINAL_SUFFIX}").touch()
+            return source
+
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((options.max_dimension, options.max_dimension), Image.Resampling.LANCZOS)
+
+        if options.output_format == "webp":
+            fmt = "WEBP"
+        elif _has_alpha(img):
+            fmt = "PNG"
+        else:
+            fmt = "JPEG"
+
+        if fmt == "JPEG" and img.mode != "RGB":
+            img = img.convert("RGB")
+
+        buffer = io.BytesIO()
+        save_kwargs: dict = {"optimize": True}
+        if fmt in ("JPEG", "WEBP"):
+            save_kwargs["quality"] = options.quality
+        if fmt == "JPEG":
+            save_kwargs["progressive"] = True
+        # exif 인자를 넘기지 않으면 메타데이터 없이 저장된다
+        img.save(buffer, format=fmt, **save_kwargs)
+
+    if buffer.tell() >= source_path.stat().st_size:
+        (cache_dir / f"{stem}{_KEEP_ORIGINAL_SUFFIX}").touch()
+        return source
+
+    output_path = cache_dir / f"{stem}{_OUTPUT_EXTENSIONS[fmt]}"
+    # 다른 프로세스가 같은 파일을 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+    tmp_path = output_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(buffer.getvalue())
+    tmp_path.replace(output_path)
+    return str(output_path)
+
+
+def preprocess_images(
+    image_paths: list[str],
+    settings: ImagePreprocessSettings,
+) -> dict[str, str]:
+    """여러 이미지를 프로세스 풀에서 전처리.
+
+    Args:
+        image_paths: 원본 이미지 경로 리스트.
+        settings: 전처리 설정.
+
+    Returns:
+        {원본 경로: 업로드할 경로} 매핑. 전처리에 실패한 이미지는 원본 경로로 매핑.
+    """
+    options = PreprocessOptions(
+        max_dimension=settings.max_dimension,
+        quality=settings.quality,
+        output_format=settings.output_format,
+    )
+    paths = list(dict.fromkeys(image_paths))
+    if not paths:
+        return {}
+
+    # 이미 처리된 이미지는 풀을 띄우지 않고 캐시에서 바로 찾는다
+    result: dict[str, str] = {}
+    pending: list[str] = []
+    cache_dir = Path(settings.cache_dir)
+    for path in paths:
+        try:
+            stem = f"{hash_image(path)}-{options.cache_key}"
+        except OSError as e:
+            logger.warning("이미지 전처리 실패 — 원본 업로드: %s (%s)", path, e)
+            result[path] = path
+            continue
+        cached = _lookup_cache(path, cache_dir, stem)
+        if cached is not None:
+            result[path] = cached
+        else:
+            pending.append(path)
+
+    workers = min(settings.workers or os.cpu_count() or 1, len(pending))
+    if workers <= 1:
+        for path in pending:
+            result[path] = _preprocess_or_original(path, settings.cache_dir, options)
+    elif pending:
+        # Pillow는 리사이즈/인코딩 중 GIL을 해제하므로 스레드 풀로 대체되어도 병렬 처리된다
+        with process_pool(workers) as executor:
+            futures = {
+                path: executor.submit(preprocess_image, path, settings.cache_dir, options)
+                for path in pending
+            }
+            for path, future in futures.items():
+                try:
+                    result[path] = future.result()
+                except Exception as e:
+                    logger.warning("이미지 전처리 실패 — 원본 업로드: %s (%s)", path, e)
+                    result[path] = path
+
+    changed = sum(1 for src, dst in result.items() if src != dst)
+    logger.info("이미지 전처리 완료: %d/%d개 축소", changed, len(paths))
+    return result
+
+
+def _lookup_cache(source: str, cache_dir: Path, stem: str) -> str | None:
+    """전처리 캐시 조회. 원본 유지로 기록된 이미지는 원본 경로를 반환."""
+    if (cache_dir / f"{stem}{_KEEP_ORIGINAL_SUFFIX}").exists():
+        return source
+    for ext in _OUTPUT_EXTENSIONS.values():
+        cached = cache_dir / f"{stem}{ext}"
+        if cached.exists():
+            return str(cached)
+    return None
+
+
+def _preprocess_or_original(path: str, output_dir: str, options: PreprocessOptions) -> str:
+    try:
+        return preprocess_image(path, output_dir, options)
+    except Exception as e:
+        logger.warning("이미지 전처리 실패 — 원본 업로드: %s (%s)", path, e)
+        return path
+
+
+def _has_alpha(img: Image.Image) -> bool:
+    """실제로 투명도를 쓰는 이미지인지 확인."""
+    if img.mode in ("RGBA", "LA"):
+        return img.getchannel("A").getextrema()[0] < 255
+    return img.mode == "P" and "transparency" in img.info
@@ -0,0 +1,230 @@
+"""파싱된 입력 파일 캐시 (원본 파일 SHA-256 → 정규화된 청크 Parquet)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+
+from richlychee.data.reader import iter_file_chunks
+from richlychee.data.validator import ValidationError, ValidationResult
+from richlychee.utils.logging import get_logger
+
+logger = get_logger("data.parsed_cache")
+
+# 리더의 정규화 규칙이나 검증 규칙이 바뀌면 올려서 기존 캐시를 무효화한다
+# (2: 텍스트 정규화와 int64 범위를 넘는 정수 처리 변경, 3: 엑셀 끝의 빈 행 제거,
+#  4: pyarrow CSV 타입 추론을 pyarrow 기본 규칙으로 변경)
+_CACHE_VERSION = 4
+_DEFAULT_TTL_DAYS = 7
+_HASH_CHUNK_SIZE = 1024 * 1024
+_MANIFEST = "manifest.json"
+_VALIDATION = "validation.json"
+
+
+def _hash_file(path: str | Path) -> str:
+    """파일 내용의 SHA-256 해시."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParsedFile:
+    """캐시 안의 파일 1개 (ParsedFileCache.open으로 생성).
+
+    정규화된 DataFrame 청크를 part-NNNNN.parquet 파일로 보관한다. 파싱이 끝까지
+    완료된 경우에만 디렉토리 이름을 바꿔 공개하므로 중간에 실패한 캐시는 보이지 않는다.
+    """
+
+    def __init__(self, source: Path, entry_dir: Path) -> None:
+        self._source = source
+        self._dir = entry_dir
+
+    @property
+    def is_cached(self) -> bool:
+        """파싱 결과가 캐시에 있는지 여부."""
+        return (self._dir / _MANIFEST).exists()
+
+    @property
+    def rows(self) -> int | None:
+        """캐시된 전체 행 수 (캐시가 없으면 None)."""
+        if not self.is_cached:
+            return None
+        return json.loads((self._dir / _MANIFEST).read_text(encoding="utf-8"))["rows"]
+
+    def iter_chunks(
+        self,
+        chunk_size: int | None = None,
+        **engines: str,
+    ) -> Iterator[pd.DataFrame]:
+        """정규화된 청크 반환. 캐시가 있으면 Parquet을, 없으면 원본을 파싱하며 캐시에 저장.
+
+        Args:
+            chunk_size: 원본을 파싱할 때의 청크당 행 수 (캐시에서 읽을 때는 저장된 청크 단위).
+            **engines: 원본을 파싱할 때 iter_file_chunks에 넘길 excel_engine/csv_engine.
+        """
+        if self.is_cached:
+            logger.info("파싱 캐시 사용: %s", self._source.name)
+            for part in sorted(self._dir.glob("part-*.parquet")):
+                yield pd.read_parquet(part, memory_map=True)
+            return
+
+        yield from self._parse_and_store(chunk_size, engines)
+
+    def _parse_and_store(
+        self,
+        chunk_size: int | None,
+        engines: dict[str, str],
+    ) -> Iterator[pd.DataFrame]:
+        # 같은 프로세스에서 같은 파일을 동시에 읽어도 겹치지 않도록 호출마다 고유한 이름
+        tmp_dir = self._dir.with_name(f"{self._dir.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp")
+        storing = True
+        rows = 0
+        try:
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("파싱 캐시 디렉토리를 만들 수 없습니다 — 캐시 없이 진행: %s", e)
+            storing = False
+
+        completed = False
+        try:
+            for i, chunk in enumerate(iter_file_chunks(self._source, chunk_size, **engines)):
+                if storing:
+                    try:
+                        chunk.to_parquet(tmp_dir / f"part-{i:05d}.parquet")
+                    except Exception as e:
+                        # 타입이 섞인 컬럼 등 Parquet으로 옮길 수 없으면 이 파일은 캐시하지 않는다
+                        logger.warning("파싱 캐시 저장 실패 — 캐시 없이 진행: %s", e)
+                        storing = False
+                rows += len(chunk)
+                yield chunk
+            completed = True
+        finally:
+            if storing and completed:
+                self._publish(tmp_dir, rows)
+            else:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _publish(self, tmp_dir: Path, rows: int) -> None:
+        manifest = {"source": self._source.name, "rows": rows, "version": _CACHE_VERSION}
+        try:
+            (tmp_dir / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+            tmp_dir.replace(self._dir)
+        except OSError:
+            # 다른 프로세스가 같은 파일을 먼저 캐시한 경우
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def load_validation(self) -> tuple[int, ValidationResult] | None:
+        """저장된 (행 수, 검증 결과). 없으면 None."""
+        path = self._dir / _VALIDATION
+        if not self.is_cached or not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        result = ValidationResult(
+            errors=[ValidationError(**e) for e in data["errors"]],
+            warnings=[ValidationError(**w) for w in data["warnings"]],
+        )
+        return data["rows"], result
+
+    def save_validation(self, rows: int, result: ValidationResult) -> None:
+        """검증 결과 저장 (파싱 결과가 캐시된 경우에만)."""
+        if not self.is_cached:
+            return
+        data = {
+            "rows": rows,
+            "errors": [vars(e) for e in result.errors],
+            "warnings": [vars(w) for w in result.warnings],
+        }
+        tmp_path = self._dir / f"{_VALIDATION}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        try:
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            tmp_path.replace(self._dir / _VALIDATION)
+        except OSError as e:
+            logger.warning("검증 결과 캐시 저장 실패: %s", e)
+
+
+class ParsedFileCache:
+    """입력 파일을 한 번만 파싱하도록 정규화 결과를 내용 해시별로 보관하는 캐시.
+
+    항목을 열 때마다 사용 시각을 갱신하고, ttl_days 동안 쓰이지 않은 항목과 이전
+    _CACHE_VERSION의 항목은 open할 때 정리한다.
+
+    Args:
+        cache_dir: 캐시 디렉토리.
+        ttl_days: 이 기간 동안 사용하지 않은 항목은 삭제.
+    """
+
+    def __init__(self, cache_dir: str | Path, ttl_days: int = _DEFAULT_TTL_DAYS) -> None:
+        self._dir = Path(cache_dir)
+        self._ttl = ttl_days * 86400
+
+    def open(self, path: str | Path) -> ParsedFile:
+        """파일 내용을 해시해 캐시 항목을 연다 (파싱보다 훨씬 빠르다)."""
+        source = Path(path)
+        if not source.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {source}")
+        digest = _hash_file(source)
+        entry_dir = self._dir / f"{digest}-v{_CACHE_VERSION}"
+        try:
+            # 사용 중인 항목이 정리되지 않도록 사용 시각 갱신
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        self.prune()
+        return ParsedFile(source, entry_dir)
+
+    def prune(self) -> int:
+        """오래 쓰이지 않은 항목과 이전 버전 항목 삭제.
+
+        Returns:
+            삭제한 항목 수.
+        """
+        try:
+            entries = list(self._dir.iterdir())
+        except OSError:
+            return 0
+
+        current = f"-v{_CACHE_VERSION}"
+        cutoff = time.time() - self._ttl
+        removed = 0
+        for entry in entries:
+            try:
+                stale = entry.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            # 작성 중인 임시 디렉토리(.tmp)는 오래된 것만 지운다
+            outdated = not entry.name.endswith((current, ".tmp"))
+            if stale or outdated:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info("파싱 캐시 정리: %d개 항목 삭제", removed)
+        return removed
+
+
+def iter_cached_chunks(
+    path: str | Path,
+    chunk_size: int | None = None,
+    cache_dir: str | Path | None = None,
+    *,
+    cache_ttl_days: int = _DEFAULT_TTL_DAYS,
+    **engines: str,
+) -> Iterator[pd.DataFrame]:
+    """cache_dir가 있으면 파싱 캐시를 거쳐, 없으면 바로 iter_file_chunks로 읽는다.
+
+    engines(excel_engine/csv_engine)는 원본을 파싱할 때만 쓰인다. 등록에 쓰는 필드는
+    엔진과 무관하게 같으므로 캐시 키에 포함하지 않는다.
+    """
+    if cache_dir is None:
+        return iter_file_chunks(path, chunk_size, **engines)
+    cache = ParsedFileCache(cache_dir, cache_ttl_days)
+    return cache.open(path).iter_chunks(chunk_size, **engines)
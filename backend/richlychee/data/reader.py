@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import codecs
+import csv
+import importlib.util
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 from richlychee.utils.logging import get_logger
 
@@ -38,32 +44,65 @@ _COLUMN_MAP: dict[str, str] = {
     "상품상태": "product_condition",
 }
 
+# 숫자처럼 보여도 문자열로 다뤄야 하는 코드 컬럼 (CSV는 처음부터 문자열로 읽는다)
+_TEXT_COLUMNS = ("category_id", "seller_managed_code")
+
+# 값 종류가 적고 반복되는 컬럼은 category로 저장해 메모리를 줄인다
+_CATEGORICAL_COLUMNS = (
+    "category_id",
+    "delivery_fee_type",
+    "product_condition",
+    "brand",
+    "manufacturer",
+    "origin_area",
+)
+
+# CSV 인코딩 판별에 읽는 앞부분 크기
+_SNIFF_BYTES = 64 * 1024
+
+EXCEL_ENGINES = ("auto", "calamine", "openpyxl")
+CSV_ENGINES = ("auto", "pyarrow", "pandas")
+
+# auto 선택 기준. calamine과 pyarrow는 파일 전체를 메모리에 올리므로 큰 파일은
+# openpyxl/pandas로 스트리밍하고, 작은 CSV는 pyarrow 스레드 풀을 띄우는 비용이 더
+# 크므로 pandas로 읽는다
+_CALAMINE_MAX_BYTES = 50 * 1024 * 1024
+_ARROW_MIN_BYTES = 1024 * 1024
+_ARROW_MAX_BYTES = 50 * 1024 * 1024
+
+
+def _field_name(column: Any) -> str:
+    """스프레드시트 컬럼명 → 내부 필드명."""
+    column = str(column).strip()
+    # 한글 매핑이 없으면 snake_case로 (이미 snake_case면 그대로)
+    return _COLUMN_MAP.get(column, column.lower().replace(" ", "_"))
+
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """컬럼명을 내부 필드명으로 정규화."""
-    # 공백 제거
-    df.columns = df.columns.str.strip()
-
-    # 한글 매핑 적용
-    rename = {}
-    for col in df.columns:
-        if col in _COLUMN_MAP:
-            rename[col] = _COLUMN_MAP[col]
-        else:
-            # snake_case로 이미 되어있으면 그대로
-            rename[col] = col.lower().replace(" ", "_")
+    return df.rename(columns={col: _field_name(col) for col in df.columns})
 
-    df = df.rename(columns=rename)
-    return df
+
+def _to_text(series: pd.Series) -> pd.Series:
+    """숫자로 읽힌 코드 컬럼을 문자열로 변환.
+
+    빈 칸 때문에 float으로 읽힌 정수 코드가 "123.0"이 되지 않도록 정수로 되돌린다.
+    """
+    present = series.notna()
+    if pd.api.types.is_float_dtype(series):
+        values = series[present]
+        # 2**53을 넘는 값은 float에서 이미 정밀도를 잃었으므로 정수로 되돌리지 않는다
+        if values.mod(1).eq(0).all() and values.abs().lt(2**53).all():
+            series = series.astype("Int64")
+    return series.astype(str).where(present, "")
 
 
 def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """결측값 처리 및 타입 변환."""
     # 문자열이어야 하는 컬럼을 강제 변환 (엑셀에서 숫자로 읽히는 경우 대비)
-    str_force_cols = ["category_id", "seller_managed_code"]
-    for col in str_force_cols:
+    for col in _TEXT_COLUMNS:
         if col in df.columns:
-            df[col] = df[col].astype(str).replace("nan", "")
+            df[col] = _to_text(df[col])
 
     # 문자열 컬럼의 NaN을 빈 문자열로 치환
     str_cols = df.select_dtypes(include=["object", "string"]).columns
@@ -84,21 +123,243 @@ def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
             df["free_condition_amount"].notna(), other=None
         )
 
+    for col in _CATEGORICAL_COLUMNS:
+        if col in df.columns and pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].astype("category")
+
     return df
 
 
-def read_file(path: str | Path) -> pd.DataFrame:
-    """엑셀(.xlsx) 또는 CSV 파일을 읽어 정규화된 DataFrame 반환.
+def _detect_csv_encoding(path: Path) -> str:
+    """CSV 인코딩 판별. 앞부분이 UTF-8로 해석되지 않으면 CP949(엑셀 한글 기본)로 본다."""
+    with open(path, "rb") as f:
+        head = f.read(_SNIFF_BYTES)
+    try:
+        # 잘린 멀티바이트 문자는 오류로 보지 않도록 증분 디코더 사용
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return "cp949"
+    return "utf-8-sig"
+
+
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def _select_excel_engine(path: Path, engine: str) -> str:
+    """엑셀 리더 선택. calamine이 없거나 파일이 크면 openpyxl."""
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"지원하지 않는 엑셀 엔진: {engine} ({', '.join(EXCEL_ENGINES)})")
+    if engine == "openpyxl":
+        return engine
+    if not _module_available("python_calamine"):
+        if engine == "calamine":
+            logger.warning("python-calamine이 설치되지 않아 openpyxl로 읽습니다")
+        return "openpyxl"
+    if engine == "auto" and path.stat().st_size > _CALAMINE_MAX_BYTES:
+        return "openpyxl"
+    return "calamine"
+
+
+def _select_csv_engine(path: Path, engine: str) -> str:
+    """CSV 리더 선택. pyarrow가 없거나 파일이 너무 작거나 크면 pandas."""
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"지원하지 않는 CSV 엔진: {engine} ({', '.join(CSV_ENGINES)})")
+    if engine == "pandas":
+        return engine
+    if not _module_available("pyarrow"):
+        if engine == "pyarrow":
+            logger.warning("pyarrow가 설치되지 않아 pandas로 읽습니다")
+        return "pandas"
+    if engine == "auto" and not _ARROW_MIN_BYTES <= path.stat().st_size <= _ARROW_MAX_BYTES:
+        return "pandas"
+    return "pyarrow"
+
+
+def _convert_excel_cell(cell: Any) -> Any:
+    """openpyxl 셀 값을 pandas.read_excel과 같은 규칙으로 변환."""
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return float("nan")
+    if cell.data_type == TYPE_NUMERIC:
+        val = int(cell.value)
+        return val if val == cell.value else float(cell.value)
+    return cell.value
+
+
+def _convert_calamine_value(value: Any) -> Any:
+    """python-calamine 셀 값을 openpyxl 경로와 같은 규칙으로 변환."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        val = int(value)
+        return val if val == value else value
+    return value
+
+
+def _iter_openpyxl_rows(path: Path) -> Iterator[list[Any]]:
+    """엑셀 첫 시트를 read_only 모드로 한 행씩 읽는다 (메모리 사용량이 파일 크기와 무관)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = wb.worksheets[0]
+        sheet.reset_dimensions()
+        for row in sheet.rows:
+            yield [_convert_excel_cell(cell) for cell in row]
+    finally:
+        wb.close()
+
+
+def _iter_calamine_rows(path: Path) -> Iterator[list[Any]]:
+    """엑셀 첫 시트를 calamine(Rust)으로 읽는다. openpyxl보다 수 배 빠르다."""
+    from python_calamine import CalamineWorkbook
+
+    wb = CalamineWorkbook.from_path(str(path))
+    sheet = wb.get_sheet_by_index(0)
+    for row in sheet.iter_rows():
+        yield [_convert_calamine_value(value) for value in row]
+
+
+def _iter_sheet_chunks(rows: Iterable[list[Any]], chunk_size: int | None) -> Iterator[pd.DataFrame]:
+    """시트 행(첫 비어있지 않은 행이 헤더)을 chunk_size행씩 DataFrame으로 변환."""
+    rows = iter(rows)
+    header: list[Any] = []
+    for row in rows:
+        header = row
+        if any(v != "" for v in header):
+            break
+    while header and header[-1] == "":
+        header.pop()
+    if not header:
+        return
+
+    width = len(header)
+    offset = 0
+    pending: list[list[Any]] = []
+
+    def _parse() -> pd.DataFrame:
+        # read_excel과 같은 파서로 타입 추론 (빈 행은 건너뜀)
+        chunk = TextParser([header, *pending], header=0).read()
+        chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+        return chunk
+
+    # 서식만 있는 빈 행은 뒤에 데이터 행이 올 때만 내보낸다 (read_excel처럼 끝의 빈 행 제거)
+    blank_rows = 0
+    for row in rows:
+        values = row[:width]
+        if all(v == "" for v in values):
+            blank_rows += 1
+            continue
+        values.extend([""] * (width - len(values)))
+        if blank_rows:
+            pending.extend([""] * width for _ in range(blank_rows))
+            blank_rows = 0
+        pending.append(values)
+        if chunk_size and len(pending) >= chunk_size:
+            chunk = _parse()
+            pending.clear()
+            if len(chunk):
+                offset += len(chunk)
+                yield chunk
+
+    chunk = _parse()
+    if len(chunk) or offset == 0:
+        yield chunk
+
+
+def _read_csv_header(path: Path, encoding: str) -> list[str]:
+    with open(path, encoding=encoding, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def _text_columns(header: list[str]) -> list[str]:
+    """숫자처럼 보여도 문자열로 읽어야 하는 원본 컬럼명 (자릿수/앞자리 0 보존)."""
+    return [col for col in header if _field_name(col) in _TEXT_COLUMNS]
+
+
+def _iter_arrow_csv_chunks(
+    path: Path,
+    encoding: str,
+    chunk_size: int | None,
+) -> Iterator[pd.DataFrame]:
+    """pyarrow 멀티스레드 CSV 리더로 파일 전체를 읽어 chunk_size행씩 반환.
+
+    타입 추론은 pyarrow를 따르므로 등록에 쓰지 않는 컬럼은 pandas 엔진과 dtype이
+    다를 수 있다 (예: int64 범위를 넘는 정수는 float). 코드 컬럼은 두 엔진 모두
+    문자열로 읽는다.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    header = _read_csv_header(path, encoding)
+    if not header or len(set(header)) != len(header):
+        # 빈 파일이나 중복 컬럼명은 pandas의 처리 방식(컬럼명 변경 등)을 따른다
+        yield from _iter_pandas_csv_chunks(path, encoding, chunk_size)
+        return
+
+    table = pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(encoding="utf8" if encoding == "utf-8-sig" else encoding),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={col: pa.string() for col in _text_columns(header)},
+            strings_can_be_null=True,
+        ),
+    )
+    # 값이 모두 비어 있는 컬럼은 pandas처럼 float(NaN)으로
+    table = table.cast(pa.schema([
+        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+        for field in table.schema
+    ]))
+
+    step = chunk_size or max(table.num_rows, 1)
+    for offset in range(0, max(table.num_rows, 1), step):
+        chunk = table.slice(offset, step).to_pandas()
+        yield chunk.set_axis(pd.RangeIndex(offset, offset + len(chunk)))
+
+
+def _iter_pandas_csv_chunks(
+    path: Path,
+    encoding: str,
+    chunk_size: int | None,
+) -> Iterator[pd.DataFrame]:
+    dtype = dict.fromkeys(_text_columns(_read_csv_header(path, encoding)), str)
+    if chunk_size:
+        yield from pd.read_csv(path, encoding=encoding, dtype=dtype, chunksize=chunk_size)
+    else:
+        yield pd.read_csv(path, encoding=encoding, dtype=dtype)
+
+
+def iter_file_chunks(
+    path: str | Path,
+    chunk_size: int | None = None,
+    *,
+    excel_engine: str = "auto",
+    csv_engine: str = "auto",
+) -> Iterator[pd.DataFrame]:
+    """엑셀(.xlsx) 또는 CSV 파일을 chunk_size행씩 나눠 정규화된 DataFrame으로 반환.
+
+    파일 전체를 메모리에 올리지 않으므로 메모리 사용량은 청크 크기에 비례한다
+    (calamine/pyarrow 엔진은 예외로 파일 전체를 올리므로 auto는 큰 파일에 쓰지 않는다).
+    각 청크의 인덱스는 파일 전체 기준 행 위치(0부터)로 이어진다. 엑셀 엔진끼리는
+    결과가 같고, CSV는 pyarrow 타입 추론을 따르므로 등록에 쓰지 않는 컬럼의 dtype이
+    pandas 엔진과 다를 수 있다.
 
     Args:
         path: 입력 파일 경로.
+        chunk_size: 청크당 행 수. None이면 파일 전체를 한 청크로 반환.
+        excel_engine: "auto", "calamine", "openpyxl". 설치되지 않은 엔진은 openpyxl로 대체.
+        csv_engine: "auto", "pyarrow", "pandas". 설치되지 않은 엔진은 pandas로 대체.
 
-    Returns:
-        정규화된 DataFrame.
+    Yields:
+        정규화된 DataFrame 청크.
 
     Raises:
         FileNotFoundError: 파일이 존재하지 않을 때.
-        ValueError: 지원하지 않는 파일 형식일 때.
+        ValueError: 지원하지 않는 파일 형식이나 엔진일 때.
     """
     path = Path(path)
 
@@ -108,17 +369,51 @@ def read_file(path: str | Path) -> pd.DataFrame:
     ext = path.suffix.lower()
 
     if ext == ".xlsx":
-        logger.info("엑셀 파일 읽기: %s", path.name)
-        df = pd.read_excel(path, engine="openpyxl")
+        engine = _select_excel_engine(path, excel_engine)
+        logger.info("엑셀 파일 읽기: %s (%s)", path.name, engine)
+        rows = _iter_calamine_rows(path) if engine == "calamine" else _iter_openpyxl_rows(path)
+        chunks = _iter_sheet_chunks(rows, chunk_size)
     elif ext == ".csv":
-        logger.info("CSV 파일 읽기: %s", path.name)
-        df = pd.read_csv(path, encoding="utf-8-sig")
+        engine = _select_csv_engine(path, csv_engine)
+        encoding = _detect_csv_encoding(path)
+        logger.info("CSV 파일 읽기: %s (%s, %s)", path.name, encoding, engine)
+        if engine == "pyarrow":
+            chunks = _iter_arrow_csv_chunks(path, encoding, chunk_size)
+        else:
+            chunks = _iter_pandas_csv_chunks(path, encoding, chunk_size)
     else:
         raise ValueError(f"지원하지 않는 파일 형식: {ext} (.xlsx 또는 .csv만 지원)")
 
-    logger.info("총 %d행 읽음", len(df))
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        chunk = _normalize_columns(chunk)
+        yield _clean_dataframe(chunk)
 
-    df = _normalize_columns(df)
-    df = _clean_dataframe(df)
+    logger.info("총 %d행 읽음", total)
 
-    return df
+
+def read_file(
+    path: str | Path,
+    *,
+    excel_engine: str = "auto",
+    csv_engine: str = "auto",
+) -> pd.DataFrame:
+    """엑셀(.xlsx) 또는 CSV 파일을 읽어 정규화된 DataFrame 반환.
+
+    대용량 파일은 iter_file_chunks로 나눠 읽는다.
+
+    Args:
+        path: 입력 파일 경로.
+        excel_engine: 엑셀 리더 ("auto", "calamine", "openpyxl").
+        csv_engine: CSV 리더 ("auto", "pyarrow", "pandas").
+
+    Returns:
+        정규화된 DataFrame.
+
+    Raises:
+        FileNotFoundError: 파일이 존재하지 않을 때.
+        ValueError: 지원하지 않는 파일 형식일 때.
+    """
+    chunks = list(iter_file_chunks(path, excel_engine=excel_engine, csv_engine=csv_engine))
+    return chunks[0] if chunks else pd.DataFrame()
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import operator
+from collections.abc import Hashable, Iterator
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
+from richlychee.api.products import build_product_body
 from richlychee.data.models import (
     DeliveryFeeType,
     DeliveryInfo,
@@ -172,6 +176,201 @@ def product_row_to_payload(
     )
 
 
+# ProductRow 필드 중 정수형 (나머지는 문자열)
+_INT_FIELDS = frozenset({
+    "sale_price", "stock_quantity", "base_delivery_fee",
+    "free_condition_amount", "return_fee", "exchange_fee",
+})
+_ROW_DEFAULTS: dict[str, Any] = {
+    name: field.default for name, field in ProductRow.model_fields.items()
+    if not field.is_required()
+}
+_NAME_MAX_LENGTH = 100
+_MAX_OPTIONAL_IMAGES = 9
+
+
+def _is_missing(value: Any) -> bool:
+    """pandas 결측값(None/NaN/NA/NaT) 여부."""
+    if value is None or isinstance(value, str):
+        return value is None
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def iter_row_records(df: pd.DataFrame) -> Iterator[tuple[Hashable, dict[str, Any]]]:
+    """DataFrame 행을 (인덱스, {필드: 값}) 형태로 순회.
+
+    iterrows()처럼 행마다 Series를 만들지 않고, ProductRow 필드 컬럼만 꺼낸다.
+    결측값은 row_to_product_row와 마찬가지로 제외된다.
+    """
+    columns = [c for c in df.columns if c in ProductRow.model_fields]
+    for idx, *values in df[columns].itertuples(index=True, name=None):
+        yield idx, {
+            col: val for col, val in zip(columns, values, strict=True) if not _is_missing(val)
+        }
+
+
+def _as_int(value: Any, field: str) -> int:
+    """정수 필드 변환 (int/bool/numpy 정수, 정수값 float, 숫자 문자열).
+
+    pydantic의 lax int처럼 "12.0"같이 정수값인 소수 문자열도 받는다.
+    """
+    try:
+        return operator.index(value)
+    except TypeError:
+        pass
+    if isinstance(value, float) or hasattr(value, "is_integer"):
+        if float(value).is_integer():
+            return int(value)
+    elif isinstance(value, str):
+        text = value.strip()
+        try:
+            # 큰 정수의 자릿수를 잃지 않도록 정수 표기는 float를 거치지 않는다
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            number = float(text)
+        except ValueError:
+            pass
+        else:
+            if number.is_integer():
+                return int(number)
+    raise ValueError(f"{field}: 정수가 아닙니다 ({value!r})")
+
+
+def _as_str(value: Any, field: str) -> str:
+    """문자열 필드 확인 (ProductRow처럼 숫자 등은 거부)."""
+    if not isinstance(value, str):
+        raise ValueError(f"{field}: 문자열이 아닙니다 ({value!r})")
+    return str(value)
+
+
+def _split_values(text: str) -> list[str]:
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+
+def record_to_product_body(
+    record: dict[str, Any],
+    image_url_map: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """행 dict를 pydantic 모델을 거치지 않고 바로 네이버 API 요청 본문으로 변환.
+
+    row_to_product_row → product_row_to_payload → 요청 본문 변환과 같은 결과를
+    만들지만, 검증을 두 번 하고 중첩 모델을 다시 dict로 풀지 않도록 타입 변환과
+    제약 조건 확인을 직접 수행한다. 제약 조건을 어기면 ValueError를 발생시킨다.
+
+    Args:
+        record: iter_row_records가 반환한 행 dict.
+        image_url_map: 로컬 경로 → CDN URL 매핑.
+
+    Returns:
+        register_product에 그대로 넘길 수 있는 요청 본문.
+    """
+    image_url_map = image_url_map or {}
+    row = {**_ROW_DEFAULTS}
+    for field, value in record.items():
+        if field in _INT_FIELDS:
+            row[field] = _as_int(value, field)
+        else:
+            row[field] = _as_str(value, field)
+
+    for field in ("product_name", "category_id", "sale_price"):
+        if field not in row:
+            raise ValueError(f"{field}: 필수 필드가 없습니다")
+
+    name = row["product_name"]
+    sale_price = row["sale_price"]
+    stock_quantity = row["stock_quantity"]
+    if not 1 <= len(name) <= _NAME_MAX_LENGTH:
+        raise ValueError(f"product_name: 길이는 1~{_NAME_MAX_LENGTH}자여야 합니다")
+    if sale_price <= 0:
+        raise ValueError("sale_price: 0보다 커야 합니다")
+    for field in ("stock_quantity", "base_delivery_fee", "return_fee", "exchange_fee"):
+        if row[field] < 0:
+            raise ValueError(f"{field}: 0 이상이어야 합니다")
+
+    # 이미지
+    rep_image = None
+    if row["representative_image"]:
+        url = image_url_map.get(row["representative_image"], row["representative_image"])
+        if _is_url(url):
+            rep_image = url
+
+    opt_images = []
+    for img_path in _parse_image_list(row["optional_images"]):
+        url = image_url_map.get(img_path, img_path)
+        if _is_url(url):
+            opt_images.append(url)
+    if len(opt_images) > _MAX_OPTIONAL_IMAGES:
+        raise ValueError(f"optional_images: 최대 {_MAX_OPTIONAL_IMAGES}장입니다")
+
+    # 옵션 (옵션1 × 옵션2 조합). 조합은 pydantic 경로의 OptionCombination.options처럼
+    # {옵션명: 값}으로 만들어, 옵션1/옵션2 이름이 같으면 옵션2 값만 남는 것까지 같게 한다.
+    option_names: list[str] = []
+    combos: list[dict[str, str]] = [{}]
+    for n in (1, 2):
+        option_name, option_value = row[f"option{n}_name"], row[f"option{n}_value"]
+        if not (option_name and option_value):
+            break
+        option_names.append(option_name)
+        values = _split_values(option_value)
+        combos = [{**combo, option_name: v} for combo in combos for v in values]
+
+    option_combinations = []
+    if option_names:
+        for combo in combos:
+            combo_data: dict[str, Any] = {
+                "stockQuantity": stock_quantity,
+                "price": sale_price,
+                "usable": True,
+            }
+            for i, value in enumerate(combo.values()):
+                combo_data[f"optionName{i + 1}"] = value
+            option_combinations.append(combo_data)
+
+    # 배송 정보
+    fee_type = DeliveryFeeType(row["delivery_fee_type"] or DeliveryFeeType.PAID)
+    free_condition_amount = row["free_condition_amount"] or None
+    if free_condition_amount is not None and free_condition_amount < 0:
+        raise ValueError("free_condition_amount: 0 이상이어야 합니다")
+    if fee_type == DeliveryFeeType.CONDITIONAL_FREE and free_condition_amount is None:
+        raise ValueError("조건부 무료배송 시 free_condition_amount는 필수입니다")
+
+    # 상품 상태
+    condition = ProductCondition.NEW
+    if row["product_condition"]:
+        try:
+            condition = ProductCondition(row["product_condition"].upper())
+        except ValueError:
+            pass
+
+    return build_product_body(
+        name=name,
+        category_id=row["category_id"],
+        sale_price=sale_price,
+        stock_quantity=stock_quantity,
+        detail_content=row["detail_content"],
+        product_condition=condition.value,
+        delivery_fee_type=fee_type.value,
+        base_fee=row["base_delivery_fee"],
+        free_condition_amount=free_condition_amount,
+        return_fee=row["return_fee"],
+        exchange_fee=row["exchange_fee"],
+        representative_image=rep_image,
+        optional_images=opt_images,
+        option_names=option_names,
+        option_combinations=option_combinations,
+        manufacturer=row["manufacturer"],
+        brand=row["brand"],
+        origin_area=row["origin_area"],
+        seller_managed_code=row["seller_managed_code"],
+        seller_tags=_split_values(row["seller_tags"]),
+    )
+
+
 def transform_dataframe(
     df: pd.DataFrame,
     image_url_map: dict[str, str] | None = None,
@@ -215,3 +414,21 @@ def collect_local_images(df: pd.DataFrame) -> list[str]:
                     images.add(img)
 
     return sorted(images)
+
+
+def collect_remote_images(df: pd.DataFrame) -> list[str]:
+    """DataFrame에서 외부 이미지 URL 수집 (크롤링 상품의 재호스팅 대상)."""
+    images: set[str] = set()
+
+    for _, row in df.iterrows():
+        rep = row.get("representative_image", "")
+        if rep and isinstance(rep, str) and _is_url(rep):
+            images.add(rep)
+
+        opt = row.get("optional_images", "")
+        if opt and isinstance(opt, str):
+            for img in _parse_image_list(opt):
+                if _is_url(img):
+                    images.add(img)
+
+    return sorted(images)
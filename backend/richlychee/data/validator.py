@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from richlychee.data.models import DeliveryFeeType, ProductCondition, ProductRow
-from richlychee.data.transformer import _is_local_file, _is_url, _parse_image_list
+from richlychee.data.models import DeliveryFeeType, ProductCondition
+from richlychee.data.transformer import _is_local_file, _parse_image_list
+from richlychee.engine.pool import process_pool
 from richlychee.utils.logging import get_logger
 
 logger = get_logger("data.validator")
@@ -46,167 +49,324 @@ class ValidationResult:
         return len(self.warnings)
 
 
-def _validate_required_fields(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
+_MAX_SALE_PRICE = 999_999_999
+_MAX_OPTIONAL_IMAGES = 9
+_MAX_PRODUCT_NAME_LENGTH = 100
+
+# 한 행 안에서 오류가 쌓이는 순서 (행별 순차 검증과 같은 순서로 보고하기 위함)
+_REQUIRED_FIELDS = {
+    "product_name": "상품명",
+    "category_id": "카테고리 ID",
+    "sale_price": "판매가",
+}
+_ORDER_PRICE = 10
+_ORDER_STOCK = 20
+_ORDER_IMAGES = 30
+_ORDER_DELIVERY_TYPE = 40
+_ORDER_CONDITIONAL_FREE = 41
+_ORDER_CONDITION = 50
+_ORDER_NAME = 60
+
+# 이보다 작은 DataFrame은 프로세스를 나누지 않는다
+_MIN_ROWS_PER_WORKER = 20_000
+
+
+@dataclass
+class _Column:
+    """컬럼 1개를 검증용으로 분해한 배열.
+
+    셀 값의 파이썬 타입에 따라 검사 여부가 달라지므로(예: 숫자가 아닌 판매가는
+    범위 검사 생략) 타입 판별 결과를 마스크로 둔다.
+    """
+
+    is_none: np.ndarray
+    is_str: np.ndarray
+    is_num: np.ndarray  # int/float 값 (bool 포함)
+    num: np.ndarray  # 숫자가 아니면 NaN
+    text: pd.Series  # 문자열이 아니면 ""
+
+    @property
+    def is_nan(self) -> np.ndarray:
+        return self.is_num & np.isnan(self.num)
+
+
+def _column(df: pd.DataFrame, name: str, default: object = None) -> _Column:
+    """df[name]을 _Column으로 변환. 컬럼이 없으면 모든 행이 default인 것으로 본다."""
+    n = len(df)
+    if name not in df.columns:
+        values = np.empty(n, dtype=object)
+        values[:] = [default] * n
+        return _column_from_objects(values, df.index)
+
+    series = df[name]
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return _Column(
+            is_none=np.zeros(n, dtype=bool),
+            is_str=np.zeros(n, dtype=bool),
+            is_num=np.ones(n, dtype=bool),
+            num=series.to_numpy(dtype=float, na_value=np.nan),
+            text=pd.Series("", index=df.index, dtype=object),
+        )
+
+    if isinstance(series.dtype, pd.StringDtype):
+        present = series.notna().to_numpy()
+        # na_value가 NaN인 문자열 컬럼의 결측값은 float NaN으로 취급
+        missing_is_nan = series.dtype.na_value is np.nan
+        return _Column(
+            is_none=np.zeros(n, dtype=bool),
+            is_str=present,
+            is_num=~present if missing_is_nan else np.zeros(n, dtype=bool),
+            num=np.full(n, np.nan),
+            text=series.astype(object).where(present, ""),
+        )
+
+    return _column_from_objects(series.to_numpy(dtype=object), df.index)
+
+
+def _column_from_objects(values: np.ndarray, index: pd.Index) -> _Column:
+    n = len(values)
+    is_none = np.fromiter((v is None for v in values), dtype=bool, count=n)
+    is_str = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=n)
+    is_num = np.fromiter((isinstance(v, (int, float)) for v in values), dtype=bool, count=n)
+    num = np.full(n, np.nan)
+    if is_num.any():
+        num[is_num] = values[is_num].astype(float)
+    text = pd.Series(np.where(is_str, values, ""), index=index, dtype=object)
+    return _Column(is_none=is_none, is_str=is_str, is_num=is_num, num=num, text=text)
+
+
+class _Collector:
+    """검증 결과를 (행 위치, 검사 순서) 기준으로 모았다가 정렬해 반환."""
+
+    def __init__(self, row_numbers: np.ndarray) -> None:
+        self._row_numbers = row_numbers
+        self.errors: list[tuple[int, int, ValidationError]] = []
+        self.warnings: list[tuple[int, int, ValidationError]] = []
+
+    def add_errors(self, mask: np.ndarray, order: int, field: str, message) -> None:
+        """mask가 True인 행마다 오류 추가. message는 문자열 또는 (행 위치 → 문자열) 함수."""
+        for pos in np.flatnonzero(mask):
+            text = message(pos) if callable(message) else message
+            self.add(self.errors, pos, order, field, text)
+
+    def add(self, target: list, pos: int, order: int, field: str, message: str) -> None:
+        error = ValidationError(row=int(self._row_numbers[pos]), field=field, message=message)
+        target.append((pos, order, error))
+
+    def into(self, result: ValidationResult) -> None:
+        result.errors.extend(e for _, _, e in sorted(self.errors, key=lambda x: (x[0], x[1])))
+        result.warnings.extend(w for _, _, w in sorted(self.warnings, key=lambda x: (x[0], x[1])))
+
+
+def _check_required_fields(df: pd.DataFrame, out: _Collector) -> None:
     """필수 필드 검증."""
-    required = {
-        "product_name": "상품명",
-        "category_id": "카테고리 ID",
-        "sale_price": "판매가",
-    }
-
-    for field_name, label in required.items():
-        val = row.get(field_name)
-        if val is None or (isinstance(val, str) and not val.strip()) or (isinstance(val, (int, float)) and pd.isna(val)):
-            result.errors.append(
-                ValidationError(row=row_idx, field=field_name, message=f"{label}은(는) 필수입니다")
-            )
+    for order, (field_name, label) in enumerate(_REQUIRED_FIELDS.items()):
+        col = _column(df, field_name)
+        blank = col.is_str & (col.text.str.strip() == "").to_numpy()
+        out.add_errors(
+            col.is_none | blank | col.is_nan, order, field_name, f"{label}은(는) 필수입니다"
+        )
 
 
-def _validate_price(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
+def _check_price(df: pd.DataFrame, out: _Collector) -> None:
     """가격 검증."""
-    price = row.get("sale_price", 0)
-    if isinstance(price, (int, float)) and not pd.isna(price):
-        if price <= 0:
-            result.errors.append(
-                ValidationError(row=row_idx, field="sale_price", message="판매가는 0보다 커야 합니다")
-            )
-        if price > 999_999_999:
-            result.errors.append(
-                ValidationError(row=row_idx, field="sale_price", message="판매가가 허용 범위를 초과합니다")
-            )
+    price = _column(df, "sale_price", 0)
+    valid = price.is_num & ~np.isnan(price.num)
+    with np.errstate(invalid="ignore"):
+        out.add_errors(
+            valid & (price.num <= 0), _ORDER_PRICE, "sale_price", "판매가는 0보다 커야 합니다"
+        )
+        out.add_errors(
+            valid & (price.num > _MAX_SALE_PRICE),
+            _ORDER_PRICE,
+            "sale_price",
+            "판매가가 허용 범위를 초과합니다",
+        )
 
 
-def _validate_stock(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
+def _check_stock(df: pd.DataFrame, out: _Collector) -> None:
     """재고 검증."""
-    stock = row.get("stock_quantity", 0)
-    if isinstance(stock, (int, float)) and not pd.isna(stock):
-        if stock < 0:
-            result.errors.append(
-                ValidationError(row=row_idx, field="stock_quantity", message="재고 수량은 0 이상이어야 합니다")
+    stock = _column(df, "stock_quantity", 0)
+    with np.errstate(invalid="ignore"):
+        negative = stock.is_num & ~np.isnan(stock.num) & (stock.num < 0)
+    out.add_errors(negative, _ORDER_STOCK, "stock_quantity", "재고 수량은 0 이상이어야 합니다")
+
+
+def _check_images(df: pd.DataFrame, out: _Collector) -> None:
+    """이미지 검증. 같은 셀 값은 한 번만 파싱하고, 파일 존재 여부도 경로별로 한 번만 확인한다."""
+    exists: dict[str, bool] = {}
+
+    def _missing_local(path: str) -> bool:
+        if path not in exists:
+            exists[path] = not _is_local_file(path) or Path(path).exists()
+        return not exists[path]
+
+    rep = _column(df, "representative_image", "")
+    rep_text = rep.text.to_numpy()
+    for pos in np.flatnonzero(rep.is_str & (rep.text.str.strip() != "").to_numpy()):
+        if _missing_local(rep_text[pos]):
+            out.add(
+                out.warnings, pos, 0, "representative_image",
+                f"로컬 이미지 파일이 존재하지 않습니다: {rep_text[pos]}",
             )
 
-
-def _validate_images(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
-    """이미지 검증."""
-    rep_image = row.get("representative_image", "")
-    if rep_image and isinstance(rep_image, str) and rep_image.strip():
-        if _is_local_file(rep_image) and not Path(rep_image).exists():
-            result.warnings.append(
-                ValidationError(
-                    row=row_idx,
-                    field="representative_image",
-                    message=f"로컬 이미지 파일이 존재하지 않습니다: {rep_image}",
-                )
-            )
-
-    opt_images = row.get("optional_images", "")
-    if opt_images and isinstance(opt_images, str):
-        images = _parse_image_list(opt_images)
-        if len(images) > 9:
-            result.errors.append(
-                ValidationError(
-                    row=row_idx,
-                    field="optional_images",
-                    message=f"추가 이미지는 최대 9장입니다 (현재 {len(images)}장)",
-                )
-            )
-        for img in images:
-            if _is_local_file(img) and not Path(img).exists():
-                result.warnings.append(
-                    ValidationError(
-                        row=row_idx,
-                        field="optional_images",
-                        message=f"로컬 이미지 파일이 존재하지 않습니다: {img}",
-                    )
-                )
-
-
-def _validate_delivery(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
-    """배송 정보 검증."""
-    fee_type = row.get("delivery_fee_type", "PAID")
-    if fee_type and isinstance(fee_type, str) and fee_type.strip():
-        try:
-            DeliveryFeeType(fee_type.strip().upper())
-        except ValueError:
-            result.errors.append(
-                ValidationError(
-                    row=row_idx,
-                    field="delivery_fee_type",
-                    message=f"유효하지 않은 배송비 유형: {fee_type} (FREE, PAID, CONDITIONAL_FREE)",
-                )
+    opt = _column(df, "optional_images", "")
+    opt_text = opt.text.to_numpy()
+    # 셀 값 → (이미지 수, 존재하지 않는 로컬 이미지 목록)
+    parsed: dict[str, tuple[int, list[str]]] = {}
+    for pos in np.flatnonzero(opt.is_str & (opt.text != "").to_numpy()):
+        value = opt_text[pos]
+        if value not in parsed:
+            images = _parse_image_list(value)
+            parsed[value] = (len(images), [img for img in images if _missing_local(img)])
+        count, missing = parsed[value]
+        if count > _MAX_OPTIONAL_IMAGES:
+            out.add(
+                out.errors, pos, _ORDER_IMAGES, "optional_images",
+                f"추가 이미지는 최대 {_MAX_OPTIONAL_IMAGES}장입니다 (현재 {count}장)",
             )
-
-    if fee_type and str(fee_type).strip().upper() == "CONDITIONAL_FREE":
-        cond_amount = row.get("free_condition_amount")
-        if cond_amount is None or (isinstance(cond_amount, float) and pd.isna(cond_amount)):
-            result.errors.append(
-                ValidationError(
-                    row=row_idx,
-                    field="free_condition_amount",
-                    message="조건부 무료배송 시 무료배송 조건 금액은 필수입니다",
-                )
+        for img in missing:
+            out.add(
+                out.warnings, pos, 1, "optional_images",
+                f"로컬 이미지 파일이 존재하지 않습니다: {img}",
             )
 
 
-def _validate_product_condition(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
-    """상품 상태 검증."""
-    condition = row.get("product_condition", "NEW")
-    if condition and isinstance(condition, str) and condition.strip():
-        try:
-            ProductCondition(condition.strip().upper())
-        except ValueError:
-            result.errors.append(
-                ValidationError(
-                    row=row_idx,
-                    field="product_condition",
-                    message=f"유효하지 않은 상품 상태: {condition} (NEW, USED, REFURBISHED)",
-                )
-            )
+def _check_delivery(df: pd.DataFrame, out: _Collector) -> None:
+    """배송 정보 검증."""
+    fee_type = _column(df, "delivery_fee_type", "PAID")
+    normalized = fee_type.text.str.strip().str.upper()
+    present = fee_type.is_str & (normalized != "").to_numpy()
+    known = normalized.isin([t.value for t in DeliveryFeeType]).to_numpy()
+    raw = fee_type.text.to_numpy()
+    out.add_errors(
+        present & ~known,
+        _ORDER_DELIVERY_TYPE,
+        "delivery_fee_type",
+        lambda pos: f"유효하지 않은 배송비 유형: {raw[pos]} (FREE, PAID, CONDITIONAL_FREE)",
+    )
+
+    is_conditional = (normalized == DeliveryFeeType.CONDITIONAL_FREE.value).to_numpy()
+    conditional = fee_type.is_str & is_conditional
+    if conditional.any():
+        amount = _column(df, "free_condition_amount")
+        missing = amount.is_none | (amount.is_num & np.isnan(amount.num))
+        out.add_errors(
+            conditional & missing,
+            _ORDER_CONDITIONAL_FREE,
+            "free_condition_amount",
+            "조건부 무료배송 시 무료배송 조건 금액은 필수입니다",
+        )
 
 
-def _validate_product_name(row_idx: int, row: pd.Series, result: ValidationResult) -> None:
+def _check_product_condition(df: pd.DataFrame, out: _Collector) -> None:
+    """상품 상태 검증."""
+    condition = _column(df, "product_condition", "NEW")
+    normalized = condition.text.str.strip().str.upper()
+    present = condition.is_str & (normalized != "").to_numpy()
+    known = normalized.isin([c.value for c in ProductCondition]).to_numpy()
+    raw = condition.text.to_numpy()
+    out.add_errors(
+        present & ~known,
+        _ORDER_CONDITION,
+        "product_condition",
+        lambda pos: f"유효하지 않은 상품 상태: {raw[pos]} (NEW, USED, REFURBISHED)",
+    )
+
+
+def _check_product_name(df: pd.DataFrame, out: _Collector) -> None:
     """상품명 길이 검증."""
-    name = row.get("product_name", "")
-    if isinstance(name, str) and len(name) > 100:
-        result.errors.append(
-            ValidationError(
-                row=row_idx,
-                field="product_name",
-                message=f"상품명은 100자 이내여야 합니다 (현재 {len(name)}자)",
-            )
-        )
+    name = _column(df, "product_name", "")
+    lengths = name.text.str.len().to_numpy()
+    out.add_errors(
+        name.is_str & (lengths > _MAX_PRODUCT_NAME_LENGTH),
+        _ORDER_NAME,
+        "product_name",
+        lambda pos: (
+            f"상품명은 {_MAX_PRODUCT_NAME_LENGTH}자 이내여야 합니다 (현재 {lengths[pos]}자)"
+        ),
+    )
+
+
+_CHECKS = (
+    _check_required_fields,
+    _check_price,
+    _check_stock,
+    _check_images,
+    _check_delivery,
+    _check_product_condition,
+    _check_product_name,
+)
+
+
+def _validate_chunk(df: pd.DataFrame) -> ValidationResult:
+    """DataFrame(또는 그 일부)을 컬럼 단위로 검증."""
+    result = ValidationResult()
+    row_numbers = np.fromiter((int(idx) + 2 for idx in df.index), dtype=np.int64, count=len(df))
+    out = _Collector(row_numbers)  # 엑셀 행 번호 (헤더=1행)
+    for check in _CHECKS:
+        check(df, out)
+    out.into(result)
+    return result
 
 
-def validate_dataframe(df: pd.DataFrame) -> ValidationResult:
+def validate_dataframe(df: pd.DataFrame, *, workers: int = 1) -> ValidationResult:
     """DataFrame 전체를 검증.
 
+    행마다 검사하지 않고 컬럼 전체에 대한 마스크로 검사하며, 결과는 행 번호 →
+    검사 항목 순서로 정렬되어 행별로 검사한 것과 같은 순서로 보고된다.
+
     Args:
         df: 정규화된 DataFrame.
+        workers: 검증 프로세스 수. 2 이상이고 행이 충분히 많으면 행을 나눠 병렬 검증.
 
     Returns:
         ValidationResult 객체.
     """
-    result = ValidationResult()
+    return validate_chunks([df], workers=workers)
+
+
+def validate_chunks(chunks: Iterable[pd.DataFrame], *, workers: int = 1) -> ValidationResult:
+    """iter_file_chunks가 반환한 청크를 차례로 검증해 결과를 합친다.
+
+    청크 인덱스가 파일 전체 기준 행 위치이므로 행 번호는 전체 파일 기준으로 보고된다.
+
+    Args:
+        chunks: 정규화된 DataFrame 청크들.
+        workers: 청크별 검증 프로세스 수 (validate_dataframe 참고).
 
-    if df.empty:
+    Returns:
+        ValidationResult 객체.
+    """
+    result = ValidationResult()
+    total_rows = 0
+
+    for df in chunks:
+        if df.empty:
+            continue
+        total_rows += len(df)
+
+        parts = min(workers, len(df) // _MIN_ROWS_PER_WORKER)
+        if parts <= 1:
+            partials = [_validate_chunk(df)]
+        else:
+            bounds = np.linspace(0, len(df), parts + 1, dtype=int)
+            pieces = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+            with process_pool(parts) as executor:
+                partials = list(executor.map(_validate_chunk, pieces))
+
+        for partial in partials:
+            result.errors.extend(partial.errors)
+            result.warnings.extend(partial.warnings)
+
+    if total_rows == 0:
         result.errors.append(
             ValidationError(row=0, field="", message="데이터가 비어있습니다")
         )
         return result
 
-    for idx, row in df.iterrows():
-        row_num = int(idx) + 2  # 엑셀 행 번호 (헤더=1행)
-
-        _validate_required_fields(row_num, row, result)
-        _validate_price(row_num, row, result)
-        _validate_stock(row_num, row, result)
-        _validate_images(row_num, row, result)
-        _validate_delivery(row_num, row, result)
-        _validate_product_condition(row_num, row, result)
-        _validate_product_name(row_num, row, result)
-
     if result.is_valid:
-        logger.info("검증 통과: %d개 행, 경고 %d건", len(df), result.total_warnings)
+        logger.info("검증 통과: %d개 행, 경고 %d건", total_rows, result.total_warnings)
     else:
         logger.error(
             "검증 실패: 오류 %d건, 경고 %d건",
@@ -0,0 +1,82 @@
+"""순서 보장 워커 풀 (동시 등록용)."""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    concurrency: int = 1,
+    should_stop: Callable[[], bool] | None = None,
+) -> Iterator[tuple[T, R]]:
+    """항목을 최대 concurrency개 스레드로 처리하고 입력 순서대로 결과를 반환.
+
+    실행 대기 중인 작업은 concurrency의 2배까지만 유지하므로 입력 크기와 무관하게
+    메모리 사용량이 일정하다. should_stop이 True를 반환하면 새 작업 제출을 멈추고,
+    제출했지만 아직 시작하지 않은 작업은 취소한 뒤 실행 중이던 작업의 결과만 마저
+    반환한다.
+
+    Args:
+        fn: 항목 1개를 처리하는 함수 (스레드에서 호출됨).
+        items: 처리할 항목.
+        concurrency: 동시 실행 스레드 수. 1 이하이면 현재 스레드에서 순차 실행.
+        should_stop: 새 작업 제출 전 호출되는 중단 판별 함수 (호출자 스레드에서 실행).
+
+    Yields:
+        (항목, 처리 결과) 튜플.
+    """
+    if concurrency <= 1:
+        for item in items:
+            if should_stop is not None and should_stop():
+                return
+            yield item, fn(item)
+        return
+
+    max_pending = concurrency * 2
+    iterator = iter(items)
+    exhausted = False
+    pending: deque[tuple[T, Future[R]]] = deque()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="richlychee") as executor:
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                if should_stop is not None and should_stop():
+                    exhausted = True
+                    for _, pending_future in pending:
+                        pending_future.cancel()
+                    break
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, executor.submit(fn, item)))
+
+            if not pending:
+                return
+
+            item, future = pending.popleft()
+            if future.cancelled():
+                continue
+            yield item, future.result()
+
+
+def process_pool(workers: int) -> Executor:
+    """CPU 작업용 프로세스 풀 생성.
+
+    데몬 프로세스(Celery prefork 워커)는 자식 프로세스를 만들 수 없으므로
+    이때는 스레드 풀을 반환한다.
+    """
+    if multiprocessing.current_process().daemon:
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="richlychee-cpu")
+    return ProcessPoolExecutor(max_workers=workers)
@@ -2,30 +2,50 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from typing import Any
+
 import pandas as pd
 import requests
 from rich.console import Console
 from tqdm import tqdm
 
 from richlychee.api.client import NaverCommerceClient
+from richlychee.api.image_cache import is_image_error, open_image_cache, payload_image_urls
 from richlychee.api.images import upload_images_batch
 from richlychee.api.products import register_product
 from richlychee.auth.session import AuthSession
 from richlychee.config import Settings
-from richlychee.data.reader import read_file
+from richlychee.data.parsed_cache import iter_cached_chunks
 from richlychee.data.transformer import (
     collect_local_images,
-    product_row_to_payload,
-    row_to_product_row,
+    iter_row_records,
+    record_to_product_body,
     transform_dataframe,
 )
-from richlychee.data.validator import validate_dataframe
+from richlychee.data.validator import validate_chunks
+from richlychee.engine.pool import run_ordered
 from richlychee.engine.result import ProductResult, RegistrationReport
 from richlychee.utils.logging import get_logger
 
 logger = get_logger("engine.runner")
 
 
+class _ChunkScan:
+    """청크를 그대로 넘기면서 행 수와 업로드할 로컬 이미지를 모은다."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.local_images: set[str] = set()
+
+    def __call__(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        for chunk in chunks:
+            self.rows += len(chunk)
+            self.local_images.update(collect_local_images(chunk))
+            yield chunk
+
+
 class RegistrationRunner:
     """대량 상품 등록 오케스트레이터."""
 
@@ -34,6 +54,7 @@ class RegistrationRunner:
         self._console = Console()
         self._auth = AuthSession(settings)
         self._client = NaverCommerceClient(settings, self._auth)
+        self._image_cache = open_image_cache(settings.image_cache, settings.naver_client_id)
 
     def run(
         self,
@@ -52,14 +73,11 @@ class RegistrationRunner:
         """
         report = RegistrationReport()
 
-        # 1. 파일 읽기
-        self._console.print("[bold]1단계:[/bold] 파일 읽기...")
-        df = read_file(file_path)
-        self._console.print(f"  총 {len(df)}행 읽음")
-
-        # 2. 사전 검증
-        self._console.print("[bold]2단계:[/bold] 데이터 검증...")
-        validation = validate_dataframe(df)
+        # 1. 파일 읽기 + 사전 검증 (파일 전체를 올리지 않고 청크 단위로 처리)
+        self._console.print("[bold]1단계:[/bold] 파일 읽기 + 데이터 검증...")
+        scan = _ChunkScan()
+        validation = validate_chunks(scan(self._read_chunks(file_path)))
+        self._console.print(f"  총 {scan.rows}행 읽음")
 
         if not validation.is_valid:
             self._console.print(f"  [red]검증 실패: 오류 {validation.total_errors}건[/red]")
@@ -80,86 +98,68 @@ class RegistrationRunner:
         if dry_run:
             self._console.print("\n[bold yellow]--dry-run 모드: API 호출 없이 종료[/bold yellow]")
             # dry-run에서는 변환만 테스트
-            payloads = transform_dataframe(df)
-            self._console.print(f"  {len(payloads)}개 상품 페이로드 생성 확인")
+            payload_count = sum(
+                len(transform_dataframe(chunk)) for chunk in self._read_chunks(file_path)
+            )
+            self._console.print(f"  {payload_count}개 상품 페이로드 생성 확인")
             report.finish()
             return report
 
-        # 3. 이미지 업로드
-        self._console.print("[bold]3단계:[/bold] 이미지 업로드...")
-        local_images = collect_local_images(df)
+        # 2. 이미지 업로드
+        self._console.print("[bold]2단계:[/bold] 이미지 업로드...")
+        local_images = sorted(scan.local_images)
 
         image_url_map: dict[str, str] = {}
         if local_images:
             self._console.print(f"  {len(local_images)}개 로컬 이미지 업로드 중...")
-            image_url_map = upload_images_batch(self._client, local_images)
+            image_url_map = upload_images_batch(
+                self._client, local_images, cache=self._image_cache
+            )
             self._console.print(f"  {len(image_url_map)}개 업로드 완료")
         else:
             self._console.print("  업로드할 로컬 이미지 없음")
 
-        # 4. 상품 등록
-        self._console.print("[bold]4단계:[/bold] 상품 등록...")
-
-        for idx, raw_row in tqdm(df.iterrows(), total=len(df), desc="상품 등록"):
-            row_num = int(idx) + 2
-
-            try:
-                row = row_to_product_row(raw_row)
-                payload = product_row_to_payload(row, image_url_map)
-                result = register_product(self._client, payload)
-
-                product_id = (
-                    result.get("smartstoreChannelProduct", {}).get("channelProductNo")
-                )
-                report.add(
-                    ProductResult(
-                        row_index=row_num,
-                        product_name=payload.name,
-                        success=True,
-                        product_id=str(product_id) if product_id else None,
-                        api_response=result,
-                    )
-                )
-
-            except requests.HTTPError as e:
-                error_msg = str(e)
-                try:
-                    error_body = e.response.json() if e.response is not None else {}
-                    error_msg = error_body.get("message", str(e))
-                except Exception:
-                    pass
-
-                logger.error("행 %d 등록 실패: %s", row_num, error_msg)
-                report.add(
-                    ProductResult(
-                        row_index=row_num,
-                        product_name=raw_row.get("product_name", ""),
-                        success=False,
-                        error_message=error_msg,
-                    )
-                )
-
-                if self._settings.registration.stop_on_error:
+        # 3. 상품 등록 (파일을 다시 청크 단위로 읽으며 등록)
+        concurrency = max(1, self._settings.registration.concurrency)
+        if concurrency > 1:
+            self._console.print(f"[bold]3단계:[/bold] 상품 등록 (동시 {concurrency}개)...")
+        else:
+            self._console.print("[bold]3단계:[/bold] 상품 등록...")
+
+        stop_requested = False
+
+        def _should_stop() -> bool:
+            return stop_requested
+
+        def _register(item: tuple[int, dict]) -> ProductResult:
+            idx, record = item
+            return self._register_row(int(idx) + 2, record, image_url_map)
+
+        results = run_ordered(
+            _register,
+            chain.from_iterable(
+                iter_row_records(chunk) for chunk in self._read_chunks(file_path)
+            ),
+            concurrency=concurrency,
+            should_stop=_should_stop,
+        )
+        for _, result in tqdm(results, total=scan.rows, desc="상품 등록"):
+            report.add(result)
+
+            if not result.success and self._settings.registration.stop_on_error:
+                if not stop_requested:
                     logger.error("stop_on_error=True — 등록 중단")
-                    break
-
-            except Exception as e:
-                logger.error("행 %d 처리 중 예외: %s", row_num, e)
-                report.add(
-                    ProductResult(
-                        row_index=row_num,
-                        product_name=raw_row.get("product_name", ""),
-                        success=False,
-                        error_message=str(e),
-                    )
-                )
-
-                if self._settings.registration.stop_on_error:
-                    break
+                stop_requested = True
 
         report.finish()
 
-        # 5. 결과 리포트
+        if self._settings.rate_limit.adaptive:
+            self._console.print(
+                f"  최종 레이트: {self._client.rate_limiter.rate:.2f} rps "
+                f"(설정 {self._settings.rate_limit.requests_per_second} rps)"
+            )
+
+        # 4. 결과 리포트
         self._console.print()
         report.print_summary(self._console)
 
@@ -168,17 +168,88 @@ class RegistrationRunner:
 
         return report
 
+    def _read_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """파일을 청크 단위로 읽는다. 검증 단계에서 파싱한 결과는 등록 단계에서 캐시로 재사용."""
+        reader = self._settings.reader
+        cache_dir = reader.cache_dir if reader.cache_enabled else None
+        return iter_cached_chunks(
+            file_path,
+            reader.chunk_size,
+            cache_dir,
+            cache_ttl_days=reader.cache_ttl_days,
+            excel_engine=reader.excel_engine,
+            csv_engine=reader.csv_engine,
+        )
+
+    def _register_row(
+        self,
+        row_num: int,
+        record: dict[str, Any],
+        image_url_map: dict[str, str],
+    ) -> ProductResult:
+        """단일 행 변환 + 등록. 워커 스레드에서 호출될 수 있다.
+
+        Returns:
+            등록 결과 (예외는 실패 결과로 변환).
+        """
+        body = None
+        try:
+            # 검증을 통과한 행이므로 pydantic 모델을 거치지 않고 바로 요청 본문을 만든다
+            body = record_to_product_body(record, image_url_map)
+            result = register_product(self._client, body)
+
+            product_id = (
+                result.get("smartstoreChannelProduct", {}).get("channelProductNo")
+            )
+            return ProductResult(
+                row_index=row_num,
+                product_name=body["originProduct"]["name"],
+                success=True,
+                product_id=str(product_id) if product_id else None,
+                api_response=result,
+            )
+
+        except requests.HTTPError as e:
+            error_msg = str(e)
+            error_body: dict = {}
+            try:
+                error_body = e.response.json() if e.response is not None else {}
+                error_msg = error_body.get("message", str(e))
+            except Exception:
+                pass
+
+            # 캐시된 CDN URL이 더 이상 유효하지 않으면 다음 실행에서 다시 업로드
+            if self._image_cache is not None and body is not None and is_image_error(error_body):
+                self._image_cache.discard_urls(payload_image_urls(body))
+
+            logger.error("행 %d 등록 실패: %s", row_num, error_msg)
+            return ProductResult(
+                row_index=row_num,
+                product_name=record.get("product_name", ""),
+                success=False,
+                error_message=error_msg,
+            )
+
+        except Exception as e:
+            logger.error("행 %d 처리 중 예외: %s", row_num, e)
+            return ProductResult(
+                row_index=row_num,
+                product_name=record.get("product_name", ""),
+                success=False,
+                error_message=str(e),
+            )
+
     def validate_only(self, file_path: str) -> bool:
         """파일 검증만 수행.
 
         Returns:
             검증 통과 여부.
         """
-        df = read_file(file_path)
-        result = validate_dataframe(df)
+        scan = _ChunkScan()
+        result = validate_chunks(scan(self._read_chunks(file_path)))
 
         if result.is_valid:
-            self._console.print(f"[green]검증 통과:[/green] {len(df)}개 행")
+            self._console.print(f"[green]검증 통과:[/green] {scan.rows}개 행")
         else:
             self._console.print(f"[red]검증 실패:[/red] 오류 {result.total_errors}건")
             for err in result.errors:
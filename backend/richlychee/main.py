@@ -8,6 +8,17 @@ import sys
 from richlychee import __version__
 
 
+def _positive_int(value: str) -> int:
+    """1 이상의 정수 인자."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="richlychee",
@@ -30,6 +41,13 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="검증만 수행 (API 호출 없음)",
     )
+    reg_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help="동시 등록 워커 수 (기본: settings.yaml의 registration.concurrency)",
+    )
 
     # validate
     val_parser = subparsers.add_parser("validate", help="입력 파일 검증")
@@ -60,6 +78,9 @@ def main(argv: list[str] | None = None) -> int:
 
     settings = get_settings()
 
+    if getattr(args, "concurrency", None) is not None:
+        settings.registration.concurrency = args.concurrency
+
     # 엔진 생성
     from richlychee.engine.runner import RegistrationRunner
 
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
+from typing import TYPE_CHECKING
+
+from richlychee.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from richlychee.config import RateLimitSettings
+
+logger = get_logger("utils.rate_limiter")
 
 
 class TokenBucketRateLimiter:
@@ -19,15 +28,60 @@ class TokenBucketRateLimiter:
         self.burst = burst or int(rate)
         self._tokens = float(self.burst)
         self._last_refill = time.monotonic()
+        self._paused_until = 0.0
         self._lock = threading.Lock()
 
+    def _try_consume(self) -> float:
+        """토큰 1개 소비 시도. 성공하면 0, 부족하면 필요한 대기 시간(초)을 반환."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+
+            # 토큰 1개 충전에 필요한 대기 시간
+            return (1.0 - self._tokens) / self.rate
+
+    async def _try_consume_async(self) -> float:
+        """acquire_async용 _try_consume. 로컬 버킷은 잠깐 락만 잡으므로 그대로 호출한다."""
+        return self._try_consume()
+
     def _refill(self) -> None:
         """경과 시간에 비례해 토큰 보충."""
         now = time.monotonic()
-        elapsed = now - self._last_refill
+        # 일시정지 중에는 pause가 _last_refill을 해제 시점으로 옮겨 두므로 보충하지 않는다
+        elapsed = max(0.0, now - self._last_refill)
+        if elapsed == 0.0:
+            return
         self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
         self._last_refill = now
 
+    def pause(self, seconds: float) -> None:
+        """버킷을 공유하는 모든 호출자의 토큰 발급을 seconds초 동안 중지.
+
+        일시정지가 끝난 직후 버스트가 몰리지 않도록 남은 토큰도 비운다.
+        """
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            if until > self._paused_until:
+                self._paused_until = until
+            self._tokens = 0.0
+            self._last_refill = self._paused_until
+
+    def on_success(self) -> None:
+        """요청 성공 피드백. 고정 레이트 리미터에서는 아무것도 하지 않는다."""
+
+    def on_throttle(self, retry_after: float) -> None:
+        """429 응답 피드백. Retry-After 동안 버킷 전체를 일시정지."""
+        self.pause(retry_after)
+
+    def on_server_error(self) -> None:
+        """5xx 응답 피드백. 고정 레이트 리미터에서는 아무것도 하지 않는다."""
+
     def acquire(self, timeout: float | None = None) -> bool:
         """토큰 1개를 소비. 부족하면 대기 후 재시도.
 
@@ -40,14 +94,9 @@ class TokenBucketRateLimiter:
         deadline = None if timeout is None else time.monotonic() + timeout
 
         while True:
-            with self._lock:
-                self._refill()
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return True
-
-                # 토큰 1개 충전에 필요한 대기 시간
-                wait = (1.0 - self._tokens) / self.rate
+            wait = self._try_consume()
+            if wait <= 0:
+                return True
 
             if deadline is not None:
                 remaining = deadline - time.monotonic()
@@ -60,3 +109,165 @@ class TokenBucketRateLimiter:
     def wait(self) -> None:
         """토큰을 획득할 때까지 무제한 대기."""
         self.acquire(timeout=None)
+
+    async def acquire_async(self, timeout: float | None = None) -> bool:
+        """acquire의 asyncio 버전. 대기 중 이벤트 루프를 막지 않는다.
+
+        동기 acquire와 같은 버킷을 공유하므로 스레드/코루틴 호출자를 함께 제한한다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            wait = await self._try_consume_async()
+            if wait <= 0:
+                return True
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+
+            await asyncio.sleep(wait)
+
+    async def wait_async(self) -> None:
+        """토큰을 획득할 때까지 비동기로 무제한 대기."""
+        await self.acquire_async(timeout=None)
+
+
+class AdaptiveRateLimiter(TokenBucketRateLimiter):
+    """429/5xx 피드백으로 레이트를 조정하는 AIMD 토큰 버킷.
+
+    스로틀/서버 오류 시 레이트를 decrease_factor배로 줄이고, 성공 시
+    초당 약 increase_step만큼 선형으로 늘려 max_rate까지 회복한다.
+    동시 요청들의 429가 한꺼번에 들어와도 레이트가 과도하게 떨어지지 않도록
+    감소는 cooldown초에 한 번만 적용한다.
+
+    Args:
+        rate: 시작 레이트이자 최대 레이트 (초당 요청 수).
+        burst: 최대 버스트 허용량.
+        min_rate: 최소 레이트.
+        decrease_factor: 감소 배율 (0~1).
+        increase_step: 초당 레이트 증가량.
+        cooldown: 연속 감소 사이 최소 간격(초).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.5,
+        cooldown: float = 1.0,
+    ) -> None:
+        super().__init__(rate, burst)
+        self.max_rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.cooldown = cooldown
+        self._last_decrease = 0.0
+        self._last_logged_rate = self.max_rate
+
+    def _decrease(self, reason: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._refill()
+            old = self.rate
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._last_decrease = now
+            self._last_logged_rate = self.rate
+
+        logger.warning("레이트 감소 (%s): %.2f → %.2f rps", reason, old, self.rate)
+
+    def on_success(self) -> None:
+        """성공 1건마다 increase_step / rate만큼 증가 (≈ 초당 increase_step)."""
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+            # 1 rps 이상 변했거나 최대치에 도달했을 때만 기록
+            changed = abs(self.rate - self._last_logged_rate) >= 1.0 or self.rate == self.max_rate
+            if changed:
+                self._last_logged_rate = self.rate
+        if changed:
+            logger.info("레이트 회복: %.2f rps (최대 %.2f)", self.rate, self.max_rate)
+
+    def on_throttle(self, retry_after: float) -> None:
+        """Retry-After 동안 전체 일시정지 + 레이트 감소."""
+        self.pause(retry_after)
+        self._decrease("429")
+
+    def on_server_error(self) -> None:
+        """서버 오류 시 레이트 감소."""
+        self._decrease("5xx")
+
+
+def create_rate_limiter(
+    settings: RateLimitSettings,
+    key: str | None = None,
+) -> TokenBucketRateLimiter:
+    """설정에 따라 레이트 리미터 생성.
+
+    Args:
+        settings: 레이트 리밋 설정.
+        key: 버킷 공유 키 (네이버 client_id). backend가 "redis"일 때 같은 키를 쓰는
+            모든 프로세스가 한도를 공유한다. Redis 연결 실패 시 프로세스 내 버킷을 사용.
+
+    Returns:
+        고정/적응형, 프로세스 내/Redis 중 설정에 맞는 리미터.
+    """
+    adaptive_kwargs = {
+        "min_rate": settings.min_rate,
+        "decrease_factor": settings.decrease_factor,
+        "increase_step": settings.increase_step,
+    }
+
+    if settings.backend == "redis" and key:
+        from richlychee.utils.redis_rate_limiter import create_redis_rate_limiter
+
+        limiter = create_redis_rate_limiter(
+            redis_url=settings.redis_url,
+            key=key,
+            rate=settings.requests_per_second,
+            burst=settings.burst_max,
+            adaptive=settings.adaptive,
+            **adaptive_kwargs,
+        )
+        if limiter is not None:
+            return limiter
+
+    if settings.adaptive:
+        return AdaptiveRateLimiter(
+            rate=settings.requests_per_second,
+            burst=settings.burst_max,
+            **adaptive_kwargs,
+        )
+    return TokenBucketRateLimiter(
+        rate=settings.requests_per_second,
+        burst=settings.burst_max,
+    )
+
+
+def parse_retry_after(value: str | None, default: float = 1.0) -> float:
+    """Retry-After 헤더 값을 초 단위로 변환 (초 또는 HTTP 날짜 형식)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, retry_at.timestamp() - time.time())
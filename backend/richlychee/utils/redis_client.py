@@ -0,0 +1,25 @@
+"""프로세스 공용 Redis 클라이언트."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+_clients: dict[str, Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_redis_client(url: str) -> Any:
+    """URL별 Redis 클라이언트 반환 (프로세스 내 커넥션 풀 공유)."""
+    import redis
+
+    with _clients_lock:
+        client = _clients.get(url)
+        if client is None:
+            client = redis.Redis.from_url(
+                url,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            _clients[url] = client
+        return client
@@ -0,0 +1,197 @@
+"""Redis 기반 분산 토큰 버킷 (여러 워커 프로세스가 같은 한도를 공유)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from richlychee.utils.logging import get_logger
+from richlychee.utils.rate_limiter import AdaptiveRateLimiter, TokenBucketRateLimiter
+from richlychee.utils.redis_client import get_redis_client
+
+logger = get_logger("utils.redis_rate_limiter")
+
+# 버킷 상태는 Redis 서버 시각(TIME) 기준으로 계산해 워커 간 시계 차이를 없앤다.
+# 반환값: 토큰 획득 시 "0", 아니면 필요한 대기 시간(초) 문자열.
+_ACQUIRE_SCRIPT = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local ttl = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local data = redis.call('HMGET', key, 'tokens', 'ts', 'paused_until')
+local paused_until = tonumber(data[3]) or 0
+if now < paused_until then
+  return tostring(paused_until - now)
+end
+
+local tokens = tonumber(data[1])
+local ts = tonumber(data[2])
+if tokens == nil or ts == nil then
+  tokens = burst
+  ts = now
+end
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', key, ttl)
+return tostring(wait)
+"""
+
+# Retry-After 동안 버킷을 공유하는 모든 프로세스의 토큰 발급을 중지.
+_PAUSE_SCRIPT = """
+local key = KEYS[1]
+local seconds = tonumber(ARGV[1])
+local ttl = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+
+local until_ts = now + seconds
+local current = tonumber(redis.call('HGET', key, 'paused_until')) or 0
+if until_ts < current then
+  until_ts = current
+end
+
+redis.call('HSET', key, 'paused_until', tostring(until_ts))
+redis.call('HSET', key, 'tokens', '0', 'ts', tostring(until_ts))
+redis.call('EXPIRE', key, ttl)
+return tostring(until_ts)
+"""
+
+_KEY_PREFIX = "richlychee:ratelimit:"
+_KEY_TTL = 3600
+# Redis 장애 후 다시 시도하기까지 프로세스 내 버킷만 쓰는 시간(초).
+# 장애 중 매 호출이 연결 타임아웃만큼 막히지 않도록 한다.
+_REDIS_RETRY_INTERVAL = 5.0
+
+
+class _RedisBucketMixin:
+    """토큰 버킷 상태를 Redis에 두는 믹스인.
+
+    Redis 호출이 실패하면 경고를 남기고 _REDIS_RETRY_INTERVAL초 동안 프로세스 내
+    버킷(부모 클래스)으로 대체한 뒤 Redis를 다시 시도한다.
+    """
+
+    def _init_redis(self, redis_client: Any, key: str) -> None:
+        self._redis = redis_client
+        self._key = f"{_KEY_PREFIX}{key}"
+        self._acquire_script = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._pause_script = redis_client.register_script(_PAUSE_SCRIPT)
+        self._redis_failed = False
+        self._redis_retry_at = 0.0
+
+    def _on_redis_error(self, e: Exception) -> None:
+        if not self._redis_failed:
+            logger.warning("Redis 레이트 리미터 오류 — 프로세스 내 버킷으로 대체: %s", e)
+        self._redis_failed = True
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_INTERVAL
+
+    def _redis_cooling_down(self) -> bool:
+        return self._redis_failed and time.monotonic() < self._redis_retry_at
+
+    def _try_consume(self) -> float:
+        if self._redis_cooling_down():
+            return super()._try_consume()
+        try:
+            wait = float(
+                self._acquire_script(keys=[self._key], args=[self.rate, self.burst, _KEY_TTL])
+            )
+        except Exception as e:
+            self._on_redis_error(e)
+            return super()._try_consume()
+
+        if self._redis_failed:
+            logger.info("Redis 레이트 리미터 복구")
+            self._redis_failed = False
+        return wait
+
+    async def _try_consume_async(self) -> float:
+        if self._redis_cooling_down():
+            return super()._try_consume()
+        # Redis 왕복(장애 시 연결 타임아웃)이 이벤트 루프를 막지 않도록 스레드에서 호출
+        return await asyncio.to_thread(self._try_consume)
+
+    def pause(self, seconds: float) -> None:
+        if not self._redis_cooling_down():
+            try:
+                self._pause_script(keys=[self._key], args=[max(0.0, seconds), _KEY_TTL])
+            except Exception as e:
+                self._on_redis_error(e)
+        # Redis 장애 시 대체 버킷도 함께 멈추도록 로컬 상태도 갱신
+        super().pause(seconds)
+
+
+class RedisTokenBucketRateLimiter(_RedisBucketMixin, TokenBucketRateLimiter):
+    """Redis에 상태를 두는 고정 레이트 토큰 버킷.
+
+    Args:
+        rate: 초당 허용 요청 수.
+        burst: 최대 버스트 허용량.
+        redis_client: Redis 클라이언트.
+        key: 버킷 키 (네이버 client_id). 같은 키를 쓰는 모든 프로세스가 한도를 공유.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        redis_client: Any,
+        key: str,
+    ) -> None:
+        super().__init__(rate, burst)
+        self._init_redis(redis_client, key)
+
+
+class RedisAdaptiveRateLimiter(_RedisBucketMixin, AdaptiveRateLimiter):
+    """Redis 버킷 + AIMD 레이트 조정.
+
+    Retry-After 일시정지는 모든 프로세스에 공유되고, 레이트 감소/회복은 각 프로세스가
+    관측한 응답을 기준으로 적용된다.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int | None = None,
+        *,
+        redis_client: Any,
+        key: str,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(rate, burst, **kwargs)
+        self._init_redis(redis_client, key)
+
+
+def create_redis_rate_limiter(
+    *,
+    redis_url: str,
+    key: str,
+    rate: float,
+    burst: int,
+    adaptive: bool = False,
+    **adaptive_kwargs: Any,
+) -> TokenBucketRateLimiter | None:
+    """Redis 레이트 리미터 생성. Redis에 연결할 수 없으면 None 반환."""
+    try:
+        client = get_redis_client(redis_url)
+        client.ping()
+    except Exception as e:
+        logger.warning("Redis 연결 실패 (%s) — 프로세스 내 레이트 리미터 사용: %s", redis_url, e)
+        return None
+
+    if adaptive:
+        return RedisAdaptiveRateLimiter(
+            rate, burst, redis_client=client, key=key, **adaptive_kwargs
+        )
+    return RedisTokenBucketRateLimiter(rate, burst, redis_client=client, key=key)
@@ -0,0 +1,14 @@
+"""API 요청 본문 직렬화 (orjson)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(data: Any) -> bytes:
+    """JSON 직렬화. 표준 json 모듈보다 빠르고 numpy 스칼라도 그대로 처리한다."""
+    return orjson.dumps(data, option=_OPTIONS)
@@ -0,0 +1,133 @@
+"""스프레드시트 리더 엔진 벤치마크.
+
+1k/10k/100k행 카탈로그를 생성해 엔진별 읽기 시간을 비교하고, 모든 엔진의 결과가
+호환 엔진(openpyxl/pandas)과 같은지 확인한다.
+
+    python scripts/benchmark_reader.py
+    python scripts/benchmark_reader.py --rows 1000 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from rich.console import Console
+from rich.table import Table
+
+from richlychee.data.reader import iter_file_chunks
+
+# 엔진별로 필요한 모듈 (None이면 기본 설치)
+_ENGINES = {
+    ".xlsx": {"openpyxl": None, "calamine": "python_calamine"},
+    ".csv": {"pandas": None, "pyarrow": "pyarrow"},
+}
+
+
+def make_catalog(rows: int) -> pd.DataFrame:
+    """옵션/빈 칸/숫자 코드가 섞인 샘플 카탈로그."""
+    records = []
+    for i in range(rows):
+        has_option = i % 3 == 0
+        records.append({
+            "상품명": f"[샘플] 상품 {i}",
+            "카테고리ID": 50000803 + i % 40,
+            "판매가": 10000 + (i % 500) * 100,
+            "재고수량": "" if i % 17 == 0 else i % 300,
+            "상세설명": f"<p>상품 {i} 상세 설명입니다.</p>",
+            "대표이미지": f"https://example.com/images/{i}_main.jpg",
+            "추가이미지": f"https://example.com/images/{i}_1.jpg,https://example.com/images/{i}_2.jpg",
+            "옵션1이름": "색상" if has_option else "",
+            "옵션1값": "화이트,블랙,네이비" if has_option else "",
+            "배송비유형": "CONDITIONAL_FREE" if i % 2 else "FREE",
+            "기본배송비": 3000,
+            "무료배송조건금액": 50000 if i % 2 else "",
+            "판매자관리코드": f"SKU-{i:07d}" if i % 4 else i,
+            "브랜드": f"브랜드{i % 25}",
+            "원산지": "국산",
+            "태그": "샘플,테스트",
+            "상품상태": "NEW",
+        })
+    return pd.DataFrame(records)
+
+
+def write_xlsx(df: pd.DataFrame, path: Path) -> None:
+    # 엑셀에서 저장한 파일처럼 공유 문자열 테이블을 쓰도록 일반 모드로 저장
+    df.replace("", None).to_excel(path, index=False, engine="openpyxl")
+
+
+def time_engine(path: Path, engine: str, chunk_size: int, repeat: int) -> tuple[float, list]:
+    """repeat회 중 가장 빠른 시간과 읽은 청크."""
+    kwargs = {"excel_engine" if path.suffix == ".xlsx" else "csv_engine": engine}
+    best = float("inf")
+    chunks: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = list(iter_file_chunks(path, chunk_size, **kwargs))
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+def same_chunks(left: list, right: list) -> bool:
+    if len(left) != len(right):
+        return False
+    try:
+        for a, b in zip(left, right):
+            pd.testing.assert_frame_equal(a, b)
+    except AssertionError:
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    logging.getLogger("richlychee").setLevel(logging.WARNING)
+    console = Console()
+    table = Table(title="리더 엔진 벤치마크")
+    for column in ("행 수", "형식", "파일 크기", "엔진", "시간(초)", "배율", "결과 일치"):
+        table.add_column(column)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            df = make_catalog(rows)
+            csv_path = Path(tmp) / f"catalog_{rows}.csv"
+            xlsx_path = Path(tmp) / f"catalog_{rows}.xlsx"
+            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+            with console.status(f"{rows:,}행 엑셀 생성 중..."):
+                write_xlsx(df, xlsx_path)
+
+            for path in (xlsx_path, csv_path):
+                size = f"{path.stat().st_size / 1024 / 1024:.1f}MB"
+                baseline_time, baseline = None, None
+                for engine, module in _ENGINES[path.suffix].items():
+                    if module and importlib.util.find_spec(module) is None:
+                        table.add_row(f"{rows:,}", path.suffix, size, engine, "-", "-", "미설치")
+                        continue
+                    elapsed, chunks = time_engine(path, engine, args.chunk_size, args.repeat)
+                    if baseline is None:
+                        baseline_time, baseline = elapsed, chunks
+                    table.add_row(
+                        f"{rows:,}",
+                        path.suffix,
+                        size,
+                        engine,
+                        f"{elapsed:.3f}",
+                        f"{baseline_time / elapsed:.1f}x",
+                        "O" if same_chunks(baseline, chunks) else "X",
+                    )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,18 @@ from unittest.mock import MagicMock
 import pandas as pd
 import pytest
 
+from richlychee.auth.token_store import reset_token_stores
 from richlychee.config import Settings
 
 
+@pytest.fixture(autouse=True)
+def _isolated_token_store():
+    """프로세스 공용 토큰 캐시가 테스트 간에 공유되지 않도록 초기화."""
+    reset_token_stores()
+    yield
+    reset_token_stores()
+
+
 @pytest.fixture
 def sample_settings() -> Settings:
     """테스트용 기본 설정."""
@@ -0,0 +1,92 @@
+"""비동기 클라이언트 테스트."""
+
+from __future__ import annotations
+
+import json
+import time
+from unittest.mock import patch
+
+import httpx
+
+from richlychee.api.async_client import AsyncNaverCommerceClient
+from richlychee.api.categories import search_category_async
+from richlychee.auth.session import AuthSession
+from richlychee.auth.token import TokenInfo
+from richlychee.config import Settings
+
+
+def _make_client(settings: Settings, handler) -> AsyncNaverCommerceClient:
+    auth = AuthSession(settings)
+    auth._token = TokenInfo(access_token="cached", expires_at=time.time() + 3600)
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncNaverCommerceClient(settings, auth, http_client=http)
+
+
+class TestAsyncNaverCommerceClient:
+    """AsyncNaverCommerceClient 테스트."""
+
+    async def test_search_category(self, sample_settings: Settings):
+        """인증 헤더를 붙여 요청하고 JSON을 반환."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=[{"id": "50000000", "name": "패션의류"}])
+
+        client = _make_client(sample_settings, handler)
+        results = await search_category_async(client, "의류")
+
+        assert results[0]["id"] == "50000000"
+        assert seen[0].headers["Authorization"] == "Bearer cached"
+        assert seen[0].url.params["keyword"] == "의류"
+
+    async def test_401_refreshes_token(self, sample_settings: Settings):
+        """401 응답 시 토큰을 갱신하고 한 번 더 요청."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if request.headers["Authorization"] == "Bearer cached":
+                return httpx.Response(401)
+            return httpx.Response(200, json=[])
+
+        client = _make_client(sample_settings, handler)
+        fresh = TokenInfo(access_token="fresh", expires_at=time.time() + 3600)
+        with patch("richlychee.auth.session.request_token", return_value=fresh):
+            resp = await client.get("categories")
+
+        assert resp.status_code == 200
+        assert calls == 2
+
+    async def test_retries_server_error(self, sample_settings: Settings):
+        """5xx 응답은 재시도."""
+        sample_settings.api.retry_backoff_factor = 0
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        client = _make_client(sample_settings, handler)
+        resp = await client.get("products/search")
+
+        assert resp.json() == {"ok": True}
+        assert calls == 2
+
+    async def test_json_body_encoded(self, sample_settings: Settings):
+        """JSON 본문은 UTF-8 bytes로 직렬화해 전송."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        client = _make_client(sample_settings, handler)
+        await client.post("products", json={"originProduct": {"name": "테스트 상품"}})
+
+        assert seen[0].headers["Content-Type"] == "application/json"
+        assert json.loads(seen[0].content) == {"originProduct": {"name": "테스트 상품"}}
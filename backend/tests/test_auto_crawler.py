@@ -0,0 +1,141 @@
+"""AutoCrawler / CrawlerTypeCache 테스트."""
+
+from __future__ import annotations
+
+import json
+
+import fakeredis
+import httpx
+import pytest
+
+from richlychee.crawler import auto, static
+from richlychee.crawler.auto import AutoCrawler, CrawlerTypeCache
+
+_SERVER_RENDERED = """
+<ul><li class="product-item"><a href="/p/1"><span class="title">상품 1</span></a>
+  <span class="price">12,000원</span></li></ul>
+"""
+_JS_SHELL = '<div id="root"></div><script src="/app.js"></script>'
+
+
+@pytest.fixture
+def site(monkeypatch):
+    """StaticCrawler 요청은 MockTransport로, DynamicCrawler는 가짜 크롤러로 대체."""
+    state = {"html": _SERVER_RENDERED, "status": 200, "static_requests": 0, "dynamic_runs": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["static_requests"] += 1
+        return httpx.Response(state["status"], text=state["html"])
+
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    class FakeDynamicCrawler:
+        def __init__(self, url, config=None, browser_pool=None):
+            self.url = url
+
+        async def stream(self):
+            state["dynamic_runs"] += 1
+            yield {"title": "렌더링된 상품", "price": 1000, "currency": "KRW",
+                   "images": [], "url": f"{self.url}/p/9"}
+
+    monkeypatch.setattr(static.httpx, "AsyncClient", client)
+    monkeypatch.setattr(auto, "DynamicCrawler", FakeDynamicCrawler)
+    return state
+
+
+class TestAutoCrawler:
+    """AutoCrawler 테스트."""
+
+    async def test_static_page_stays_static(self, site):
+        """정적 HTML에서 상품을 얻으면 브라우저를 띄우지 않는다."""
+        cache = CrawlerTypeCache()
+        crawler = AutoCrawler("https://shop.example.com/list", type_cache=cache)
+
+        products = await crawler.crawl()
+
+        assert [p["title"] for p in products] == ["상품 1"]
+        assert site["dynamic_runs"] == 0
+        assert crawler.used_type == "static"
+        assert cache.get("shop.example.com") == "static"
+
+    async def test_escalates_and_remembers_dynamic(self, site):
+        """상품이 없는 JS 페이지는 브라우저로 전환하고, 다음부터는 바로 브라우저로."""
+        site["html"] = _JS_SHELL
+        cache = CrawlerTypeCache()
+
+        first = await AutoCrawler("https://spa.example.com/list", type_cache=cache).crawl()
+        assert [p["title"] for p in first] == ["렌더링된 상품"]
+        assert site["static_requests"] == 1
+        assert cache.get("spa.example.com") == "dynamic"
+
+        second = AutoCrawler("https://spa.example.com/other", type_cache=cache)
+        await second.crawl()
+        assert site["static_requests"] == 1
+        assert site["dynamic_runs"] == 2
+        assert second.used_type == "dynamic"
+
+    async def test_embedded_state_stays_static(self, site):
+        """셀렉터에 맞는 요소가 없어도 __NEXT_DATA__에 상품이 있으면 브라우저 없이 추출."""
+        state = {"props": {"pageProps": {"items": [
+            {"title": "상태 상품", "price": 3000, "url": "/p/3"},
+        ]}}}
+        site["html"] = _JS_SHELL + (
+            f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script>'
+        )
+
+        products = await AutoCrawler("https://spa.example.com/list").crawl()
+
+        assert [p["title"] for p in products] == ["상태 상품"]
+        assert site["dynamic_runs"] == 0
+
+    async def test_escalates_when_static_request_blocked(self, site):
+        """정적 요청이 차단(403)되면 브라우저로 전환."""
+        site["status"] = 403
+
+        products = await AutoCrawler("https://shop.example.com/list").crawl()
+
+        assert [p["title"] for p in products] == ["렌더링된 상품"]
+
+    async def test_nothing_found_is_not_remembered(self, site, monkeypatch):
+        """두 방식 모두 상품이 없으면 기억하지 않는다."""
+        site["html"] = _JS_SHELL
+
+        class EmptyDynamicCrawler:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def stream(self):
+                return
+                yield
+
+        monkeypatch.setattr(auto, "DynamicCrawler", EmptyDynamicCrawler)
+        cache = CrawlerTypeCache()
+
+        assert await AutoCrawler("https://spa.example.com/list", type_cache=cache).crawl() == []
+        assert cache.get("spa.example.com") is None
+
+
+class TestCrawlerTypeCache:
+    """CrawlerTypeCache 테스트."""
+
+    def test_shared_through_redis(self):
+        """Redis를 통해 다른 워커 프로세스의 판단을 공유."""
+        redis_client = fakeredis.FakeRedis()
+        CrawlerTypeCache(redis_client).set("spa.example.com", "dynamic")
+
+        assert CrawlerTypeCache(redis_client).get("spa.example.com") == "dynamic"
+        assert 0 < redis_client.ttl("richlychee:crawler-type:spa.example.com") <= 7 * 86400
+
+    def test_expires(self, monkeypatch):
+        """TTL이 지나면 다시 정적 크롤링부터 시도하도록 잊는다."""
+        now = [1000.0]
+        monkeypatch.setattr(auto.time, "time", lambda: now[0])
+        cache = CrawlerTypeCache(ttl_seconds=60)
+        cache.set("spa.example.com", "dynamic")
+
+        now[0] += 61
+
+        assert cache.get("spa.example.com") is None
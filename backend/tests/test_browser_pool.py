@@ -0,0 +1,221 @@
+"""브라우저 풀 테스트 (Chromium 대신 가짜 브라우저 사용)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+
+from richlychee.crawler.browser_pool import BrowserPool
+from richlychee.crawler.dynamic import DynamicCrawler
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.visited: list[str] = []
+
+    async def goto(self, url: str, wait_until: str, **kwargs) -> None:
+        self.visited.append(url)
+        self.wait_until = wait_until
+
+    async def content(self) -> str:
+        return "<html><body></body></html>"
+
+    async def wait_for_selector(self, selector: str, **kwargs) -> None:
+        pass
+
+    async def eval_on_selector_all(self, selector: str, script: str, arg) -> list:
+        return []
+
+
+class _FakeContext:
+    def __init__(self, browser: _FakeBrowser, options: dict) -> None:
+        self.browser = browser
+        self.options = options
+        self.pages: list[_FakePage] = []
+        self.routes: list[tuple] = []
+        self.closed = False
+
+    async def route(self, pattern: str, handler) -> None:
+        self.routes.append((pattern, handler))
+
+    async def new_page(self) -> _FakePage:
+        self.pages.append(_FakePage())
+        return self.pages[-1]
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+        self.closed = False
+        self.fail_next_context = False
+        self.contexts: list[_FakeContext] = []
+
+    def is_connected(self) -> bool:
+        return self.connected and not self.closed
+
+    async def new_context(self, **options) -> _FakeContext:
+        if self.fail_next_context:
+            self.fail_next_context = False
+            self.connected = False
+            raise PlaywrightError("Target page, context or browser has been closed")
+        context = _FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def launched(monkeypatch) -> list[_FakeBrowser]:
+    """BrowserPool이 띄운 가짜 브라우저 목록."""
+    browsers: list[_FakeBrowser] = []
+
+    async def launch(self) -> _FakeBrowser:
+        browsers.append(_FakeBrowser())
+        return browsers[-1]
+
+    monkeypatch.setattr(BrowserPool, "_launch", launch)
+    return browsers
+
+
+class TestBrowserPool:
+    """BrowserPool 테스트."""
+
+    async def test_reuses_browser_with_fresh_contexts(self, launched):
+        """브라우저는 한 번만 띄우고 작업마다 새 컨텍스트를 만들어 닫는다."""
+        pool = BrowserPool()
+        async with pool.context() as first:
+            pass
+        async with pool.context() as second:
+            pass
+
+        assert len(launched) == 1
+        assert first is not second
+        assert first.closed and second.closed
+        assert not launched[0].closed
+
+        await pool.close()
+        assert launched[0].closed
+
+    async def test_recycles_after_max_uses(self, launched):
+        """max_uses번 사용하면 새 브라우저를 띄우고, 이전 브라우저는 사용이 끝나면 닫는다."""
+        pool = BrowserPool(max_uses=2)
+        async with pool.context():
+            pass
+        async with pool.context():
+            async with pool.context():
+                assert len(launched) == 2
+                # 사용 중인 컨텍스트가 있으므로 아직 닫지 않는다
+                assert not launched[0].closed
+            assert not launched[0].closed
+        assert launched[0].closed
+        assert not launched[1].closed
+
+    async def test_relaunches_crashed_browser(self, launched):
+        """비정상 종료된 브라우저는 다음 사용 시 새로 띄운다."""
+        pool = BrowserPool()
+        async with pool.context():
+            pass
+        launched[0].connected = False
+
+        async with pool.context() as context:
+            assert context.browser is launched[1]
+
+    async def test_retries_when_context_creation_fails(self, launched):
+        """컨텍스트 생성 중 브라우저가 죽으면 새 브라우저로 한 번 재시도."""
+        pool = BrowserPool()
+        async with pool.context():
+            pass
+        launched[0].fail_next_context = True
+
+        async with pool.context() as context:
+            assert context.browser is launched[1]
+        assert launched[0].closed
+
+    async def test_caps_concurrent_contexts(self, launched):
+        """동시에 열린 컨텍스트는 max_pages개를 넘지 않는다."""
+        pool = BrowserPool(max_pages=2)
+        state = {"open": 0, "max_open": 0}
+
+        async def job() -> None:
+            async with pool.context():
+                state["open"] += 1
+                state["max_open"] = max(state["max_open"], state["open"])
+                await asyncio.sleep(0.01)
+                state["open"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(5)))
+
+        assert state["max_open"] == 2
+        assert len(launched) == 1
+
+
+class TestDynamicCrawlerPool:
+    """DynamicCrawler의 브라우저 풀 사용 테스트."""
+
+    async def test_borrows_browser_from_pool(self, launched):
+        """풀이 있으면 브라우저를 빌려 쓰고 닫지 않는다."""
+        pool = BrowserPool()
+        for url in ("https://shop.example.com/a", "https://shop.example.com/b"):
+            await DynamicCrawler(url, browser_pool=pool).crawl()
+
+        assert len(launched) == 1
+        assert not launched[0].closed
+        contexts = launched[0].contexts
+        assert [c.pages[0].visited for c in contexts] == [
+            ["https://shop.example.com/a"],
+            ["https://shop.example.com/b"],
+        ]
+        assert all(c.closed and "user_agent" in c.options for c in contexts)
+        # 기본 설정은 이미지/폰트 등을 차단
+        assert all(len(c.routes) == 1 for c in contexts)
+
+    async def test_records_timings_and_skips_route_when_nothing_blocked(self, launched):
+        """차단할 것이 없으면 route를 걸지 않고, 단계별 시간을 기록한다."""
+        crawler = DynamicCrawler(
+            "https://shop.example.com/a",
+            {"block_resources": [], "block_urls": [], "wait_until": "domcontentloaded"},
+            browser_pool=BrowserPool(),
+        )
+        await crawler.crawl()
+
+        assert launched[0].contexts[0].routes == []
+        assert set(crawler.timings) == {"setup", "load", "wait", "total", "blocked_requests"}
+        assert crawler.timings["blocked_requests"] == 0
+
+    async def test_structured_data_skips_selector_wait(self, launched, monkeypatch):
+        """렌더링된 페이지에 JSON-LD가 있으면 셀렉터를 기다리지 않고 추출."""
+        html = (
+            '<script type="application/ld+json">'
+            '{"@type": "Product", "name": "상세 상품", "offers": {"price": 1000}}</script>'
+        )
+
+        async def content(self) -> str:
+            return html
+
+        async def wait_for_selector(self, selector: str, **kwargs) -> None:
+            raise AssertionError("셀렉터를 기다리면 안 됨")
+
+        monkeypatch.setattr(_FakePage, "content", content)
+        monkeypatch.setattr(_FakePage, "wait_for_selector", wait_for_selector)
+        crawler = DynamicCrawler("https://shop.example.com/p/1", browser_pool=BrowserPool())
+
+        products = await crawler.crawl()
+
+        assert [(p["title"], p["url"]) for p in products] == [
+            ("상세 상품", "https://shop.example.com/p/1")
+        ]
+        assert "wait" not in crawler.timings
+
+    async def test_without_pool_closes_own_browser(self, launched):
+        """풀이 없으면 이 크롤링에서만 쓸 브라우저를 띄우고 끝나면 닫는다."""
+        await DynamicCrawler("https://shop.example.com/a").crawl()
+
+        assert len(launched) == 1
+        assert launched[0].closed
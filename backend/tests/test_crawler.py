@@ -0,0 +1,386 @@
+"""크롤러 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from richlychee.crawler import static
+from richlychee.crawler.dynamic import DynamicCrawler, _RequestBlocker
+from richlychee.crawler.static import StaticCrawler
+
+_LISTING = """
+<ul>
+  <li class="product-item"><a href="/p/1"><span class="title">상품 1</span></a>
+    <span class="price">12,000원</span><img src="https://img/1.jpg"></li>
+  <li class="product-item"><span class="price">5,000원</span></li>
+  <li class="product-item"><a href="/p/2"><span class="title">상품 2</span></a>
+    <span class="price">$19.99</span></li>
+</ul>
+"""
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """StaticCrawler가 만드는 httpx.AsyncClient를 MockTransport로 대체."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=_LISTING)
+
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(static.httpx, "AsyncClient", client)
+    return requests
+
+
+class TestStaticCrawler:
+    """StaticCrawler 테스트."""
+
+    async def test_stream_yields_products(self, mock_http):
+        """제목이 있는 상품만 추출되는 대로 반환."""
+        crawler = StaticCrawler("https://shop.example.com/list")
+        products = [p async for p in crawler.stream()]
+
+        assert [p["title"] for p in products] == ["상품 1", "상품 2"]
+        assert products[0]["url"] == "https://shop.example.com/p/1"
+        assert products[0]["images"] == ["https://img/1.jpg"]
+        assert products[1]["currency"] == "USD"
+
+    async def test_crawl_collects_stream(self, mock_http):
+        """crawl()은 stream() 결과를 리스트로 모은다."""
+        crawler = StaticCrawler("https://shop.example.com/list")
+
+        assert len(await crawler.crawl()) == 2
+
+_LISTING_WITH_JSON_LD = _LISTING + """
+<script type="application/ld+json">
+{"@type": "ItemList", "itemListElement": [
+  {"@type": "ListItem", "item": {"@type": "Product", "name": "구조화 상품", "url": "/p/9",
+   "offers": {"price": "9900", "priceCurrency": "KRW"}}}
+]}
+</script>
+"""
+
+
+def _page(*ids: int, next_href: str | None = None) -> str:
+    items = "".join(
+        f'<li class="product-item"><a href="/p/{i}"><span class="title">상품 {i}</span></a>'
+        f'<span class="price">{i},000원</span></li>'
+        for i in ids
+    )
+    link = f'<a class="next" href="{next_href}">다음</a>' if next_href else ""
+    return f"<ul>{items}</ul>{link}"
+
+
+@pytest.fixture
+def mock_pages(monkeypatch):
+    """URL별 HTML을 돌려주는 MockTransport (없는 URL은 404). 동시 요청 수를 기록."""
+    pages: dict[str, str] = {}
+    state = {"requests": [], "in_flight": 0, "max_in_flight": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(str(request.url))
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        html = pages.get(str(request.url))
+        if html is None:
+            return httpx.Response(404)
+        return httpx.Response(200, text=html)
+
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(static.httpx, "AsyncClient", client)
+    return pages, state
+
+
+class TestStaticCrawlerStructuredData:
+    """StaticCrawler 구조화 데이터 우선 추출 테스트."""
+
+    async def test_structured_data_preferred(self, mock_pages, monkeypatch):
+        """JSON-LD가 있으면 BeautifulSoup 트리를 만들지 않고 구조화 데이터를 사용."""
+        pages, _ = mock_pages
+        pages["https://shop.example.com/list"] = _LISTING_WITH_JSON_LD
+
+        def no_soup(*args, **kwargs):
+            raise AssertionError("셀렉터 추출로 넘어가면 안 됨")
+
+        monkeypatch.setattr(static, "BeautifulSoup", no_soup)
+        products = await StaticCrawler("https://shop.example.com/list").crawl()
+
+        assert [(p["title"], p["price"], p["url"]) for p in products] == [
+            ("구조화 상품", 9900, "https://shop.example.com/p/9")
+        ]
+
+    async def test_structured_price_matches_selector(self, mock_pages):
+        """같은 상품은 구조화 데이터로 읽어도 셀렉터로 읽은 것과 가격/통화가 같다."""
+        pages, _ = mock_pages
+        pages["https://shop.example.com/list"] = (
+            '<ul><li class="product-item"><a href="/p/1"><span class="title">이어폰</span></a>'
+            '<span class="price">$29.90</span></li></ul>'
+            '<script type="application/ld+json">{"@type": "Product", "name": "이어폰",'
+            ' "url": "/p/1", "offers": {"price": "29.90", "priceCurrency": "USD"}}</script>'
+        )
+
+        structured = await StaticCrawler("https://shop.example.com/list").crawl()
+        selected = await StaticCrawler(
+            "https://shop.example.com/list", {"structured_data": False}
+        ).crawl()
+
+        assert structured == selected
+        assert (structured[0]["price"], structured[0]["currency"]) == (30, "USD")
+
+    async def test_structured_data_disabled(self, mock_pages):
+        """structured_data=False이면 셀렉터만 사용."""
+        pages, _ = mock_pages
+        pages["https://shop.example.com/list"] = _LISTING_WITH_JSON_LD
+
+        products = await StaticCrawler(
+            "https://shop.example.com/list", {"structured_data": False}
+        ).crawl()
+
+        assert [p["title"] for p in products] == ["상품 1", "상품 2"]
+
+
+class TestStaticCrawlerPagination:
+    """StaticCrawler 페이지네이션 테스트."""
+
+    async def test_page_param_in_order_with_dedupe(self, mock_pages):
+        """번호 방식: 페이지 순서대로 반환하고 페이지 간 중복 상품은 한 번만."""
+        pages, state = mock_pages
+        base = "https://shop.example.com/list?q=bag"
+        pages[f"{base}&page=1"] = _page(1, 2)
+        pages[f"{base}&page=2"] = _page(2, 3)
+        pages[f"{base}&page=3"] = _page(4)
+        # 4페이지부터는 404
+
+        crawler = StaticCrawler(base, {"pagination": {"page_param": "page", "max_pages": 10}})
+        products = await crawler.crawl()
+
+        assert [p["title"] for p in products] == ["상품 1", "상품 2", "상품 3", "상품 4"]
+        # 빈 페이지(404)에서 멈추므로 max_pages까지 요청하지 않는다
+        assert len(state["requests"]) < 10
+
+    async def test_page_param_starts_from_target_url(self, mock_pages):
+        """대상 URL에 페이지 번호가 있으면 그 페이지부터."""
+        pages, state = mock_pages
+        pages["https://shop.example.com/list?page=2"] = _page(3)
+        pages["https://shop.example.com/list?page=3"] = _page(3)  # 마지막 페이지 반복
+
+        crawler = StaticCrawler(
+            "https://shop.example.com/list?page=2",
+            {"pagination": {"page_param": "page", "max_pages": 5, "concurrency": 1}},
+        )
+        products = await crawler.crawl()
+
+        assert [p["title"] for p in products] == ["상품 3"]
+        assert state["requests"] == [
+            "https://shop.example.com/list?page=2",
+            "https://shop.example.com/list?page=3",
+        ]
+
+    async def test_concurrency_per_host(self, mock_pages):
+        """호스트당 동시 요청 수가 concurrency를 넘지 않는다."""
+        pages, state = mock_pages
+        for n in range(1, 9):
+            pages[f"https://shop.example.com/list?page={n}"] = _page(n)
+
+        crawler = StaticCrawler(
+            "https://shop.example.com/list",
+            {"pagination": {"page_param": "page", "max_pages": 8, "concurrency": 3}},
+        )
+        products = await crawler.crawl()
+
+        assert len(products) == 8
+        assert 1 < state["max_in_flight"] <= 3
+
+    async def test_first_page_error_raises(self, mock_pages):
+        """첫 페이지 요청 실패는 오류로 전달."""
+        crawler = StaticCrawler(
+            "https://shop.example.com/list", {"pagination": {"page_param": "page"}}
+        )
+
+        with pytest.raises(RuntimeError, match="HTTP 요청 실패"):
+            await crawler.crawl()
+
+    async def test_next_selector_follows_links(self, mock_pages):
+        """다음 링크 방식: 링크가 없을 때까지 차례로 따라간다."""
+        pages, state = mock_pages
+        pages["https://shop.example.com/list"] = _page(1, next_href="/list/2")
+        pages["https://shop.example.com/list/2"] = _page(2, next_href="/list/3")
+        pages["https://shop.example.com/list/3"] = _page(2, 3)
+
+        crawler = StaticCrawler(
+            "https://shop.example.com/list", {"pagination": {"next_selector": "a.next"}}
+        )
+        products = await crawler.crawl()
+
+        assert [p["title"] for p in products] == ["상품 1", "상품 2", "상품 3"]
+        assert len(state["requests"]) == 3
+
+    async def test_next_selector_respects_max_pages(self, mock_pages):
+        """max_pages까지만 따라간다."""
+        pages, state = mock_pages
+        for n in range(1, 5):
+            pages[f"https://shop.example.com/list/{n}"] = _page(n, next_href=f"/list/{n + 1}")
+
+        crawler = StaticCrawler(
+            "https://shop.example.com/list/1",
+            {"pagination": {"next_selector": "a.next", "max_pages": 2}},
+        )
+
+        assert len(await crawler.crawl()) == 2
+        assert len(state["requests"]) == 2
+
+
+# 브라우저에서 읽은 상품별 원시 값 (_EXTRACT_JS 반환 형식)
+_RAW_ITEMS = [
+    {
+        "title": "  상품 1 ",
+        "price": "12,000원",
+        "images": [None, "https://img/1.jpg", "data:image/gif;base64,R0"],
+        "href": "/p/1",
+    },
+    {"title": None, "price": "5,000원", "images": [], "href": None},
+    {"title": "상품 2", "price": "$19.99", "images": [], "href": "https://other.example.com/p/2"},
+]
+
+
+class _FakeElement:
+    """raw 값 하나를 ElementHandle처럼 보여주는 가짜 요소."""
+
+    def __init__(self, text: str | None = None, attrs: dict | None = None, children=None):
+        self._text = text
+        self._attrs = attrs or {}
+        self._children = children or {}
+
+    async def inner_text(self) -> str:
+        return self._text
+
+    async def get_attribute(self, name: str) -> str | None:
+        return self._attrs.get(name)
+
+    async def query_selector(self, selector: str):
+        found = self._children.get(selector) or []
+        return found[0] if found else None
+
+    async def query_selector_all(self, selector: str) -> list:
+        return self._children.get(selector) or []
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> _FakeElement:
+        children = {
+            ".title": [cls(raw["title"])] if raw["title"] is not None else [],
+            ".price": [cls(raw["price"])] if raw["price"] is not None else [],
+            "img": [cls(attrs={"data-src": src}) for src in raw["images"]],
+            "a": [cls(attrs={"href": raw["href"]})] if raw["href"] is not None else [],
+        }
+        return cls(children=children)
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def eval_on_selector_all(self, selector: str, script: str, arg: dict) -> list[dict]:
+        self.calls.append("eval_on_selector_all")
+        assert arg == {"title": ".title", "price": ".price", "image": "img", "link": "a"}
+        return _RAW_ITEMS
+
+    async def query_selector_all(self, selector: str) -> list[_FakeElement]:
+        self.calls.append("query_selector_all")
+        return [_FakeElement.from_raw(raw) for raw in _RAW_ITEMS]
+
+
+class TestDynamicCrawlerExtraction:
+    """DynamicCrawler 상품 추출 테스트."""
+
+    async def test_evaluate_extracts_all_items_in_one_call(self):
+        """기본 모드: eval_on_selector_all 한 번으로 모든 상품을 추출."""
+        crawler = DynamicCrawler("https://shop.example.com/list")
+        page = _FakePage()
+
+        products = [p async for p in crawler._extract_products(page, ".product-item")]
+
+        assert page.calls == ["eval_on_selector_all"]
+        assert products == [
+            {
+                "title": "상품 1",
+                "price": 12000,
+                "currency": "KRW",
+                "images": ["https://img/1.jpg"],
+                "url": "https://shop.example.com/p/1",
+            },
+            {
+                "title": "상품 2",
+                "price": 20,
+                "currency": "USD",
+                "images": [],
+                "url": "https://other.example.com/p/2",
+            },
+        ]
+
+    async def test_element_mode_matches_evaluate(self):
+        """extract_mode="element"도 같은 결과."""
+        page = _FakePage()
+        evaluated = [
+            p async for p in DynamicCrawler("https://shop.example.com/list")
+            ._extract_products(page, ".product-item")
+        ]
+        crawler = DynamicCrawler("https://shop.example.com/list", {"extract_mode": "element"})
+
+        products = [p async for p in crawler._extract_products(page, ".product-item")]
+
+        assert page.calls[-1] == "query_selector_all"
+        assert products == evaluated
+
+
+class _FakeRoute:
+    def __init__(self, resource_type: str, url: str) -> None:
+        self.request = type("Request", (), {"resource_type": resource_type, "url": url})()
+        self.action = ""
+
+    async def abort(self) -> None:
+        self.action = "abort"
+
+    async def continue_(self) -> None:
+        self.action = "continue"
+
+
+class TestRequestBlocker:
+    """동적 크롤링 요청 차단 테스트."""
+
+    @pytest.mark.parametrize(
+        "resource_type, url, action",
+        [
+            ("document", "https://shop.example.com/list", "continue"),
+            ("script", "https://shop.example.com/app.js", "continue"),
+            ("xhr", "https://shop.example.com/api/items", "continue"),
+            ("image", "https://img.example.com/1.jpg", "abort"),
+            ("font", "https://shop.example.com/font.woff2", "abort"),
+            ("script", "https://www.googletagmanager.com/gtm.js", "abort"),
+        ],
+    )
+    async def test_blocks_by_type_and_url(self, resource_type, url, action):
+        blocker = _RequestBlocker(["image", "media", "font"], ["googletagmanager.com"])
+        route = _FakeRoute(resource_type, url)
+
+        await blocker(route)
+
+        assert route.action == action
+        assert blocker.blocked == (action == "abort")
+
+    def test_empty_blocker_is_falsy(self):
+        assert not _RequestBlocker([], [])
+        assert _RequestBlocker(["image"], [])
@@ -0,0 +1,156 @@
+"""크롤링 작업 저장 테스트."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+import richlychee.crawler
+from app.core.config import AppSettings
+from app.core.database import Base
+from app.models.crawl_job import CrawlJob, CrawlJobStatus
+from app.models.crawled_product import CrawledProduct
+from app.models.user import User
+from app.services.email_service import EmailService
+from app.tasks import crawling
+from app.tasks.crawling import _crawled_product_row, _insert_products, run_crawl_job
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    CrawledProduct.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _rows(count: int) -> list[dict]:
+    job_id, user_id = uuid.uuid4(), uuid.uuid4()
+    now = datetime.now(UTC)
+    return [
+        _crawled_product_row(
+            job_id,
+            user_id,
+            {"title": f"상품 {i}", "price": 10, "krw_price": 13000, "url": f"https://x/{i}"},
+            now,
+        )
+        for i in range(count)
+    ]
+
+
+def _count(db: Session) -> int:
+    return db.scalar(select(func.count()).select_from(CrawledProduct))
+
+
+class TestInsertProducts:
+    """_insert_products 테스트."""
+
+    def test_bulk_insert(self, db: Session):
+        """배치 전체를 저장."""
+        assert _insert_products(db, _rows(25)) == 0
+        db.commit()
+
+        assert _count(db) == 25
+        product = db.scalars(select(CrawledProduct).limit(1)).one()
+        assert product.sale_price == 13000
+        assert product.original_data["url"].startswith("https://x/")
+
+    def test_bad_row_skipped(self, db: Session):
+        """배치에 잘못된 행이 있으면 그 행만 건너뛴다."""
+        rows = _rows(5)
+        rows[2]["original_title"] = None
+
+        assert _insert_products(db, rows) == 1
+        db.commit()
+
+        assert _count(db) == 4
+
+
+class _FakeCrawler:
+    """stream() 진행 중에 DB 상태를 확인할 수 있는 가짜 크롤러."""
+
+    items = 5
+    on_item = None
+    closed = False
+
+    def __init__(self, url, config=None):
+        self.url = url
+
+    async def stream(self):
+        try:
+            for i in range(self.items):
+                if _FakeCrawler.on_item is not None:
+                    _FakeCrawler.on_item(i)
+                yield {"title": f"상품 {i}", "price": 1000, "url": f"{self.url}/{i}"}
+        finally:
+            _FakeCrawler.closed = True
+
+
+class TestRunCrawlJob:
+    """run_crawl_job 스트리밍 저장 테스트."""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        engine = create_engine(f"sqlite:///{tmp_path / 'crawl.db'}")
+        Base.metadata.create_all(
+            engine, tables=[User.__table__, CrawlJob.__table__, CrawledProduct.__table__]
+        )
+        settings = AppSettings(crawl_insert_batch_size=2, job_commit_interval=3600)
+        monkeypatch.setattr(crawling, "get_app_settings", lambda: settings)
+        monkeypatch.setattr(crawling, "sync_session", lambda: Session(engine))
+        monkeypatch.setattr(richlychee.crawler, "StaticCrawler", _FakeCrawler)
+        monkeypatch.setattr(crawling.run_crawl_job, "update_state", lambda **kw: None)
+        monkeypatch.setattr(EmailService, "send_crawl_completed", lambda *a, **kw: None)
+        monkeypatch.setattr(_FakeCrawler, "on_item", None)
+        monkeypatch.setattr(_FakeCrawler, "closed", False)
+        return engine
+
+    @pytest.fixture
+    def job_id(self, engine) -> uuid.UUID:
+        with Session(engine) as db:
+            user = User(email="a@example.com", name="테스트")
+            db.add(user)
+            db.flush()
+            job = CrawlJob(user_id=user.id, target_url="https://shop", target_type="static")
+            db.add(job)
+            db.commit()
+            return job.id
+
+    def test_results_stored_while_crawling(self, engine, job_id):
+        """크롤링이 끝나기 전에 batch 단위로 저장된다."""
+        seen = []
+
+        def on_item(i):
+            with Session(engine) as db:
+                seen.append(_count(db))
+
+        _FakeCrawler.on_item = on_item
+        result = run_crawl_job(str(job_id))
+
+        assert seen == [0, 0, 2, 2, 4]
+        assert result["success"] == 5
+        with Session(engine) as db:
+            job = db.get(CrawlJob, job_id)
+            assert job.status == CrawlJobStatus.COMPLETED
+            assert job.total_items == job.crawled_items == 5
+            assert _count(db) == 5
+
+    def test_cancel_stops_stream(self, engine, job_id):
+        """취소되면 다음 저장 시점에 멈추고 크롤러를 닫는다."""
+        def on_item(i):
+            if i == 2:
+                with Session(engine) as db:
+                    db.get(CrawlJob, job_id).status = CrawlJobStatus.CANCELLED
+                    db.commit()
+
+        _FakeCrawler.on_item = on_item
+        run_crawl_job(str(job_id))
+
+        assert _FakeCrawler.closed
+        with Session(engine) as db:
+            assert db.get(CrawlJob, job_id).status == CrawlJobStatus.CANCELLED
+            assert _count(db) == 2
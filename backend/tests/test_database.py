@@ -0,0 +1,48 @@
+"""워커용 동기 DB 엔진 테스트."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+import app.core.database as database
+from app.core.config import AppSettings
+
+
+@pytest.fixture(autouse=True)
+def _sqlite_settings(tmp_path: Path, monkeypatch):
+    settings = AppSettings(database_url=f"sqlite:///{tmp_path / 'worker.db'}")
+    monkeypatch.setattr(database, "get_app_settings", lambda: settings)
+    database.dispose_sync_engine()
+    yield
+    database.dispose_sync_engine()
+
+
+class TestSyncEngine:
+    """get_sync_engine / sync_session 테스트."""
+
+    def test_engine_shared_per_process(self):
+        """태스크마다 새 풀을 만들지 않고 같은 엔진을 재사용."""
+        engine = database.get_sync_engine()
+
+        with database.sync_session() as db:
+            assert db.execute(text("SELECT 1")).scalar() == 1
+            assert db.get_bind() is engine
+        assert database.get_sync_engine() is engine
+        assert engine.pool.size() == 2
+
+    def test_init_replaces_inherited_engine(self):
+        """fork 후 초기화하면 부모의 풀을 닫지 않고 새 엔진을 만든다."""
+        parent = database.get_sync_engine()
+        with database.sync_session() as db:
+            db.execute(text("SELECT 1"))
+        inherited_pool = parent.pool
+        checked_in = inherited_pool.checkedin()
+
+        database.init_sync_engine()
+
+        assert database.get_sync_engine() is not parent
+        assert checked_in == 1
+        assert inherited_pool.checkedin() == checked_in
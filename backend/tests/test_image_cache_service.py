@@ -0,0 +1,63 @@
+"""DB 이미지 업로드 캐시 테스트."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from app.models.image_upload_cache import ImageUploadCacheEntry
+from app.services.image_cache_service import DbImageUploadCache
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    ImageUploadCacheEntry.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+
+
+class TestDbImageUploadCache:
+    """DbImageUploadCache 테스트."""
+
+    def test_put_then_get(self, db: Session):
+        """저장한 URL을 같은 자격증명으로만 조회."""
+        credential_id = uuid.uuid4()
+        cache = DbImageUploadCache(db, credential_id)
+
+        cache.put_many({"abc": "https://cdn.example.com/a.jpg"})
+        cache.put_many({"abc": "https://cdn.example.com/b.jpg"})
+
+        assert cache.get_many(["abc"]) == {"abc": "https://cdn.example.com/b.jpg"}
+        assert DbImageUploadCache(db, uuid.uuid4()).get_many(["abc"]) == {}
+
+    def test_concurrent_insert_conflict_ignored(self, db: Session):
+        """다른 작업이 같은 이미지를 먼저 기록해도 예외 없이 넘어가고 세션은 계속 사용 가능."""
+        credential_id = uuid.uuid4()
+        cache = DbImageUploadCache(db, credential_id)
+
+        def racing_writer(state):
+            if not state.is_delete:
+                return None
+            result = state.invoke_statement()
+            # 삭제와 추가 사이에 다른 워커가 같은 키를 기록한 상황
+            state.session.connection().execute(
+                insert(ImageUploadCacheEntry),
+                [{
+                    "id": uuid.uuid4(),
+                    "credential_id": credential_id,
+                    "sha256": "abc",
+                    "url": "https://cdn.example.com/other.jpg",
+                }],
+            )
+            return result
+
+        event.listen(db, "do_orm_execute", racing_writer)
+        cache.put_many({"abc": "https://cdn.example.com/a.jpg"})
+        event.remove(db, "do_orm_execute", racing_writer)
+
+        cache.put_many({"def": "https://cdn.example.com/d.jpg"})
+        assert cache.get_many(["def"]) == {"def": "https://cdn.example.com/d.jpg"}
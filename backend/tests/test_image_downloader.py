@@ -0,0 +1,72 @@
+"""크롤링 이미지 재호스팅 테스트."""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+
+from richlychee.api.async_client import AsyncNaverCommerceClient
+from richlychee.api.image_cache import SqliteImageUploadCache
+from richlychee.auth.session import AuthSession
+from richlychee.auth.token import TokenInfo
+from richlychee.config import Settings
+from richlychee.crawler.image_downloader import rehost_images
+
+
+def _make_api_client(settings: Settings, uploads: list[str]) -> AsyncNaverCommerceClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        filename = request.content.split(b'filename="')[1].split(b'"')[0].decode()
+        uploads.append(filename)
+        return httpx.Response(200, json={"images": [{"url": f"https://cdn.test/{filename}"}]})
+
+    auth = AuthSession(settings)
+    auth._token = TokenInfo(access_token="cached", expires_at=time.time() + 3600)
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncNaverCommerceClient(settings, auth, http_client=http)
+
+
+def _make_download_client() -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "missing" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, content=b"image-" + request.url.path.encode())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestRehostImages:
+    """rehost_images 테스트."""
+
+    async def test_maps_original_to_cdn_url(self, sample_settings):
+        """다운로드한 이미지를 업로드하고 원본 URL → CDN URL 매핑 반환."""
+        uploads: list[str] = []
+        client = _make_api_client(sample_settings, uploads)
+        urls = [
+            "https://shop.example.com/a.png",
+            "https://shop.example.com/b.jpg",
+            "https://shop.example.com/a.png",
+            "https://shop.example.com/missing.jpg",
+            "https://shop-phinf.pstatic.net/already.jpg",
+        ]
+
+        url_map = await rehost_images(client, urls, http_client=_make_download_client())
+
+        assert len(uploads) == 2
+        assert set(url_map) == {urls[0], urls[1]}
+        assert url_map[urls[0]].endswith(".png")
+
+    async def test_cache_skips_identical_content(self, sample_settings, tmp_path):
+        """업로드한 적 있는 내용의 이미지는 캐시된 URL 재사용."""
+        uploads: list[str] = []
+        client = _make_api_client(sample_settings, uploads)
+        cache = SqliteImageUploadCache(tmp_path / "cache.sqlite3", "test_client_id")
+        url = "https://shop.example.com/a.png"
+
+        first, second = [
+            await rehost_images(client, [url], http_client=_make_download_client(), cache=cache)
+            for _ in range(2)
+        ]
+
+        assert len(uploads) == 1
+        assert first == second
@@ -0,0 +1,77 @@
+"""이미지 전처리 테스트."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from PIL import Image
+
+from richlychee.config import ImagePreprocessSettings
+from richlychee.data.image_preprocess import preprocess_images
+
+
+@pytest.fixture
+def preprocess_settings(tmp_path) -> ImagePreprocessSettings:
+    return ImagePreprocessSettings(
+        enabled=True,
+        max_dimension=500,
+        quality=80,
+        workers=2,
+        cache_dir=str(tmp_path / "cache"),
+    )
+
+
+def _noise_image(mode: str, size: tuple[int, int]) -> Image.Image:
+    return Image.frombytes(mode, size, os.urandom(size[0] * size[1] * len(mode)))
+
+
+class TestPreprocessImages:
+    """preprocess_images 테스트."""
+
+    def test_resize_and_strip_exif(self, preprocess_settings, tmp_path):
+        """긴 변을 줄이고 EXIF 없이 JPEG로 저장."""
+        src = tmp_path / "photo.jpg"
+        exif = Image.Exif()
+        exif[0x010F] = "TestCamera"
+        _noise_image("RGB", (2000, 1000)).save(src, quality=95, exif=exif)
+
+        result = preprocess_images([str(src)], preprocess_settings)
+
+        with Image.open(result[str(src)]) as out:
+            assert out.size == (500, 250)
+            assert out.format == "JPEG"
+            assert not out.getexif()
+
+    def test_png_without_alpha_becomes_jpeg(self, preprocess_settings, tmp_path):
+        """투명도가 없는 PNG는 JPEG, 투명도가 있으면 PNG 유지."""
+        opaque = tmp_path / "opaque.png"
+        transparent = tmp_path / "transparent.png"
+        _noise_image("RGB", (800, 800)).save(opaque)
+        _noise_image("RGBA", (800, 800)).save(transparent)
+
+        result = preprocess_images([str(opaque), str(transparent)], preprocess_settings)
+
+        assert result[str(opaque)].endswith(".jpg")
+        assert result[str(transparent)].endswith(".png")
+
+    def test_cached_by_input_hash(self, preprocess_settings, tmp_path):
+        """같은 내용의 이미지는 캐시된 결과 재사용."""
+        src = tmp_path / "a.png"
+        copy = tmp_path / "b.png"
+        _noise_image("RGB", (800, 800)).save(src)
+        copy.write_bytes(src.read_bytes())
+
+        first = preprocess_images([str(src)], preprocess_settings)
+        second = preprocess_images([str(copy)], preprocess_settings)
+
+        assert first[str(src)] == second[str(copy)]
+
+    def test_keeps_original_when_not_smaller(self, preprocess_settings, tmp_path):
+        """전처리 결과가 더 크면 원본 사용."""
+        src = tmp_path / "tiny.png"
+        Image.new("RGB", (4, 4), "white").save(src)
+
+        result = preprocess_images([str(src)], preprocess_settings)
+
+        assert result[str(src)] == str(src)
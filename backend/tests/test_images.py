@@ -0,0 +1,152 @@
+"""이미지 업로드 테스트."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import responses
+
+from richlychee.api.client import NaverCommerceClient
+from richlychee.api.image_cache import SqliteImageUploadCache
+from richlychee.api.images import upload_images_batch
+from richlychee.auth.session import AuthSession
+from richlychee.auth.token import TokenInfo
+from richlychee.config import Settings
+
+UPLOAD_URL = "https://api.commerce.naver.com/external/v1/product-images/upload"
+
+
+def _make_client(settings: Settings) -> NaverCommerceClient:
+    auth = AuthSession(settings)
+    auth._token = TokenInfo(access_token="cached", expires_at=time.time() + 3600)
+    return NaverCommerceClient(settings, auth)
+
+
+def _make_images(tmp_path, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"img{i}.jpg"
+        path.write_bytes(b"\xff\xd8" + bytes([i]))
+        paths.append(str(path))
+    return paths
+
+
+def _upload_callback(fail_when_batched: bool = False):
+    batch_sizes: list[int] = []
+
+    def callback(request):
+        body = request.body if isinstance(request.body, bytes) else request.body.read()
+        names = [
+            part.split(b'filename="')[1].split(b'"')[0].decode()
+            for part in body.split(b"--")
+            if b'name="imageFiles"' in part
+        ]
+        batch_sizes.append(len(names))
+        if fail_when_batched and len(names) > 1:
+            return 500, {}, "error"
+        images = [{"url": f"https://cdn.example.com/{n}"} for n in names]
+        return 200, {}, json.dumps({"images": images})
+
+    return callback, batch_sizes
+
+
+class TestUploadImagesBatch:
+    """upload_images_batch 테스트."""
+
+    @responses.activate
+    def test_groups_images_per_request(self, sample_settings, tmp_path):
+        """batch_size개씩 묶어 업로드하고 경로별 URL을 매핑."""
+        sample_settings.registration.image_batch_size = 2
+        callback, batch_sizes = _upload_callback()
+        responses.add_callback(responses.POST, UPLOAD_URL, callback=callback)
+        paths = _make_images(tmp_path, 5)
+
+        url_map = upload_images_batch(_make_client(sample_settings), paths + [paths[0]])
+
+        assert sorted(batch_sizes) == [1, 2, 2]
+        assert url_map == {p: f"https://cdn.example.com/img{i}.jpg" for i, p in enumerate(paths)}
+
+    @responses.activate
+    def test_failed_batch_retried_individually(self, sample_settings, tmp_path):
+        """묶음 요청 실패 시 개별 업로드로 재시도."""
+        sample_settings.api.retry_backoff_factor = 0
+        callback, batch_sizes = _upload_callback(fail_when_batched=True)
+        responses.add_callback(responses.POST, UPLOAD_URL, callback=callback)
+        paths = _make_images(tmp_path, 3)
+
+        url_map = upload_images_batch(_make_client(sample_settings), paths)
+
+        retries = sample_settings.api.max_retries
+        assert batch_sizes == [3] * retries + [1, 1, 1]
+        assert len(url_map) == 3
+
+    @responses.activate
+    def test_retried_request_resends_image_bytes(self, sample_settings, tmp_path):
+        """서버 오류 후 재시도한 요청에도 이미지 내용이 그대로 담김."""
+        sample_settings.api.retry_backoff_factor = 0
+        bodies: list[bytes] = []
+        callback, _ = _upload_callback()
+
+        def fail_first(request):
+            body = request.body if isinstance(request.body, bytes) else request.body.read()
+            bodies.append(body)
+            if len(bodies) == 1:
+                return 500, {}, "error"
+            return callback(request)
+
+        responses.add_callback(responses.POST, UPLOAD_URL, callback=fail_first)
+        paths = _make_images(tmp_path, 2)
+
+        url_map = upload_images_batch(_make_client(sample_settings), paths)
+
+        assert len(bodies) == 2
+        for i in range(2):
+            assert b"\xff\xd8" + bytes([i]) in bodies[1]
+        assert len(url_map) == 2
+
+    def test_missing_file_skipped(self, sample_settings, tmp_path):
+        """존재하지 않는 파일은 요청 없이 제외."""
+        url_map = upload_images_batch(
+            _make_client(sample_settings), [str(tmp_path / "missing.jpg")]
+        )
+        assert url_map == {}
+
+
+class TestImageUploadCache:
+    """이미지 업로드 캐시 테스트."""
+
+    @responses.activate
+    def test_cached_and_identical_images_not_uploaded(self, sample_settings, tmp_path):
+        """캐시된 이미지와 내용이 같은 사본은 다시 업로드하지 않음."""
+        callback, batch_sizes = _upload_callback()
+        responses.add_callback(responses.POST, UPLOAD_URL, callback=callback)
+        cache = SqliteImageUploadCache(tmp_path / "cache.sqlite3", "test_client_id")
+        paths = _make_images(tmp_path, 2)
+        copy = tmp_path / "copy_of_img0.jpg"
+        copy.write_bytes((tmp_path / "img0.jpg").read_bytes())
+        client = _make_client(sample_settings)
+
+        first = upload_images_batch(client, paths + [str(copy)], cache=cache)
+        second = upload_images_batch(client, [str(copy)], cache=cache)
+
+        assert batch_sizes == [2]
+        assert first[str(copy)] == first[paths[0]]
+        assert second == {str(copy): first[paths[0]]}
+
+    def test_discard_and_namespace(self, tmp_path):
+        """URL 제거 후에는 조회되지 않고, 다른 스토어 캐시와는 분리."""
+        path = tmp_path / "cache.sqlite3"
+        cache = SqliteImageUploadCache(path, "store-a")
+        cache.put_many({"abc": "https://cdn.example.com/a.jpg"})
+
+        assert SqliteImageUploadCache(path, "store-b").get_many(["abc"]) == {}
+        cache.discard_urls(["https://cdn.example.com/a.jpg"])
+        assert cache.get_many(["abc"]) == {}
+
+    def test_expired_entries_ignored(self, tmp_path):
+        """보관 기간이 지난 항목은 조회되지 않음."""
+        cache = SqliteImageUploadCache(tmp_path / "cache.sqlite3", "store-a", ttl_days=0)
+        cache.put_many({"abc": "https://cdn.example.com/a.jpg"})
+
+        assert cache.get_many(["abc"]) == {}
@@ -0,0 +1,21 @@
+"""CLI 인자 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from richlychee.main import _build_parser
+
+
+class TestConcurrencyArgument:
+    """register --concurrency 테스트."""
+
+    def test_positive_value(self):
+        args = _build_parser().parse_args(["register", "products.xlsx", "--concurrency", "4"])
+        assert args.concurrency == 4
+
+    @pytest.mark.parametrize("value", ["0", "-1", "two"])
+    def test_invalid_value_rejected(self, value: str):
+        """0 이하나 정수가 아닌 값은 설정을 덮어쓰지 않고 인자 오류로 종료."""
+        with pytest.raises(SystemExit):
+            _build_parser().parse_args(["register", "products.xlsx", "--concurrency", value])
@@ -0,0 +1,80 @@
+"""자격증명별 NaverService 캐시 테스트."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.services.naver_service import NaverServiceRegistry
+
+
+def _credential(cred_id: uuid.UUID | None = None, secret: str = "enc-secret"):
+    return SimpleNamespace(
+        id=cred_id or uuid.uuid4(),
+        naver_client_id="test_client_id",
+        naver_client_secret=secret,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _plain_secret():
+    with patch("app.core.security.decrypt_secret", side_effect=lambda s: f"plain-{s}"):
+        yield
+
+
+class TestNaverServiceRegistry:
+    """NaverServiceRegistry 테스트."""
+
+    def test_reuses_service(self):
+        """같은 자격증명은 같은 서비스를 재사용."""
+        registry = NaverServiceRegistry()
+        cred = _credential()
+
+        assert registry.get(cred) is registry.get(cred)
+
+    def test_rebuilds_on_secret_change(self):
+        """암호화된 시크릿이 바뀌면 새 서비스 생성."""
+        registry = NaverServiceRegistry()
+        cred = _credential()
+        first = registry.get(cred)
+
+        changed = _credential(cred.id, secret="enc-new")
+        second = registry.get(changed)
+
+        assert second is not first
+        assert second.get_sync_settings().naver_client_secret == "plain-enc-new"
+
+    def test_invalidate(self):
+        """invalidate 후에는 새 서비스 생성."""
+        registry = NaverServiceRegistry()
+        cred = _credential()
+        first = registry.get(cred)
+
+        registry.invalidate(cred.id)
+
+        assert len(registry) == 0
+        assert registry.get(cred) is not first
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 쓰지 않은 항목 제거."""
+        registry = NaverServiceRegistry(max_size=2)
+        a, b, c = _credential(), _credential(), _credential()
+        service_a = registry.get(a)
+        registry.get(b)
+        registry.get(a)
+        registry.get(c)
+
+        assert len(registry) == 2
+        assert registry.get(a) is service_a
+
+    def test_idle_eviction(self):
+        """유휴 시간이 지난 항목은 제거."""
+        registry = NaverServiceRegistry(idle_seconds=0)
+        cred = _credential()
+        first = registry.get(cred)
+
+        with patch("app.services.naver_service.time.monotonic", return_value=1e12):
+            assert registry.get(cred) is not first
@@ -0,0 +1,109 @@
+"""파싱 캐시 테스트."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+import richlychee.data.parsed_cache as parsed_cache
+from richlychee.data.parsed_cache import ParsedFileCache
+from richlychee.data.validator import ValidationError, ValidationResult
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("원본 파일을 다시 파싱함")
+
+
+class TestParsedFileCache:
+    """ParsedFileCache 테스트."""
+
+    def test_second_read_uses_cache(self, tmp_xlsx: Path, tmp_path: Path, monkeypatch):
+        """한 번 파싱한 파일은 Parquet에서 같은 청크를 읽는다."""
+        cache = ParsedFileCache(tmp_path / "parsed")
+        first = list(cache.open(tmp_xlsx).iter_chunks(chunk_size=1))
+
+        monkeypatch.setattr(parsed_cache, "iter_file_chunks", _fail_parse)
+        entry = cache.open(tmp_xlsx)
+        second = list(entry.iter_chunks(chunk_size=1))
+
+        assert entry.is_cached
+        assert entry.rows == 2
+        assert len(second) == len(first) == 2
+        for a, b in zip(first, second):
+            pd.testing.assert_frame_equal(a, b)
+
+    def test_keyed_by_content(self, tmp_xlsx: Path, tmp_path: Path):
+        """파일명이 달라도 내용이 같으면 캐시를 공유."""
+        cache = ParsedFileCache(tmp_path / "parsed")
+        list(cache.open(tmp_xlsx).iter_chunks())
+
+        copy = tmp_path / "copy.xlsx"
+        copy.write_bytes(tmp_xlsx.read_bytes())
+
+        assert cache.open(copy).is_cached
+
+    def test_partial_read_not_cached(self, tmp_xlsx: Path, tmp_path: Path):
+        """끝까지 읽지 않은 파일은 캐시하지 않음."""
+        cache = ParsedFileCache(tmp_path / "parsed")
+        chunks = cache.open(tmp_xlsx).iter_chunks(chunk_size=1)
+        next(chunks)
+        chunks.close()
+
+        assert not cache.open(tmp_xlsx).is_cached
+        assert list((tmp_path / "parsed").iterdir()) == []
+
+    def test_unsupported_column_falls_back(self, tmp_csv: Path, tmp_path: Path, monkeypatch):
+        """Parquet으로 저장할 수 없는 컬럼이 있으면 캐시 없이 그대로 반환."""
+        original = parsed_cache.iter_file_chunks
+
+        def _mixed(*args, **kwargs):
+            for chunk in original(*args, **kwargs):
+                chunk["option1_value"] = pd.Series([270, "S"], dtype=object, index=chunk.index)
+                yield chunk
+
+        monkeypatch.setattr(parsed_cache, "iter_file_chunks", _mixed)
+        entry = ParsedFileCache(tmp_path / "parsed").open(tmp_csv)
+        chunks = list(entry.iter_chunks())
+
+        assert len(chunks) == 1
+        assert chunks[0]["option1_value"].tolist() == [270, "S"]
+        assert not entry.is_cached
+
+    def test_validation_round_trip(self, tmp_xlsx: Path, tmp_path: Path):
+        """검증 결과를 저장했다가 다시 불러온다."""
+        entry = ParsedFileCache(tmp_path / "parsed").open(tmp_xlsx)
+        assert entry.load_validation() is None
+
+        list(entry.iter_chunks())
+        result = ValidationResult(
+            errors=[ValidationError(row=3, field="sale_price", message="판매가는 10원 이상")],
+            warnings=[ValidationError(row=2, field="brand", message="브랜드 누락")],
+        )
+        entry.save_validation(2, result)
+
+        loaded = ParsedFileCache(tmp_path / "parsed").open(tmp_xlsx).load_validation()
+        assert loaded == (2, result)
+
+    def test_prune_unused_and_outdated_entries(
+        self, tmp_xlsx: Path, tmp_csv: Path, tmp_path: Path
+    ):
+        """오래 쓰이지 않은 항목과 이전 버전 항목은 open 시 삭제, 사용 중인 항목은 유지."""
+        cache_dir = tmp_path / "parsed"
+        cache = ParsedFileCache(cache_dir, ttl_days=7)
+        list(cache.open(tmp_xlsx).iter_chunks())
+        list(cache.open(tmp_csv).iter_chunks())
+        outdated = cache_dir / f"{'0' * 64}-v0"
+        outdated.mkdir()
+
+        # 모든 항목을 8일 전에 마지막으로 사용한 상태
+        old = time.time() - 8 * 86400
+        for entry in cache_dir.iterdir():
+            os.utime(entry, (old, old))
+
+        assert cache.open(tmp_xlsx).is_cached
+        assert not cache.open(tmp_csv).is_cached
+        assert not outdated.exists()
+        assert len(list(cache_dir.iterdir())) == 1
@@ -0,0 +1,95 @@
+"""순서 보장 워커 풀 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from richlychee.engine.pool import run_ordered
+
+
+class TestRunOrdered:
+    """run_ordered 테스트."""
+
+    def test_sequential(self):
+        """concurrency=1이면 현재 스레드에서 순차 실행."""
+        threads = set()
+
+        def fn(x: int) -> int:
+            threads.add(threading.get_ident())
+            return x * 2
+
+        results = list(run_ordered(fn, range(5)))
+
+        assert results == [(i, i * 2) for i in range(5)]
+        assert threads == {threading.get_ident()}
+
+    def test_concurrent_preserves_order(self):
+        """병렬 실행해도 입력 순서대로 반환."""
+
+        def fn(x: int) -> int:
+            # 앞 항목일수록 늦게 끝나도록
+            time.sleep(0.01 * (10 - x))
+            return x
+
+        results = list(run_ordered(fn, range(10), concurrency=4))
+
+        assert [r for _, r in results] == list(range(10))
+
+    def test_concurrent_limits_in_flight(self):
+        """동시 실행 수가 concurrency를 넘지 않음."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fn(x: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return x
+
+        list(run_ordered(fn, range(20), concurrency=3))
+
+        assert peak <= 3
+
+    def test_should_stop_drains_submitted(self):
+        """중단 요청 후 새 작업은 제출하지 않고 제출된 작업 결과는 반환."""
+        stop = False
+        seen: list[int] = []
+
+        def fn(x: int) -> int:
+            return x
+
+        for item, _ in run_ordered(fn, range(100), concurrency=2, should_stop=lambda: stop):
+            seen.append(item)
+            if item == 3:
+                stop = True
+
+        assert seen == list(range(len(seen)))
+        assert 3 < len(seen) < 100
+
+    def test_should_stop_cancels_queued(self):
+        """중단 요청 시 제출됐지만 아직 시작하지 않은 작업은 실행하지 않음."""
+        stop = False
+        started: list[int] = []
+        lock = threading.Lock()
+
+        def fn(x: int) -> int:
+            with lock:
+                started.append(x)
+            if x > 0:
+                time.sleep(0.1)
+            return x
+
+        seen = []
+        for item, _ in run_ordered(fn, range(100), concurrency=2, should_stop=lambda: stop):
+            seen.append(item)
+            stop = True
+
+        # 0이 끝났을 때 1, 2는 실행 중이고 3은 대기 중이다
+        assert sorted(started) == [0, 1, 2]
+        assert seen == [0, 1, 2]
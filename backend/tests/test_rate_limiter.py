@@ -0,0 +1,108 @@
+"""레이트 리미터 테스트."""
+
+from __future__ import annotations
+
+import time
+
+from richlychee.config import RateLimitSettings
+from richlychee.utils.rate_limiter import (
+    AdaptiveRateLimiter,
+    TokenBucketRateLimiter,
+    create_rate_limiter,
+    parse_retry_after,
+)
+
+
+class TestTokenBucketRateLimiter:
+    """고정 레이트 리미터 테스트."""
+
+    def test_burst_then_timeout(self):
+        """버스트만큼은 즉시 획득, 이후 타임아웃."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=3)
+
+        assert all(limiter.acquire(timeout=0) for _ in range(3))
+        assert not limiter.acquire(timeout=0)
+
+    def test_throttle_pauses_all_callers(self):
+        """429 피드백 시 Retry-After 동안 토큰 발급 중지."""
+        limiter = TokenBucketRateLimiter(rate=100, burst=10)
+        limiter.on_throttle(0.2)
+
+        assert not limiter.acquire(timeout=0.05)
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=1)
+        assert time.monotonic() - start >= 0.1
+
+    async def test_acquire_async(self):
+        """비동기 획득도 같은 버킷을 사용."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=1)
+
+        assert await limiter.acquire_async(timeout=0)
+        assert not limiter.acquire(timeout=0)
+
+
+class TestAdaptiveRateLimiter:
+    """AIMD 레이트 리미터 테스트."""
+
+    def test_multiplicative_decrease(self):
+        """429 시 레이트 절반, 최소값 이하로는 내려가지 않음."""
+        limiter = AdaptiveRateLimiter(rate=10, min_rate=2, cooldown=0)
+
+        limiter.on_throttle(0)
+        assert limiter.rate == 5
+
+        limiter.on_server_error()
+        limiter.on_server_error()
+        assert limiter.rate == 2
+
+    def test_throttle_wait_matches_retry_after(self):
+        """429 후 대기 시간은 Retry-After만큼 (일시정지 중 감소가 토큰을 음수로 만들지 않음)."""
+        limiter = AdaptiveRateLimiter(rate=100, burst=10, cooldown=0)
+        limiter.on_throttle(0.3)
+
+        start = time.monotonic()
+        assert limiter.acquire(timeout=2)
+        elapsed = time.monotonic() - start
+
+        assert 0.25 <= elapsed < 0.4
+
+    def test_cooldown_limits_decrease(self):
+        """쿨다운 내 연속 429는 한 번만 감소."""
+        limiter = AdaptiveRateLimiter(rate=10, cooldown=60)
+
+        for _ in range(5):
+            limiter.on_throttle(0)
+
+        assert limiter.rate == 5
+
+    def test_additive_increase_capped(self):
+        """성공 시 최대 레이트까지 회복."""
+        limiter = AdaptiveRateLimiter(rate=10, cooldown=0)
+        limiter.on_server_error()
+
+        for _ in range(1000):
+            limiter.on_success()
+
+        assert limiter.rate == 10
+
+
+class TestFactory:
+    """create_rate_limiter / parse_retry_after 테스트."""
+
+    def test_create_adaptive(self):
+        settings = RateLimitSettings(adaptive=True, requests_per_second=8)
+        limiter = create_rate_limiter(settings)
+
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.max_rate == 8
+
+    def test_create_static(self):
+        limiter = create_rate_limiter(RateLimitSettings(adaptive=False))
+
+        assert not isinstance(limiter, AdaptiveRateLimiter)
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after(None) == 1
+        assert parse_retry_after("garbage") == 1
@@ -7,7 +7,8 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from richlychee.data.reader import read_file
+import richlychee.data.reader as reader
+from richlychee.data.reader import iter_file_chunks, read_file
 
 
 class TestReadFile:
@@ -77,3 +78,182 @@ class TestReadFile:
 
         assert result.iloc[0]["sale_price"] == 0
         assert result.iloc[0]["stock_quantity"] == 0
+
+    def test_code_column_with_blanks_stays_integer(self, tmp_path: Path):
+        """빈 칸이 섞인 숫자 카테고리 ID가 "50000000.0"이 되지 않음."""
+        df = pd.DataFrame([
+            {"product_name": "A", "category_id": 50000000, "sale_price": 1000},
+            {"product_name": "B", "category_id": None, "sale_price": 1000},
+        ])
+        xlsx_path = tmp_path / "codes.xlsx"
+        df.to_excel(xlsx_path, index=False, engine="openpyxl")
+
+        result = read_file(xlsx_path)
+
+        assert list(result["category_id"]) == ["50000000", ""]
+
+    def test_styled_empty_trailing_rows_dropped(self, tmp_path: Path):
+        """서식만 있는 끝의 빈 행은 데이터 행이 아님 (read_excel과 같음)."""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["product_name", "category_id", "sale_price"])
+        ws.append(["A", "50000000", 1000])
+        ws.append(["B", "50000000", 2000])
+        for r in range(4, 8):
+            for c in range(1, 4):
+                ws.cell(row=r, column=c).font = Font(bold=True)
+        xlsx_path = tmp_path / "styled.xlsx"
+        wb.save(xlsx_path)
+
+        result = read_file(xlsx_path)
+
+        assert list(result["product_name"]) == ["A", "B"]
+        assert len(result) == len(pd.read_excel(xlsx_path))
+
+    def test_cp949_csv(self, tmp_path: Path):
+        """엑셀에서 저장한 CP949 CSV 읽기."""
+        csv_path = tmp_path / "cp949.csv"
+        csv_path.write_bytes("상품명,판매가\n테스트 상품,10000\n".encode("cp949"))
+
+        result = read_file(csv_path)
+
+        assert result.iloc[0]["product_name"] == "테스트 상품"
+
+
+class TestIterFileChunks:
+    """청크 단위 읽기 테스트."""
+
+    @pytest.fixture
+    def rows(self) -> pd.DataFrame:
+        return pd.DataFrame([
+            {
+                "상품명": f"상품 {i}",
+                "카테고리ID": 50000000 + i % 3,
+                "판매가": 1000 + i,
+                "배송비유형": "FREE" if i % 2 else "PAID",
+                "브랜드": None if i % 4 == 0 else "브랜드",
+            }
+            for i in range(23)
+        ])
+
+    @pytest.mark.parametrize("suffix", [".xlsx", ".csv"])
+    def test_chunks_match_whole_file(self, rows: pd.DataFrame, tmp_path: Path, suffix: str):
+        """청크를 이어 붙이면 한 번에 읽은 결과와 같고, 인덱스는 파일 기준으로 이어진다."""
+        path = tmp_path / f"rows{suffix}"
+        if suffix == ".xlsx":
+            rows.to_excel(path, index=False, engine="openpyxl")
+        else:
+            rows.to_csv(path, index=False, encoding="utf-8-sig")
+
+        chunks = list(iter_file_chunks(path, chunk_size=10))
+        whole = read_file(path)
+
+        assert [len(c) for c in chunks] == [10, 10, 3]
+        assert list(chunks[2].index) == [20, 21, 22]
+        combined = pd.concat([c.astype(object) for c in chunks])
+        pd.testing.assert_frame_equal(combined, whole.astype(object))
+
+    def test_repetitive_columns_are_categorical(self, rows: pd.DataFrame, tmp_path: Path):
+        """반복 값 컬럼은 category dtype."""
+        path = tmp_path / "rows.xlsx"
+        rows.to_excel(path, index=False, engine="openpyxl")
+
+        chunk = next(iter_file_chunks(path, chunk_size=100))
+
+        assert isinstance(chunk["category_id"].dtype, pd.CategoricalDtype)
+        assert isinstance(chunk["delivery_fee_type"].dtype, pd.CategoricalDtype)
+        assert isinstance(chunk["brand"].dtype, pd.CategoricalDtype)
+        assert chunk["brand"].iloc[0] == ""
+
+
+class TestReaderEngines:
+    """리더 엔진 선택 테스트."""
+
+    @pytest.fixture
+    def catalog(self) -> pd.DataFrame:
+        return pd.DataFrame([
+            {
+                "상품명": f"상품 {i}",
+                "카테고리ID": 50000000 + i % 3,
+                "판매가": 1000 + i,
+                "재고수량": None if i % 5 == 0 else i,
+                "옵션1값": "270" if i % 2 else "S,M",
+                # int64 범위를 넘는 22자리 숫자 코드 (float로 바뀌면 자릿수가 깨진다)
+                "판매자관리코드": f"88012345678901234567{i:02d}" if i % 3 else "",
+                "무료배송조건금액": 30000.5 if i % 4 == 0 else None,
+                "사용여부": i % 2 == 0,
+            }
+            for i in range(23)
+        ])
+
+    @pytest.fixture
+    def catalog_csv(self, catalog: pd.DataFrame, tmp_path: Path) -> Path:
+        path = tmp_path / "catalog.csv"
+        catalog.to_csv(path, index=False, encoding="cp949")
+        return path
+
+    @staticmethod
+    def _expected(raw: pd.DataFrame) -> pd.DataFrame:
+        return reader._clean_dataframe(reader._normalize_columns(raw)).astype(object)
+
+    @staticmethod
+    def _combined(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+        return pd.concat([c.astype(object) for c in chunks])
+
+    @pytest.mark.parametrize(
+        ("engine", "read_csv_engine"), [("pandas", "c"), ("pyarrow", "pyarrow")]
+    )
+    @pytest.mark.parametrize("chunk_size", [None, 7])
+    def test_csv_engine_matches_read_csv(
+        self, catalog_csv: Path, engine: str, read_csv_engine: str, chunk_size: int | None
+    ):
+        """각 CSV 엔진의 타입 추론은 같은 엔진의 pd.read_csv와 같다 (코드 컬럼 제외)."""
+        raw = pd.read_csv(catalog_csv, encoding="cp949", engine=read_csv_engine)
+        chunks = list(iter_file_chunks(catalog_csv, chunk_size, csv_engine=engine))
+
+        if chunk_size:
+            assert [len(c) for c in chunks] == [7, 7, 7, 2]
+        text_cols = ["category_id", "seller_managed_code"]
+        pd.testing.assert_frame_equal(
+            self._combined(chunks).drop(columns=text_cols),
+            self._expected(raw).drop(columns=text_cols),
+        )
+
+    @pytest.mark.parametrize("engine", ["openpyxl", "calamine"])
+    def test_excel_engine_matches_read_excel(
+        self, catalog: pd.DataFrame, tmp_path: Path, engine: str
+    ):
+        """각 엑셀 엔진의 결과는 같은 엔진의 pd.read_excel과 같다."""
+        if not reader._module_available("python_calamine" if engine == "calamine" else engine):
+            pytest.skip(f"{engine} 미설치")
+        path = tmp_path / "catalog.xlsx"
+        catalog.to_excel(path, index=False, engine="openpyxl")
+
+        raw = pd.read_excel(path, engine=engine)
+        chunks = list(iter_file_chunks(path, 7, excel_engine=engine))
+
+        pd.testing.assert_frame_equal(self._combined(chunks), self._expected(raw))
+
+    def test_csv_engines_agree_on_fields(self, catalog_csv: Path):
+        """pyarrow와 pandas 엔진은 등록에 쓰는 필드 값이 같고 긴 숫자 코드를 보존한다."""
+        pandas_df = read_file(catalog_csv, csv_engine="pandas")
+        arrow_df = read_file(catalog_csv, csv_engine="pyarrow")
+
+        pd.testing.assert_frame_equal(arrow_df.astype(object), pandas_df.astype(object))
+        assert arrow_df["seller_managed_code"].iloc[1] == "8801234567890123456701"
+        assert arrow_df["category_id"].iloc[0] == "50000000"
+
+    def test_missing_engine_falls_back(self, tmp_xlsx: Path, monkeypatch):
+        """설치되지 않은 엔진을 지정하면 호환 엔진으로 읽는다."""
+        monkeypatch.setattr(reader, "_module_available", lambda name: False)
+        df = read_file(tmp_xlsx, excel_engine="calamine")
+
+        assert len(df) == 2
+
+    def test_unknown_engine(self, tmp_xlsx: Path):
+        """지원하지 않는 엔진 이름은 오류."""
+        with pytest.raises(ValueError, match="엑셀 엔진"):
+            read_file(tmp_xlsx, excel_engine="xlrd")
@@ -0,0 +1,121 @@
+"""Redis 분산 레이트 리미터 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import fakeredis
+import pytest
+
+from richlychee.config import RateLimitSettings
+from richlychee.utils.rate_limiter import AdaptiveRateLimiter, create_rate_limiter
+from richlychee.utils.redis_rate_limiter import RedisTokenBucketRateLimiter
+
+
+@pytest.fixture
+def redis_client() -> fakeredis.FakeRedis:
+    return fakeredis.FakeRedis()
+
+
+class TestRedisTokenBucketRateLimiter:
+    """Redis 토큰 버킷 테스트."""
+
+    def test_bucket_shared_by_key(self, redis_client):
+        """같은 키의 리미터(다른 프로세스 가정)는 버스트를 공유."""
+        a = RedisTokenBucketRateLimiter(1, 2, redis_client=redis_client, key="client-a")
+        b = RedisTokenBucketRateLimiter(1, 2, redis_client=redis_client, key="client-a")
+
+        assert a.acquire(timeout=0)
+        assert b.acquire(timeout=0)
+        assert not a.acquire(timeout=0)
+        assert not b.acquire(timeout=0)
+
+    def test_buckets_isolated_by_key(self, redis_client):
+        """키가 다르면 별도 한도."""
+        a = RedisTokenBucketRateLimiter(1, 1, redis_client=redis_client, key="client-a")
+        b = RedisTokenBucketRateLimiter(1, 1, redis_client=redis_client, key="client-b")
+
+        assert a.acquire(timeout=0)
+        assert b.acquire(timeout=0)
+
+    def test_pause_is_global(self, redis_client):
+        """한 프로세스의 429 일시정지가 다른 프로세스에도 적용."""
+        a = RedisTokenBucketRateLimiter(100, 10, redis_client=redis_client, key="client-a")
+        b = RedisTokenBucketRateLimiter(100, 10, redis_client=redis_client, key="client-a")
+
+        a.on_throttle(0.2)
+
+        start = time.monotonic()
+        assert b.acquire(timeout=1)
+        assert time.monotonic() - start >= 0.1
+
+    def test_falls_back_on_redis_error(self):
+        """Redis 호출 실패 시 프로세스 내 버킷으로 동작."""
+        broken = fakeredis.FakeRedis()
+        limiter = RedisTokenBucketRateLimiter(1, 1, redis_client=broken, key="client-a")
+        broken.connected = False
+
+        assert limiter.acquire(timeout=0)
+        assert not limiter.acquire(timeout=0)
+
+    def test_skips_redis_while_cooling_down(self, redis_client, monkeypatch):
+        """장애 후 대기 시간 동안은 Redis를 호출하지 않고, 지나면 다시 시도해 복구."""
+        import richlychee.utils.redis_rate_limiter as module
+
+        monkeypatch.setattr(module, "_REDIS_RETRY_INTERVAL", 0.2)
+        limiter = RedisTokenBucketRateLimiter(100, 10, redis_client=redis_client, key="client-a")
+        calls = []
+        script = limiter._acquire_script
+
+        def flaky_script(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise ConnectionError("down")
+            return script(**kwargs)
+
+        limiter._acquire_script = flaky_script
+
+        for _ in range(5):
+            assert limiter.acquire(timeout=0)
+        assert len(calls) == 1
+
+        time.sleep(0.25)
+        assert limiter.acquire(timeout=0)
+        assert len(calls) == 2
+        assert not limiter._redis_failed
+
+    async def test_acquire_async_calls_redis_off_loop(self, redis_client):
+        """acquire_async는 Redis 호출을 이벤트 루프 밖 스레드에서 실행."""
+        limiter = RedisTokenBucketRateLimiter(100, 10, redis_client=redis_client, key="client-a")
+        threads = []
+        script = limiter._acquire_script
+
+        def recording_script(**kwargs):
+            threads.append(threading.get_ident())
+            return script(**kwargs)
+
+        limiter._acquire_script = recording_script
+
+        assert await limiter.acquire_async(timeout=0)
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestCreateRateLimiter:
+    """백엔드 선택 테스트."""
+
+    def test_unreachable_redis_uses_memory(self):
+        """Redis에 연결할 수 없으면 프로세스 내 리미터 사용."""
+        settings = RateLimitSettings(
+            backend="redis", redis_url="redis://127.0.0.1:1/0", adaptive=True
+        )
+        limiter = create_rate_limiter(settings, key="client-a")
+
+        assert type(limiter) is AdaptiveRateLimiter
+
+    def test_memory_backend_without_key(self):
+        """키가 없으면 Redis를 쓰지 않음."""
+        settings = RateLimitSettings(backend="redis")
+        limiter = create_rate_limiter(settings)
+
+        assert not isinstance(limiter, RedisTokenBucketRateLimiter)
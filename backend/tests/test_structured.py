@@ -0,0 +1,138 @@
+"""구조화 데이터 상품 추출 테스트."""
+
+from __future__ import annotations
+
+import json
+
+from richlychee.crawler.structured import extract_structured_products
+
+_BASE = "https://shop.example.com/list"
+
+
+def _ld(data) -> str:
+    return f'<script type="application/ld+json">{json.dumps(data, ensure_ascii=False)}</script>'
+
+
+class TestJsonLd:
+    """JSON-LD 추출 테스트."""
+
+    def test_product_page(self):
+        """상세 페이지 Product: offers 가격/통화, 이미지, URL이 없으면 페이지 URL."""
+        html = _ld({
+            "@context": "https://schema.org",
+            "@type": "Product",
+            "name": " 무선 이어폰 ",
+            "image": ["/img/1.jpg", {"@type": "ImageObject", "url": "https://cdn.example.com/2.jpg"}],
+            "offers": {"@type": "Offer", "price": "29.90", "priceCurrency": "usd"},
+        })
+
+        assert extract_structured_products(html, _BASE) == [{
+            "title": "무선 이어폰",
+            "price": 30,
+            "currency": "USD",
+            "images": ["https://shop.example.com/img/1.jpg", "https://cdn.example.com/2.jpg"],
+            "url": _BASE,
+        }]
+
+    def test_item_list_in_graph(self):
+        """@graph 안의 ItemList → ListItem.item Product 목록."""
+        html = _ld({"@graph": [
+            {"@type": "BreadcrumbList", "itemListElement": []},
+            {"@type": "ItemList", "itemListElement": [
+                {"@type": "ListItem", "position": 1, "item": {
+                    "@type": "Product", "name": "상품 1", "url": "/p/1",
+                    "offers": {"@type": "AggregateOffer", "lowPrice": 12000},
+                }},
+                {"@type": "ListItem", "position": 2, "item": {
+                    "@type": ["Product"], "name": "상품 2", "url": "https://shop.example.com/p/2",
+                    "offers": [{"@type": "Offer", "price": 5000}],
+                }},
+                # 가격/이름 없이 URL만 있는 항목은 상품으로 보지 않는다
+                {"@type": "ListItem", "position": 3, "url": "https://shop.example.com/p/3"},
+            ]},
+        ]})
+
+        products = extract_structured_products(html, _BASE)
+
+        assert [(p["title"], p["price"], p["url"]) for p in products] == [
+            ("상품 1", 12000, "https://shop.example.com/p/1"),
+            ("상품 2", 5000, "https://shop.example.com/p/2"),
+        ]
+
+    def test_invalid_json_ignored(self):
+        html = '<script type="application/ld+json">{"@type": "Product",</script>'
+
+        assert extract_structured_products(html, _BASE) == []
+
+
+class TestNextData:
+    """__NEXT_DATA__ 추출 테스트."""
+
+    def test_listing_state(self):
+        """제목/가격/이미지(또는 링크)가 있는 객체를 상품으로 보고 중복은 한 번만."""
+        items = [
+            {"id": 1, "productName": "상품 1", "salePrice": {"value": 15900, "currency": "KRW"},
+             "thumbnailUrl": "//img.example.com/1.jpg", "link": "/p/1"},
+            {"id": 2, "productName": "상품 2", "salePrice": {"value": 8000, "currency": "KRW"},
+             "thumbnailUrl": "//img.example.com/2.jpg", "link": "/p/2"},
+        ]
+        state = {"props": {"pageProps": {
+            "listing": {"items": items},
+            # 같은 상품이 캐시에도 들어 있음
+            "cache": {"p1": items[0]},
+            # 이미지/링크가 없는 객체는 상품이 아니다 (배송 옵션 등)
+            "shipping": [{"name": "택배", "price": 3000}],
+        }}}
+        html = f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(state)}</script>'
+
+        products = extract_structured_products(html, _BASE)
+
+        assert products == [
+            {"title": "상품 1", "price": 15900, "currency": "KRW",
+             "images": ["https://img.example.com/1.jpg"], "url": "https://shop.example.com/p/1"},
+            {"title": "상품 2", "price": 8000, "currency": "KRW",
+             "images": ["https://img.example.com/2.jpg"], "url": "https://shop.example.com/p/2"},
+        ]
+
+
+class TestOpenGraph:
+    """OpenGraph 추출 테스트."""
+
+    def test_product_meta(self):
+        html = """
+        <head>
+          <meta property="og:type" content="product">
+          <meta property="og:title" content="가죽 지갑">
+          <meta property="og:image" content="https://cdn.example.com/w.jpg">
+          <meta property="og:url" content="https://shop.example.com/p/7">
+          <meta property="product:price:amount" content="45000">
+          <meta property="product:price:currency" content="KRW">
+        </head>
+        """
+
+        assert extract_structured_products(html, _BASE) == [{
+            "title": "가죽 지갑",
+            "price": 45000,
+            "currency": "KRW",
+            "images": ["https://cdn.example.com/w.jpg"],
+            "url": "https://shop.example.com/p/7",
+        }]
+
+    def test_non_product_page_ignored(self):
+        """og:title은 어디에나 있으므로 상품 페이지가 아니면 무시."""
+        html = '<meta property="og:type" content="website"><meta property="og:title" content="홈">'
+
+        assert extract_structured_products(html, _BASE) == []
+
+    def test_json_ld_preferred(self):
+        html = (
+            '<meta property="og:type" content="product"><meta property="og:title" content="OG">'
+            + _ld({"@type": "Product", "name": "JSON-LD", "offers": {"price": 1000}})
+        )
+
+        assert [p["title"] for p in extract_structured_products(html, _BASE)] == ["JSON-LD"]
+
+
+def test_no_structured_data():
+    assert extract_structured_products("<ul><li>상품</li></ul>", _BASE) == []
+    assert extract_structured_products("", _BASE) == []
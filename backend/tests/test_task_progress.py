@@ -0,0 +1,72 @@
+"""작업 진행 상황 기록/취소 확인 테스트."""
+
+from __future__ import annotations
+
+from app.tasks.progress import CancelCheck, Checkpoint
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCheckpoint:
+    """결과 기록 시점 테스트."""
+
+    def test_every_n_rows(self):
+        """batch_size행마다 기록."""
+        checkpoint = Checkpoint(rows=3, interval=60, clock=_Clock())
+
+        assert [checkpoint.due() for _ in range(7)] == [
+            False, False, True, False, False, True, False,
+        ]
+
+    def test_interval_elapsed(self):
+        """행 수가 차지 않아도 interval초가 지나면 기록."""
+        clock = _Clock()
+        checkpoint = Checkpoint(rows=100, interval=2.0, clock=clock)
+
+        assert not checkpoint.due()
+        clock.now = 2.5
+        assert checkpoint.due()
+        assert not checkpoint.due()
+
+
+class TestCancelCheck:
+    """취소 확인 테스트."""
+
+    def test_fetches_once_per_interval(self):
+        """interval 안에서는 DB를 다시 조회하지 않는다."""
+        clock = _Clock()
+        calls = []
+
+        def fetch() -> bool:
+            calls.append(clock.now)
+            return clock.now >= 3
+
+        cancelled = CancelCheck(fetch, interval=2.0, clock=clock)
+
+        assert not cancelled()
+        clock.now = 1.0
+        assert not cancelled()
+        clock.now = 3.0
+        assert cancelled()
+        assert calls == [0.0, 3.0]
+
+    def test_cancellation_is_sticky(self):
+        """한 번 취소되면 다시 조회하지 않는다."""
+        clock = _Clock()
+        calls = []
+
+        def fetch() -> bool:
+            calls.append(clock.now)
+            return True
+
+        cancelled = CancelCheck(fetch, interval=0, clock=clock)
+
+        assert cancelled()
+        assert cancelled()
+        assert len(calls) == 1
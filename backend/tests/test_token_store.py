@@ -0,0 +1,135 @@
+"""토큰 공유 캐시 테스트."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import fakeredis
+
+from richlychee.auth.session import AuthSession
+from richlychee.auth.token import TokenInfo
+from richlychee.auth.token_store import TokenStore
+
+
+def _token(value: str, ttl: float = 3600) -> TokenInfo:
+    return TokenInfo(access_token=value, expires_at=time.time() + ttl)
+
+
+class TestTokenStore:
+    """TokenStore 테스트."""
+
+    def test_refresh_single_flight(self):
+        """동시 갱신 요청은 한 번만 발급."""
+        store = TokenStore()
+        calls = []
+
+        def fetch() -> TokenInfo:
+            calls.append(1)
+            time.sleep(0.05)
+            return _token("t1")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(store.refresh("cid", fetch)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert {r.access_token for r in results} == {"t1"}
+
+    def test_shared_across_processes_via_redis(self):
+        """Redis를 공유하는 다른 스토어(다른 워커 가정)는 재발급하지 않음."""
+        redis_client = fakeredis.FakeRedis()
+        a = TokenStore(redis_client)
+        b = TokenStore(redis_client)
+
+        a.refresh("cid", lambda: _token("t1"))
+        token = b.refresh("cid", lambda: _token("t2"))
+
+        assert token.access_token == "t1"
+
+    def test_release_keeps_lock_taken_over_by_other_worker(self):
+        """발급이 락 TTL보다 오래 걸려 다른 워커가 락을 잡았으면 그 락은 지우지 않음."""
+        redis_client = fakeredis.FakeRedis()
+        store = TokenStore(redis_client)
+        lock_key = "richlychee:token-lock:cid"
+        ttls = []
+
+        def fetch() -> TokenInfo:
+            ttls.append(redis_client.pttl(lock_key))
+            # 락이 만료되고 다른 워커가 새로 잡은 상황
+            redis_client.set(lock_key, "other-worker")
+            return _token("t1")
+
+        store.refresh("cid", fetch, lock_ttl=40)
+
+        assert 30_000 < ttls[0] <= 40_000
+        assert redis_client.get(lock_key) == b"other-worker"
+
+    def test_waiter_fetches_when_lock_released_without_token(self):
+        """락을 잡은 워커가 발급에 실패하고 락을 풀면 대기 중인 워커가 바로 발급."""
+        redis_client = fakeredis.FakeRedis()
+        store = TokenStore(redis_client)
+        redis_client.set("richlychee:token-lock:cid", "other-worker", px=60_000)
+        threading.Timer(0.2, redis_client.delete, ["richlychee:token-lock:cid"]).start()
+
+        start = time.monotonic()
+        token = store.refresh("cid", lambda: _token("t1"))
+
+        assert token.access_token == "t1"
+        assert time.monotonic() - start < 2
+
+    def test_delete_keeps_newer_token(self):
+        """이미 다른 곳에서 재발급된 토큰은 401 무효화로 지우지 않음."""
+        redis_client = fakeredis.FakeRedis()
+        store = TokenStore(redis_client)
+        store.set("cid", _token("new"))
+
+        store.delete("cid", _token("stale"))
+
+        assert store.get("cid").access_token == "new"
+        assert TokenStore(redis_client).get("cid").access_token == "new"
+
+    def test_refresh_within_margin(self):
+        """만료가 margin 안이면 새로 발급."""
+        store = TokenStore()
+        store.set("cid", _token("old", ttl=100))
+
+        token = store.refresh("cid", lambda: _token("new"), margin=300)
+
+        assert token.access_token == "new"
+
+
+class TestAuthSessionSharing:
+    """AuthSession 토큰 공유 테스트."""
+
+    def test_sessions_share_token(self, sample_settings):
+        """같은 client_id의 새 세션은 캐시된 토큰을 재사용."""
+        store = TokenStore()
+        store.set(sample_settings.naver_client_id, _token("cached"))
+
+        session = AuthSession(sample_settings, token_store=store)
+
+        assert session.token.access_token == "cached"
+        assert not session.needs_refresh
+
+    def test_proactive_refresh_in_background(self, sample_settings):
+        """만료 임박 시 현재 토큰을 반환하고 백그라운드에서 갱신."""
+        store = TokenStore()
+        expiring = TokenInfo(
+            access_token="old",
+            expires_at=time.time() + 100,
+            issued_at=time.time() - 3500,
+        )
+        store.set(sample_settings.naver_client_id, expiring)
+        session = AuthSession(sample_settings, token_store=store)
+        session._request_token = lambda: _token("new")
+
+        assert session.token.access_token == "old"
+        session._background_refresh.join(timeout=1)
+        assert session.token.access_token == "new"
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from richlychee.api.products import _payload_to_dict
 from richlychee.data.models import ProductRow
 from richlychee.data.transformer import (
     collect_local_images,
+    iter_row_records,
     product_row_to_payload,
+    record_to_product_body,
     row_to_product_row,
     transform_dataframe,
 )
@@ -136,6 +140,96 @@ class TestTransformDataframe:
         assert len(payloads) == 0
 
 
+class TestRecordToProductBody:
+    """검증된 행 → 요청 본문 빠른 변환 테스트."""
+
+    def test_matches_pydantic_path(self, sample_dataframe: pd.DataFrame):
+        """ProductRow → ProductPayload 경로와 같은 요청 본문."""
+        url_map = {"https://example.com/img2.jpg": "https://cdn.example.com/2.jpg"}
+        records = list(iter_row_records(sample_dataframe))
+
+        assert len(records) == len(sample_dataframe)
+        for (_, record), (_, series) in zip(records, sample_dataframe.iterrows()):
+            expected = _payload_to_dict(
+                product_row_to_payload(row_to_product_row(series), url_map)
+            )
+            assert record_to_product_body(record, url_map) == expected
+
+    def test_records_skip_missing_values(self):
+        """결측값은 기본값으로 처리."""
+        df = pd.DataFrame([{
+            "product_name": "테스트",
+            "category_id": "50000000",
+            "sale_price": 10000,
+            "stock_quantity": np.nan,
+            "free_condition_amount": None,
+        }])
+        _, record = next(iter_row_records(df))
+
+        assert "stock_quantity" not in record
+        assert "free_condition_amount" not in record
+        body = record_to_product_body(record)
+        assert body["originProduct"]["stockQuantity"] == 0
+
+    def test_numeric_coercion(self):
+        """numpy 정수와 정수값 float는 int로 변환."""
+        body = record_to_product_body({
+            "product_name": "테스트",
+            "category_id": "50000000",
+            "sale_price": np.int64(15000),
+            "stock_quantity": 3.0,
+        })
+
+        assert body["originProduct"]["salePrice"] == 15000
+        assert type(body["originProduct"]["salePrice"]) is int
+        assert type(body["originProduct"]["stockQuantity"]) is int
+
+    @pytest.mark.parametrize("value, expected", [("12", 12), (" 12.0 ", 12), ("+3.00", 3)])
+    def test_integer_strings_match_pydantic(self, value: str, expected: int):
+        """정수값인 숫자 문자열은 pydantic lax int처럼 허용."""
+        record = {"product_name": "테스트", "category_id": "50000000", "sale_price": 10000}
+        record["stock_quantity"] = value
+
+        body = record_to_product_body(record)
+
+        assert body["originProduct"]["stockQuantity"] == expected
+        assert ProductRow(**record).stock_quantity == expected
+
+    def test_duplicate_option_names_match_pydantic_path(self):
+        """옵션1/옵션2 이름이 같아도 pydantic 경로와 같은 본문."""
+        record = {
+            "product_name": "테스트",
+            "category_id": "50000000",
+            "sale_price": 10000,
+            "option1_name": "색상",
+            "option1_value": "빨강,파랑",
+            "option2_name": "색상",
+            "option2_value": "S,M",
+        }
+
+        expected = _payload_to_dict(product_row_to_payload(ProductRow(**record)))
+
+        assert record_to_product_body(record) == expected
+
+    @pytest.mark.parametrize("override", [
+        {"sale_price": 0},
+        {"sale_price": 12.5},
+        {"sale_price": "12.5"},
+        {"stock_quantity": -1},
+        {"product_name": "가" * 101},
+        {"seller_managed_code": 123},
+        {"delivery_fee_type": "CONDITIONAL_FREE"},
+        {"delivery_fee_type": "UNKNOWN"},
+    ])
+    def test_invalid_rows_raise(self, override: dict):
+        """pydantic 모델이 거부하는 행은 ValueError."""
+        record = {"product_name": "테스트", "category_id": "50000000", "sale_price": 10000}
+        record.update(override)
+
+        with pytest.raises(ValueError):
+            record_to_product_body(record)
+
+
 class TestCollectLocalImages:
     """로컬 이미지 수집 테스트."""
 
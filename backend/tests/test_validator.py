@@ -5,7 +5,7 @@ from __future__ import annotations
 import pandas as pd
 import pytest
 
-from richlychee.data.validator import validate_dataframe
+from richlychee.data.validator import validate_chunks, validate_dataframe
 
 
 class TestValidateDataframe:
@@ -147,3 +147,62 @@ class TestValidateDataframe:
         }])
         result = validate_dataframe(df)
         assert not result.is_valid
+
+    def test_errors_ordered_by_row_then_check(self):
+        """여러 행의 오류가 행 번호 → 검사 순서로 정렬."""
+        df = pd.DataFrame([
+            {"product_name": "정상", "category_id": "50000000", "sale_price": 10000},
+            {"product_name": "", "category_id": "50000000", "sale_price": -1,
+             "delivery_fee_type": "UNKNOWN"},
+            {"product_name": "테스트", "category_id": "", "sale_price": 10000,
+             "stock_quantity": -5},
+        ])
+        result = validate_dataframe(df)
+
+        assert [(e.row, e.field) for e in result.errors] == [
+            (3, "product_name"),
+            (3, "sale_price"),
+            (3, "delivery_fee_type"),
+            (4, "category_id"),
+            (4, "stock_quantity"),
+        ]
+
+    def test_parallel_chunks_match_single_process(self, monkeypatch):
+        """행을 나눠 병렬 검증해도 결과가 같다."""
+        import richlychee.data.validator as validator
+
+        monkeypatch.setattr(validator, "_MIN_ROWS_PER_WORKER", 2)
+        rows = []
+        for i in range(10):
+            rows.append({
+                "product_name": "" if i % 3 == 0 else f"상품{i}",
+                "category_id": "50000000",
+                "sale_price": 0 if i % 4 == 0 else 10000,
+                "representative_image": f"missing/{i % 2}.jpg",
+            })
+        df = pd.DataFrame(rows)
+
+        single = validate_dataframe(df)
+        parallel = validate_dataframe(df, workers=3)
+
+        assert [str(e) for e in parallel.errors] == [str(e) for e in single.errors]
+        assert [str(w) for w in parallel.warnings] == [str(w) for w in single.warnings]
+
+    def test_validate_chunks_reports_file_row_numbers(self):
+        """청크 인덱스 기준으로 파일 전체의 행 번호를 보고."""
+        first = pd.DataFrame(
+            [{"product_name": "정상", "category_id": "50000000", "sale_price": 10000}] * 2
+        )
+        second = pd.DataFrame(
+            [{"product_name": "테스트", "category_id": "50000000", "sale_price": 0}],
+            index=[2],
+        )
+        result = validate_chunks([first, second])
+
+        assert [(e.row, e.field) for e in result.errors] == [(4, "sale_price")]
+
+    def test_validate_chunks_empty(self):
+        """청크가 모두 비어있으면 오류 1건."""
+        result = validate_chunks([pd.DataFrame()])
+
+        assert result.total_errors == 1